@@ -72,6 +72,7 @@ from ._core import (
     get_global_context_summary,
     is_global_context_initialized,
     register_global_component,
+    register_global_components,
     reset_global_context,
     resolve_global_component,
     resolve_global_component_async,
@@ -131,6 +132,9 @@ from ._testing import (
     reset_global_state,
 )
 
+# Logging
+from ._utils import configure_logging, refresh_log_levels
+
 # Version information
 __version__ = "0.1.8"
 __author__ = "Abhishek Pathak"
@@ -153,6 +157,7 @@ __all__ = [
     "ImportDeclaration",
     "get_global_context",
     "register_global_component",
+    "register_global_components",
     "resolve_global_component",
     "resolve_global_component_async",
     "reset_global_context",
@@ -210,4 +215,7 @@ __all__ = [
     "TestEventCollector",
     "create_test_context",
     "reset_global_state",
+    # Logging
+    "configure_logging",
+    "refresh_log_levels",
 ]
@@ -1,12 +1,13 @@
 from ._base import BaseComponent as BaseComponent, ComponentLayer as ComponentLayer, ComponentMetadata as ComponentMetadata, ComponentScope as ComponentScope, LifecycleStage as LifecycleStage, RegistrationStrategy as RegistrationStrategy
-from ._core import CircularDependencyError as CircularDependencyError, ComponentRegistrationError as ComponentRegistrationError, ComponentResolutionError as ComponentResolutionError, ConfigurationError as ConfigurationError, Container as Container, ContainerError as ContainerError, Context as Context, ContextError as ContextError, DIError as DIError, GlobalContext as GlobalContext, ImportDeclaration as ImportDeclaration, ImportError as ImportError, LifecycleError as LifecycleError, ModuleError as ModuleError, ProviderError as ProviderError, ScopeError as ScopeError, ValidationError as ValidationError, get_global_context as get_global_context, get_global_context_summary as get_global_context_summary, is_global_context_initialized as is_global_context_initialized, register_global_component as register_global_component, reset_global_context as reset_global_context, resolve_global_component as resolve_global_component, resolve_global_component_async as resolve_global_component_async
+from ._core import CircularDependencyError as CircularDependencyError, ComponentRegistrationError as ComponentRegistrationError, ComponentResolutionError as ComponentResolutionError, ConfigurationError as ConfigurationError, Container as Container, ContainerError as ContainerError, Context as Context, ContextError as ContextError, DIError as DIError, GlobalContext as GlobalContext, ImportDeclaration as ImportDeclaration, ImportError as ImportError, LifecycleError as LifecycleError, ModuleError as ModuleError, ProviderError as ProviderError, ScopeError as ScopeError, ValidationError as ValidationError, get_global_context as get_global_context, get_global_context_summary as get_global_context_summary, is_global_context_initialized as is_global_context_initialized, register_global_component as register_global_component, register_global_components as register_global_components, reset_global_context as reset_global_context, resolve_global_component as resolve_global_component, resolve_global_component_async as resolve_global_component_async
 from ._decorators import ComponentOptions as ComponentOptions, ContextOptions as ContextOptions, get_all_context_modules as get_all_context_modules, get_component_metadata as get_component_metadata, get_component_options as get_component_options, get_enhanced_tags as get_enhanced_tags, get_module_metadata as get_module_metadata, get_module_options as get_module_options, is_context_module as is_context_module, is_og_component as is_og_component, og_component as og_component, og_context as og_context, register_component_manually as register_component_manually, validate_all_module_dependencies as validate_all_module_dependencies
 from ._hooks import EventHook as EventHook, HookFunction as HookFunction, LifecycleHook as LifecycleHook, LifecycleHookFunction as LifecycleHookFunction, clear_all_hooks as clear_all_hooks, emit_event as emit_event, emit_lifecycle_event as emit_lifecycle_event, get_hooks_summary as get_hooks_summary, register_hook as register_hook, register_lifecycle_hook as register_lifecycle_hook, set_hooks_enabled as set_hooks_enabled
 from ._modules import ContextModuleBuilder as ContextModuleBuilder, ModuleContextImport as ModuleContextImport, ProviderConfig as ProviderConfig
 from ._registry import ModuleMetadata as ModuleMetadata, get_global_registry as get_global_registry
 from ._testing import MockComponent as MockComponent, TestEventCollector as TestEventCollector, create_test_context as create_test_context, reset_global_state as reset_global_state
+from ._utils import configure_logging as configure_logging, refresh_log_levels as refresh_log_levels
 
-__all__ = ['__version__', '__author__', 'BaseComponent', 'ComponentScope', 'ComponentLayer', 'ComponentMetadata', 'LifecycleStage', 'RegistrationStrategy', 'Context', 'Container', 'GlobalContext', 'ImportDeclaration', 'get_global_context', 'register_global_component', 'resolve_global_component', 'resolve_global_component_async', 'reset_global_context', 'get_global_context_summary', 'is_global_context_initialized', 'DIError', 'ContainerError', 'ContextError', 'ComponentRegistrationError', 'ComponentResolutionError', 'CircularDependencyError', 'ScopeError', 'ProviderError', 'ImportError', 'ModuleError', 'LifecycleError', 'ValidationError', 'ConfigurationError', 'og_component', 'og_context', 'ComponentOptions', 'ContextOptions', 'get_component_options', 'get_component_metadata', 'get_enhanced_tags', 'is_og_component', 'register_component_manually', 'get_module_metadata', 'get_module_options', 'is_context_module', 'get_all_context_modules', 'validate_all_module_dependencies', 'ContextModuleBuilder', 'ModuleContextImport', 'ProviderConfig', 'ModuleMetadata', 'get_global_registry', 'EventHook', 'LifecycleHook', 'HookFunction', 'LifecycleHookFunction', 'register_hook', 'register_lifecycle_hook', 'emit_event', 'emit_lifecycle_event', 'clear_all_hooks', 'set_hooks_enabled', 'get_hooks_summary', 'MockComponent', 'TestEventCollector', 'create_test_context', 'reset_global_state']
+__all__ = ['__version__', '__author__', 'BaseComponent', 'ComponentScope', 'ComponentLayer', 'ComponentMetadata', 'LifecycleStage', 'RegistrationStrategy', 'Context', 'Container', 'GlobalContext', 'ImportDeclaration', 'get_global_context', 'register_global_component', 'register_global_components', 'resolve_global_component', 'resolve_global_component_async', 'reset_global_context', 'get_global_context_summary', 'is_global_context_initialized', 'DIError', 'ContainerError', 'ContextError', 'ComponentRegistrationError', 'ComponentResolutionError', 'CircularDependencyError', 'ScopeError', 'ProviderError', 'ImportError', 'ModuleError', 'LifecycleError', 'ValidationError', 'ConfigurationError', 'og_component', 'og_context', 'ComponentOptions', 'ContextOptions', 'get_component_options', 'get_component_metadata', 'get_enhanced_tags', 'is_og_component', 'register_component_manually', 'get_module_metadata', 'get_module_options', 'is_context_module', 'get_all_context_modules', 'validate_all_module_dependencies', 'ContextModuleBuilder', 'ModuleContextImport', 'ProviderConfig', 'ModuleMetadata', 'get_global_registry', 'EventHook', 'LifecycleHook', 'HookFunction', 'LifecycleHookFunction', 'register_hook', 'register_lifecycle_hook', 'emit_event', 'emit_lifecycle_event', 'clear_all_hooks', 'set_hooks_enabled', 'get_hooks_summary', 'MockComponent', 'TestEventCollector', 'create_test_context', 'reset_global_state', 'configure_logging', 'refresh_log_levels']
 
 __version__: str
 __author__: str
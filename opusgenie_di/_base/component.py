@@ -2,6 +2,8 @@
 
 from abc import ABC
 from datetime import UTC, datetime
+import itertools
+import os
 from typing import Any
 import uuid
 
@@ -10,6 +12,27 @@ from pydantic import BaseModel, ConfigDict, Field
 from .enums import ComponentLayer, LifecycleStage
 from .metadata import ComponentMetadata
 
+# Component ids only need to be unique, so instead of drawing fresh randomness
+# per instance they combine a counter with a random per-process suffix
+_id_suffix = str(uuid.uuid4())[8:]
+_id_counter = itertools.count()
+
+
+def _new_component_id() -> str:
+    """Create a unique, UUID-shaped id for a component instance."""
+    return f"{next(_id_counter):08x}{_id_suffix}"
+
+
+def _reset_component_ids() -> None:
+    """Give a forked child process its own id suffix."""
+    global _id_suffix, _id_counter
+    _id_suffix = str(uuid.uuid4())[8:]
+    _id_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_component_ids)
+
 
 class BaseComponent(BaseModel, ABC):
     """
@@ -31,8 +54,11 @@ class BaseComponent(BaseModel, ABC):
     # ==========================================
     # Core Identity & Metadata
     # ==========================================
+    # Defaults of the base fields are already well-typed, so they opt out of
+    # validate_default; subclass fields still get their defaults validated
     component_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=_new_component_id,
+        validate_default=False,
         description="Unique identifier for this component instance",
     )
 
@@ -54,6 +80,7 @@ class BaseComponent(BaseModel, ABC):
     # ==========================================
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
+        validate_default=False,
         description="UTC timestamp when this component was created",
     )
 
@@ -65,11 +92,14 @@ class BaseComponent(BaseModel, ABC):
     # Configuration & Tags
     # ==========================================
     config: dict[str, Any] = Field(
-        default_factory=dict, description="Component-specific configuration parameters"
+        default_factory=dict,
+        validate_default=False,
+        description="Component-specific configuration parameters",
     )
 
     tags: dict[str, str] = Field(
         default_factory=dict,
+        validate_default=False,
         description="Flexible tagging system for component categorization",
     )
 
@@ -77,7 +107,9 @@ class BaseComponent(BaseModel, ABC):
     # Lifecycle Management
     # ==========================================
     lifecycle_stage: LifecycleStage = Field(
-        default=LifecycleStage.CREATED, description="Current lifecycle stage"
+        default=LifecycleStage.CREATED,
+        validate_default=False,
+        description="Current lifecycle stage",
     )
 
     def __init__(self, **data: Any) -> None:
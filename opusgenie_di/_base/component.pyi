@@ -6,6 +6,14 @@ from datetime import datetime
 from pydantic import BaseModel
 from typing import Any
 
+_id_suffix: str
+_id_counter: Incomplete
+
+def _new_component_id() -> str:
+    """Create a unique, UUID-shaped id for a component instance."""
+def _reset_component_ids() -> None:
+    """Give a forked child process its own id suffix."""
+
 class BaseComponent(BaseModel, ABC):
     """
     Base class for all components in the dependency injection system.
@@ -16,6 +16,11 @@ class ComponentScope(Enum):
     FACTORY = "factory"  # Created by factory function
     CONDITIONAL = "conditional"  # Created based on runtime condition
 
+    # Members are singletons compared by identity, so the C-level identity hash
+    # is consistent with equality; Enum's default hashes the name in Python,
+    # which every scope-keyed dispatch table would pay for on each lookup
+    __hash__ = object.__hash__
+
 
 class ComponentLayer(Enum):
     """
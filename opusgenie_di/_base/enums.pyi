@@ -11,6 +11,7 @@ class ComponentScope(Enum):
     SCOPED = 'scoped'
     FACTORY = 'factory'
     CONDITIONAL = 'conditional'
+    __hash__ = object.__hash__
 
 class ComponentLayer(Enum):
     """
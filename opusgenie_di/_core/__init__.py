@@ -31,6 +31,7 @@ from .global_context import (
     get_global_context_summary,
     is_global_context_initialized,
     register_global_component,
+    register_global_components,
     reset_global_context,
     resolve_global_component,
     resolve_global_component_async,
@@ -62,6 +63,7 @@ __all__ = [
     "GlobalContext",
     "get_global_context",
     "register_global_component",
+    "register_global_components",
     "resolve_global_component",
     "resolve_global_component_async",
     "reset_global_context",
@@ -4,9 +4,9 @@ from .context_impl import Context as Context, ImportDeclaration as ImportDeclara
 from .context_interface import ContextInterface as ContextInterface
 from .event_loop_manager import EventLoopManager as EventLoopManager, get_event_loop_manager as get_event_loop_manager, run_async_safely as run_async_safely, schedule_async_cleanup as schedule_async_cleanup
 from .exceptions import CircularDependencyError as CircularDependencyError, ComponentRegistrationError as ComponentRegistrationError, ComponentResolutionError as ComponentResolutionError, ConfigurationError as ConfigurationError, ContainerError as ContainerError, ContextError as ContextError, DIError as DIError, ImportError as ImportError, LifecycleError as LifecycleError, ModuleError as ModuleError, ProviderError as ProviderError, ScopeError as ScopeError, ValidationError as ValidationError
-from .global_context import GlobalContext as GlobalContext, get_global_context as get_global_context, get_global_context_summary as get_global_context_summary, is_global_context_initialized as is_global_context_initialized, register_global_component as register_global_component, reset_global_context as reset_global_context, resolve_global_component as resolve_global_component, resolve_global_component_async as resolve_global_component_async
+from .global_context import GlobalContext as GlobalContext, get_global_context as get_global_context, get_global_context_summary as get_global_context_summary, is_global_context_initialized as is_global_context_initialized, register_global_component as register_global_component, register_global_components as register_global_components, reset_global_context as reset_global_context, resolve_global_component as resolve_global_component, resolve_global_component_async as resolve_global_component_async
 from .provider_interface import ComponentProvider as ComponentProvider, ProviderInterface as ProviderInterface
 from .scope_impl import ScopeManager as ScopeManager
 from .scope_interface import ScopeManagerInterface as ScopeManagerInterface
 
-__all__ = ['ContainerInterface', 'ContextInterface', 'ScopeManagerInterface', 'ProviderInterface', 'Container', 'Context', 'ScopeManager', 'ComponentProvider', 'EventLoopManager', 'get_event_loop_manager', 'run_async_safely', 'schedule_async_cleanup', 'ImportDeclaration', 'ImportManager', 'GlobalContext', 'get_global_context', 'register_global_component', 'resolve_global_component', 'resolve_global_component_async', 'reset_global_context', 'get_global_context_summary', 'is_global_context_initialized', 'DIError', 'ContainerError', 'ContextError', 'ComponentRegistrationError', 'ComponentResolutionError', 'CircularDependencyError', 'ScopeError', 'ProviderError', 'ImportError', 'ModuleError', 'LifecycleError', 'ValidationError', 'ConfigurationError']
+__all__ = ['ContainerInterface', 'ContextInterface', 'ScopeManagerInterface', 'ProviderInterface', 'Container', 'Context', 'ScopeManager', 'ComponentProvider', 'EventLoopManager', 'get_event_loop_manager', 'run_async_safely', 'schedule_async_cleanup', 'ImportDeclaration', 'ImportManager', 'GlobalContext', 'get_global_context', 'register_global_component', 'register_global_components', 'resolve_global_component', 'resolve_global_component_async', 'reset_global_context', 'get_global_context_summary', 'is_global_context_initialized', 'DIError', 'ContainerError', 'ContextError', 'ComponentRegistrationError', 'ComponentResolutionError', 'CircularDependencyError', 'ScopeError', 'ProviderError', 'ImportError', 'ModuleError', 'LifecycleError', 'ValidationError', 'ConfigurationError']
@@ -1,17 +1,23 @@
 """Container implementation wrapping dependency-injector."""
 
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
+import sys
 import threading
-from threading import RLock
 import time
-from typing import Any, TypeVar, cast
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar, cast
+from weakref import WeakKeyDictionary
 
 from dependency_injector import containers, providers
 
 from .._base import ComponentMetadata, ComponentScope
 from .._base.protocols import ComponentMetadataProtocol
 from .._utils import (
+    cache_debug_enabled,
     get_constructor_dependencies,
     get_logger,
+    is_debug_enabled,
     log_component_registration,
     log_component_resolution,
     log_error,
@@ -23,6 +29,7 @@ from .exceptions import (
     ComponentRegistrationError,
     ComponentResolutionError,
 )
+from .rw_lock import ReaderWriterLock
 from .scope_impl import ScopeManager
 
 T = TypeVar("T")
@@ -31,36 +38,114 @@ TImplementation = TypeVar("TImplementation")
 
 logger = get_logger(__name__)
 
+# Shared input for untagged components; pydantic copies it into a fresh dict
+_EMPTY_TAGS: Mapping[str, Any] = MappingProxyType({})
+
+# Primitive types and standard library modules that are never auto-injected
+_NON_INJECTABLE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+_NON_INJECTABLE_MODULES = frozenset(
+    {"builtins", "typing", "collections", "datetime", "pathlib"}
+)
+
+
+def _is_injectable_type(dependency_type: type) -> bool:
+    """Check whether a type could be an auto-injected DI component at all."""
+    if dependency_type in _NON_INJECTABLE_TYPES:
+        return False
+    module_name = getattr(dependency_type, "__module__", "")
+    return module_name not in _NON_INJECTABLE_MODULES
+
+
+def _copy_tags(tags: dict[str, Any] | None) -> dict[str, str] | None:
+    """
+    Check component tags against ComponentMetadata and take a private copy.
+
+    Metadata is built lazily, so tags are checked here to fail at
+    registration time, and copied so later changes by the caller do not
+    leak into the registration.
+
+    Args:
+        tags: Component tags passed to a registration method
+
+    Returns:
+        A copy of the tags, or None if no tags were given
+
+    Raises:
+        TypeError: If tags is not a dictionary of strings to strings
+    """
+    if tags is None:
+        return None
+    if not isinstance(tags, dict):
+        raise TypeError(f"Tags must be a dictionary, got {type(tags).__name__}")
+    for key, value in tags.items():
+        if not isinstance(key, str) or not isinstance(value, str):
+            raise TypeError(f"Tags must map strings to strings, got {key!r}: {value!r}")
+    return dict(tags)
+
+
 # Thread-local storage for tracking resolution chains to detect circular dependencies
 _resolution_chain = threading.local()
 
+# Whether instances of a class carry a component_id, probed once per class
+_has_component_id: WeakKeyDictionary[type, bool] = WeakKeyDictionary()
 
-def _get_resolution_chain() -> list[str]:
-    """Get the current resolution chain for this thread."""
-    if not hasattr(_resolution_chain, "chain"):
-        _resolution_chain.chain = []
-    return _resolution_chain.chain  # type: ignore[no-any-return]
 
+def _get_component_id(instance: Any) -> Any:
+    """Get an instance's component_id for logging, or None if it has none."""
+    cls = type(instance)
+    has_id = _has_component_id.get(cls)
+    if has_id is None:
+        has_id = hasattr(instance, "component_id")
+        with suppress(TypeError):
+            _has_component_id[cls] = has_id
+    # getattr keeps this safe for classes whose instances differ
+    return getattr(instance, "component_id", None) if has_id else None
 
-def _push_resolution(component_name: str) -> None:
-    """Add a component to the resolution chain."""
-    chain = _get_resolution_chain()
-    chain.append(component_name)
 
+class _ResolutionChain:
+    """
+    Provider names being resolved on one thread.
 
-def _pop_resolution() -> None:
-    """Remove the last component from the resolution chain."""
-    chain = _get_resolution_chain()
-    if chain:
-        chain.pop()
+    Only the active chain is tracked: names are pushed when a resolution
+    starts and popped when it ends. The set makes the circular dependency
+    check a hash probe however deep the chain is, while the list keeps the
+    order for error messages.
+    """
+
+    __slots__ = ("active", "names")
+
+    def __init__(self) -> None:
+        """Initialize an empty chain."""
+        self.names: list[str] = []
+        self.active: set[str] = set()
+
+    def push(self, component_name: str) -> None:
+        """Record that a component is being resolved."""
+        self.names.append(component_name)
+        self.active.add(component_name)
 
+    def pop(self) -> None:
+        """Record that the most recent resolution has finished."""
+        self.active.discard(self.names.pop())
 
-def _check_circular_dependency(component_name: str, context_name: str) -> None:
+
+def _get_resolution_chain() -> _ResolutionChain:
+    """Get the current resolution chain for this thread, creating it on first use."""
+    chain: _ResolutionChain | None = getattr(_resolution_chain, "chain", None)
+    if chain is None:
+        chain = _resolution_chain.chain = _ResolutionChain()
+    return chain
+
+
+def _check_circular_dependency(
+    component_name: str, context_name: str, chain: _ResolutionChain | None = None
+) -> None:
     """Check if adding this component would create a circular dependency."""
-    chain = _get_resolution_chain()
-    if component_name in chain:
+    if chain is None:
+        chain = _get_resolution_chain()
+    if component_name in chain.active:
         # Found circular dependency
-        circular_chain = chain + [component_name]
+        circular_chain = chain.names + [component_name]
         raise CircularDependencyError(
             f"Circular dependency detected for component '{component_name}'",
             dependency_chain=circular_chain,
@@ -68,6 +153,17 @@ def _check_circular_dependency(component_name: str, context_name: str) -> None:
         )
 
 
+class _MetadataSpec(NamedTuple):
+    """Registration details from which ComponentMetadata is built on demand."""
+
+    component_class: type
+    scope: ComponentScope
+    # Validated private copy of the registration's tags
+    tags: dict[str, str] | None
+    # None means the constructor has not been analyzed yet
+    dependencies: list[str] | None
+
+
 class Container(ContainerInterface[T]):
     """
     Container implementation wrapping dependency-injector containers.
@@ -77,26 +173,74 @@ class Container(ContainerInterface[T]):
     multi-context support.
     """
 
-    def __init__(self, name: str = "default", context_ref: Any = None) -> None:
+    # dependency-injector provider type used for each supported scope
+    _PROVIDER_FOR_SCOPE: dict[
+        ComponentScope, Callable[[Any], providers.Provider[Any]]
+    ] = {
+        # Resolution is lock-free, so singletons must guard their own first
+        # construction. ThreadSafeSingleton's lock is shared by every singleton
+        # in the process and held for the whole construction, so nothing that
+        # runs inside a build may wait on a context lock held by a resolver
+        ComponentScope.SINGLETON: providers.ThreadSafeSingleton,
+        ComponentScope.TRANSIENT: providers.Factory,
+        ComponentScope.SCOPED: providers.Resource,
+        ComponentScope.FACTORY: providers.Factory,
+    }
+
+    def __init__(
+        self, name: str = "default", context_ref: Any = None, *, validate: bool = True
+    ) -> None:
         """
         Initialize the container.
 
         Args:
             name: Name of the container for identification
             context_ref: Optional reference to the parent context for cross-context resolution
+            validate: Whether to validate registrations; disable for bulk
+                registration of components that are already known to be valid
         """
         self._name = name
         self._context_ref = context_ref  # Weak reference to avoid circular dependencies
-        self._lock = RLock()
+        self._validate = validate
+        # Resolves vastly outnumber registrations, so reads share the lock
+        self._lock = ReaderWriterLock()
         self._scope_manager = ScopeManager()
 
         # Create underlying dependency-injector container
         self._container = containers.DynamicContainer()
 
-        # Track metadata for registered components
+        # Flat provider map consulted directly instead of going through
+        # DynamicContainer.providers; the container is kept for wiring
+        self._providers: dict[str, providers.Provider[Any]] = {}
+
+        # Read-only copies of the provider map and registered types for
+        # lock-free reads; they are rebuilt and swapped in as a whole under
+        # the write lock, so readers only ever see a complete view
+        self._providers_snapshot: dict[str, providers.Provider[Any]] = {}
+        self._registered_types_view: tuple[type, ...] = ()
+        # Unnamed registrations keyed by interface type, so the common
+        # resolve(interface) call hits an identity-hashed dict first
+        self._providers_by_type: dict[type, providers.Provider[Any]] = {}
+        # Injection plan builders of auto-wiring factories, by provider name
+        self._injection_plans: dict[
+            str, Callable[[], tuple[tuple[str, type, bool, bool], ...]]
+        ] = {}
+
+        # Track metadata for registered components. Only the registration
+        # details are stored up front; ComponentMetadata is built on first query
+        self._metadata_specs: dict[str, _MetadataSpec] = {}
         self._component_metadata: dict[str, ComponentMetadata] = {}
         self._registered_types: dict[str, type] = {}  # Track actual type objects
         self._registration_count = 0
+        # Set by registrations so clear() can skip an already empty container
+        self._dirty = False
+        # Bumped on every publish so callers can cache views of the registrations
+        self._version = 0
+
+        # Resolution timing/logging is skipped entirely unless debug is on;
+        # the flag is refreshed when logging is reconfigured
+        self._resolution_log_enabled: bool
+        cache_debug_enabled(self, "_resolution_log_enabled", logger)
 
         logger.debug("Created container", container_name=name)
 
@@ -126,100 +270,132 @@ class Container(ContainerInterface[T]):
             tags: Optional component tags
             factory: Optional factory function for creating instances
         """
-        try:
-            with self._lock:
-                impl_class = implementation or interface
-                provider_name = name or interface.__name__
+        with self._lock.write:
+            self._register(
+                interface,
+                implementation,
+                scope=scope,
+                name=name,
+                tags=tags,
+                factory=factory,
+            )
+            self._publish_providers()
 
-                # Validate registration
-                validate_component_registration(interface, impl_class, provider_name)
+    def register_many(
+        self,
+        interfaces: Iterable[type],
+        *,
+        scope: ComponentScope = ComponentScope.SINGLETON,
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Register several components under their default names in one call.
 
-                # Create a factory function for auto-wiring if needed
-                if not factory:
-                    dependencies = get_constructor_dependencies(impl_class)
-                    if dependencies and self._context_ref:
-                        # Create a factory function that resolves dependencies
-                        factory = self._create_auto_wiring_factory(
-                            impl_class, dependencies
-                        )
+        The write lock is taken once and the provider views are published once
+        for the whole batch, instead of once per component. If a registration
+        fails, the components registered before it are kept.
 
-                # Create appropriate dependency-injector provider based on scope
-                provider: (
-                    providers.Singleton[Any]
-                    | providers.Factory[Any]
-                    | providers.Resource[Any]
-                )
+        Args:
+            interfaces: Interface types to register as their own implementation
+            scope: Component lifecycle scope shared by the batch
+            tags: Optional component tags shared by the batch
+        """
+        with self._lock.write:
+            try:
+                for interface in interfaces:
+                    self._register(interface, scope=scope, tags=tags)
+            finally:
+                self._publish_providers()
 
-                if scope == ComponentScope.SINGLETON:
-                    if factory:
-                        provider = providers.Singleton(factory)
-                    else:
-                        provider = providers.Singleton(impl_class)
-                elif scope == ComponentScope.TRANSIENT:
-                    if factory:
-                        provider = providers.Factory(factory)
-                    else:
-                        provider = providers.Factory(impl_class)
-                elif scope == ComponentScope.SCOPED:
-                    if factory:
-                        provider = providers.Resource(factory)
-                    else:
-                        provider = providers.Resource(impl_class)
-                elif scope == ComponentScope.FACTORY:
-                    if not factory:
-                        factory = impl_class
-                    provider = providers.Factory(factory)
-                else:
-                    raise ComponentRegistrationError(
-                        f"Unsupported scope: {scope}",
-                        component_type=impl_class.__name__,
-                        interface_type=interface.__name__,
-                        details=f"Scope {scope.value} is not supported",
-                    )
+    def _register(
+        self,
+        interface: type[TInterface],
+        implementation: type[TImplementation] | None = None,
+        *,
+        scope: ComponentScope,
+        name: str | None = None,
+        tags: dict[str, Any] | None = None,
+        factory: Any = None,
+    ) -> None:
+        """
+        Register a component without publishing the provider views.
 
-                # Register in dependency-injector container
-                self._container.set_provider(provider_name, provider)
+        Must be called under the write lock; the caller publishes afterwards.
+        """
+        # Bind type names once; they are reused for keys, metadata and logs
+        impl_class = implementation or interface
+        interface_name = interface.__name__
+        impl_name = impl_class.__name__
+        # Interned keys make provider-map lookups pointer comparisons
+        provider_name = sys.intern(name or interface_name)
 
-                # Create and store metadata
-                dependencies = get_constructor_dependencies(impl_class)
-                metadata = ComponentMetadata(
-                    component_type=impl_class.__name__,
-                    component_name=provider_name,
-                    scope=scope,
-                    tags=tags or {},
-                    dependencies=list(dependencies.keys()),
-                    context_name=self._name,
-                    provider_name=provider_name,
+        try:
+            # Pick the dependency-injector provider type for the scope up front
+            provider_cls = self._PROVIDER_FOR_SCOPE.get(scope)
+            if provider_cls is None:
+                raise ComponentRegistrationError(
+                    f"Unsupported scope: {scope}",
+                    component_type=impl_name,
+                    interface_type=interface_name,
+                    details=f"Scope {scope.value} is not supported",
                 )
 
-                self._component_metadata[provider_name] = metadata
-                self._registered_types[provider_name] = (
-                    interface  # Track the actual type
-                )
-                self._registration_count += 1
+            # Validate registration
+            if self._validate:
+                validate_component_registration(interface, impl_class, provider_name)
+            tags = _copy_tags(tags)
 
-                log_component_registration(
-                    impl_class,
-                    self._name,
-                    scope.value,
-                    provider_name,
-                    interface=interface.__name__,
-                    registration_id=self._registration_count,
-                )
+            # Constructor analysis is only needed up front for auto-wiring;
+            # otherwise it is deferred until metadata is requested
+            dependency_names: list[str] | None = None
+            self._injection_plans.pop(provider_name, None)
+            if not factory and self._context_ref:
+                dependencies = get_constructor_dependencies(impl_class)
+                dependency_names = list(dependencies)
+                if dependencies:
+                    # Create a factory function that resolves dependencies;
+                    # None means nothing is injectable and the class is used as is
+                    factory = self._create_auto_wiring_factory(
+                        impl_class, dependencies, provider_name
+                    )
+
+            provider = provider_cls(factory or impl_class)
+
+            # Register in dependency-injector container
+            self._container.set_provider(provider_name, provider)
+            self._providers[provider_name] = provider
+
+            # Record metadata details; ComponentMetadata is built lazily
+            self._metadata_specs[provider_name] = _MetadataSpec(
+                impl_class, scope, tags, dependency_names
+            )
+            self._component_metadata.pop(provider_name, None)
+            self._registered_types[provider_name] = interface  # Track the actual type
+            self._registration_count += 1
+            self._dirty = True
+
+            log_component_registration(
+                impl_class,
+                self._name,
+                scope.value,
+                provider_name,
+                interface=interface_name,
+                registration_id=self._registration_count,
+            )
 
         except Exception as e:
             log_error(
                 "register_component",
                 e,
                 context_name=self._name,
-                component_type=implementation or interface,
+                component_type=impl_class,
             )
             if isinstance(e, ComponentRegistrationError):
                 raise
             raise ComponentRegistrationError(
-                f"Failed to register component {interface.__name__}",
-                component_type=(implementation or interface).__name__,
-                interface_type=interface.__name__,
+                f"Failed to register component {interface_name}",
+                component_type=impl_name,
+                interface_type=interface_name,
                 details=str(e),
             ) from e
 
@@ -240,38 +416,38 @@ class Container(ContainerInterface[T]):
             name: Optional component name
             tags: Optional component tags
         """
-        try:
-            with self._lock:
-                provider_name = name or interface.__name__
+        interface_name = interface.__name__
+        provider_name = sys.intern(name or interface_name)
 
+        try:
+            tags = _copy_tags(tags)
+            with self._lock.write:
                 # Wrap the provider in a dependency-injector factory
                 di_provider: providers.Factory[Any] = providers.Factory(
                     provider.provide
                 )
                 self._container.set_provider(provider_name, di_provider)
-
-                # Create metadata
-                metadata = ComponentMetadata(
-                    component_type=interface.__name__,
-                    component_name=provider_name,
-                    scope=provider.get_scope()
-                    if hasattr(provider, "get_scope")
-                    else ComponentScope.SINGLETON,
-                    tags=tags or {},
-                    context_name=self._name,
-                    provider_name=provider_name,
+                self._providers[provider_name] = di_provider
+                self._injection_plans.pop(provider_name, None)
+
+                # Record metadata details; ComponentMetadata is built lazily
+                get_scope = getattr(provider, "get_scope", None)
+                scope = ComponentScope.SINGLETON if get_scope is None else get_scope()
+                self._metadata_specs[provider_name] = _MetadataSpec(
+                    interface, scope, tags, []
                 )
-
-                self._component_metadata[provider_name] = metadata
+                self._component_metadata.pop(provider_name, None)
                 self._registered_types[provider_name] = (
                     interface  # Track the actual type
                 )
                 self._registration_count += 1
+                self._dirty = True
+                self._publish_providers()
 
                 log_component_registration(
                     interface,
                     self._name,
-                    metadata.scope.value,
+                    scope.value,
                     provider_name,
                     provider_type="custom",
                 )
@@ -284,9 +460,83 @@ class Container(ContainerInterface[T]):
                 component_type=interface,
             )
             raise ComponentRegistrationError(
-                f"Failed to register provider for {interface.__name__}",
-                component_type=interface.__name__,
-                interface_type=interface.__name__,
+                f"Failed to register provider for {interface_name}",
+                component_type=interface_name,
+                interface_type=interface_name,
+                details=str(e),
+            ) from e
+
+    def register_instance(
+        self,
+        interface: type[TInterface],
+        instance: TInterface,
+        *,
+        name: str | None = None,
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Register a pre-created instance for an interface.
+
+        The instance is returned as is on every resolution, without calling a
+        factory, so this is cheaper than ``register(factory=lambda: instance)``.
+
+        Args:
+            interface: Interface type to register
+            instance: Instance to provide for the interface
+            name: Optional component name
+            tags: Optional component tags
+        """
+        impl_class = type(instance)
+        interface_name = interface.__name__
+        provider_name = sys.intern(name or interface_name)
+
+        try:
+            with self._lock.write:
+                if self._validate:
+                    validate_component_registration(
+                        interface, impl_class, provider_name
+                    )
+                tags = _copy_tags(tags)
+
+                provider: providers.Object[Any] = providers.Object(instance)
+                self._container.set_provider(provider_name, provider)
+                self._providers[provider_name] = provider
+                self._injection_plans.pop(provider_name, None)
+
+                # Record metadata details; ComponentMetadata is built lazily
+                self._metadata_specs[provider_name] = _MetadataSpec(
+                    impl_class, ComponentScope.SINGLETON, tags, []
+                )
+                self._component_metadata.pop(provider_name, None)
+                self._registered_types[provider_name] = (
+                    interface  # Track the actual type
+                )
+                self._registration_count += 1
+                self._dirty = True
+                self._publish_providers()
+
+                log_component_registration(
+                    impl_class,
+                    self._name,
+                    ComponentScope.SINGLETON.value,
+                    provider_name,
+                    interface=interface_name,
+                    provider_type="instance",
+                )
+
+        except Exception as e:
+            log_error(
+                "register_instance",
+                e,
+                context_name=self._name,
+                component_type=impl_class,
+            )
+            if isinstance(e, ComponentRegistrationError):
+                raise
+            raise ComponentRegistrationError(
+                f"Failed to register instance for {interface_name}",
+                component_type=impl_class.__name__,
+                interface_type=interface_name,
                 details=str(e),
             ) from e
 
@@ -303,41 +553,96 @@ class Container(ContainerInterface[T]):
         Returns:
             Component instance implementing the interface
         """
-        start_time = time.time()
-        provider_name = name or interface.__name__
+        log_enabled = self._resolution_log_enabled
+        start_time = time.perf_counter() if log_enabled else 0.0
+        interface_name = interface.__name__
+        provider_name = name or interface_name
+
+        # Fetch the thread's resolution chain once for the check, push and pop
+        chain = _get_resolution_chain()
 
         # Check for circular dependencies before starting resolution
-        _check_circular_dependency(provider_name, self._name)
+        _check_circular_dependency(provider_name, self._name, chain)
+
+        provider = self._get_provider(interface, name, provider_name)
+        if provider is None:
+            raise ComponentResolutionError(
+                f"No registration found for interface '{interface_name}'",
+                component_type=interface_name,
+                details=f"Component '{provider_name}' not registered in container '{self._name}'",
+            )
 
         # Add to resolution chain
-        _push_resolution(provider_name)
+        chain.push(provider_name)
 
         try:
-            with self._lock:
-                # Check if provider exists
-                if provider_name not in self._container.providers:
-                    raise ComponentResolutionError(
-                        f"No registration found for interface '{interface.__name__}'",
-                        component_type=interface.__name__,
-                        details=f"Component '{provider_name}' not registered in container '{self._name}'",
-                    )
+            instance = provider()
+        except (ComponentResolutionError, CircularDependencyError):
+            raise
+        except Exception as e:
+            log_error(
+                "resolve_component",
+                e,
+                context_name=self._name,
+                component_type=interface,
+            )
+            raise ComponentResolutionError(
+                f"Failed to resolve component {interface_name}",
+                component_type=interface_name,
+                details=str(e),
+            ) from e
+        finally:
+            # Always remove from resolution chain when done
+            chain.pop()
+
+        if log_enabled:
+            log_component_resolution(
+                interface,
+                self._name,
+                (time.perf_counter() - start_time) * 1000,
+                resolution_source="direct",
+                provider_name=provider_name,
+                instance_id=_get_component_id(instance),
+            )
 
-                # Resolve from dependency-injector container
-                instance = self._container.providers[provider_name]()
+        return instance  # type: ignore[no-any-return]
 
-                resolution_time_ms = (time.time() - start_time) * 1000
+    def resolve_many(
+        self, interface: type[TInterface], count: int, name: str | None = None
+    ) -> list[TInterface]:
+        """
+        Resolve several component instances for an interface in one call.
 
-                log_component_resolution(
-                    interface,
-                    self._name,
-                    resolution_time_ms,
-                    resolution_source="direct",
-                    provider_name=provider_name,
-                    instance_id=getattr(instance, "component_id", None),
-                )
+        The circular dependency check and provider lookup are done once for
+        the whole batch. Transient components yield ``count`` distinct
+        instances, while singletons yield the same instance ``count`` times.
+
+        Args:
+            interface: Interface type to resolve
+            count: Number of instances to resolve
+            name: Optional component name
+
+        Returns:
+            List of component instances implementing the interface
+        """
+        interface_name = interface.__name__
+        provider_name = name or interface_name
+
+        chain = _get_resolution_chain()
+        _check_circular_dependency(provider_name, self._name, chain)
+
+        provider = self._get_provider(interface, name, provider_name)
+        if provider is None:
+            raise ComponentResolutionError(
+                f"No registration found for interface '{interface_name}'",
+                component_type=interface_name,
+                details=f"Component '{provider_name}' not registered in container '{self._name}'",
+            )
 
-                return instance  # type: ignore[no-any-return]
+        chain.push(provider_name)
 
+        try:
+            instances = [provider() for _ in range(count)]
         except (ComponentResolutionError, CircularDependencyError):
             raise
         except Exception as e:
@@ -348,13 +653,23 @@ class Container(ContainerInterface[T]):
                 component_type=interface,
             )
             raise ComponentResolutionError(
-                f"Failed to resolve component {interface.__name__}",
-                component_type=interface.__name__,
+                f"Failed to resolve component {interface_name}",
+                component_type=interface_name,
                 details=str(e),
             ) from e
         finally:
-            # Always remove from resolution chain when done
-            _pop_resolution()
+            chain.pop()
+
+        if self._resolution_log_enabled:
+            logger.debug(
+                "Resolved component batch",
+                component=interface_name,
+                container=self._name,
+                provider_name=provider_name,
+                count=count,
+            )
+
+        return instances
 
     async def resolve_async(
         self, interface: type[TInterface], name: str | None = None
@@ -386,9 +701,26 @@ class Container(ContainerInterface[T]):
         Returns:
             True if the interface is registered
         """
-        provider_name = name or interface.__name__
-        with self._lock:
-            return provider_name in self._container.providers
+        return (name or interface.__name__) in self._providers_snapshot
+
+    def is_singleton(
+        self, interface: type[TInterface], name: str | None = None
+    ) -> bool:
+        """
+        Check if every resolution of an interface returns the same instance.
+
+        This is decided by the provider rather than the recorded scope, as
+        custom providers are called on every resolution whatever their scope.
+
+        Args:
+            interface: Interface type to check
+            name: Optional component name
+
+        Returns:
+            True if the interface is registered with a singleton or instance provider
+        """
+        provider = self._get_provider(interface, name, name or interface.__name__)
+        return isinstance(provider, providers.BaseSingleton | providers.Object)
 
     def get_metadata(
         self, interface: type[TInterface], name: str | None = None
@@ -403,17 +735,25 @@ class Container(ContainerInterface[T]):
         Returns:
             ComponentMetadata for the component
         """
-        provider_name = name or interface.__name__
-        with self._lock:
-            if provider_name not in self._component_metadata:
-                raise ComponentResolutionError(
-                    f"No metadata found for component '{interface.__name__}'",
-                    component_type=interface.__name__,
-                    details=f"Component '{provider_name}' not registered",
-                )
-            return cast(
-                ComponentMetadataProtocol, self._component_metadata[provider_name]
-            )
+        interface_name = interface.__name__
+        provider_name = name or interface_name
+        with self._lock.read:
+            metadata = self._component_metadata.get(provider_name)
+        if metadata is None:
+            with self._lock.write:
+                # Re-check: another thread may have built it meanwhile
+                metadata = self._component_metadata.get(provider_name)
+                if metadata is None:
+                    spec = self._metadata_specs.get(provider_name)
+                    if spec is None:
+                        raise ComponentResolutionError(
+                            f"No metadata found for component '{interface_name}'",
+                            component_type=interface_name,
+                            details=f"Component '{provider_name}' not registered",
+                        )
+                    metadata = self._build_metadata(provider_name, spec)
+                    self._component_metadata[provider_name] = metadata
+        return cast(ComponentMetadataProtocol, metadata)
 
     def unregister(self, interface: type[TInterface], name: str | None = None) -> bool:
         """
@@ -427,18 +767,19 @@ class Container(ContainerInterface[T]):
             True if the component was unregistered, False if it wasn't registered
         """
         provider_name = name or interface.__name__
-        with self._lock:
-            if provider_name not in self._container.providers:
+        with self._lock.write:
+            if self._providers.pop(provider_name, None) is None:
                 return False
 
             # Remove from dependency-injector container
-            del self._container.providers[provider_name]
+            self._container.providers.pop(provider_name, None)
+            self._injection_plans.pop(provider_name, None)
 
             # Remove metadata and registered type
-            if provider_name in self._component_metadata:
-                del self._component_metadata[provider_name]
-            if provider_name in self._registered_types:
-                del self._registered_types[provider_name]
+            self._metadata_specs.pop(provider_name, None)
+            self._component_metadata.pop(provider_name, None)
+            self._registered_types.pop(provider_name, None)
+            self._publish_providers()
 
             logger.debug(
                 "Unregistered component",
@@ -450,30 +791,25 @@ class Container(ContainerInterface[T]):
 
     def clear(self) -> None:
         """Clear all registrations from the container."""
-        with self._lock:
-            # Clear dependency-injector container
-            self._container.reset_singletons()
-            self._container.providers.clear()
-
-            # Clear metadata and registered types
-            self._component_metadata.clear()
-            self._registered_types.clear()
-            self._registration_count = 0
-
-            # Clear scope manager
-            self._scope_manager.clear_all()
+        with self._lock.write:
+            if not self._dirty:
+                return
+            self._teardown(reset_providers=True)
+            self._dirty = False
 
             logger.debug("Cleared all registrations", container=self._name)
 
     def get_registered_types(self) -> list[type]:
         """Get a list of all registered interface types."""
-        with self._lock:
-            return list(self._registered_types.values())
+        return list(self._registered_types_view)
 
     def get_registration_count(self) -> int:
         """Get the number of registered components."""
-        with self._lock:
-            return len(self._container.providers)
+        return len(self._providers_snapshot)
+
+    def get_version(self) -> int:
+        """Get a counter that changes whenever the registrations change."""
+        return self._version
 
     def wire_modules(self, modules: list[str] | None = None) -> None:
         """
@@ -510,19 +846,13 @@ class Container(ContainerInterface[T]):
 
     def shutdown(self) -> None:
         """Shutdown the container and cleanup resources."""
-        with self._lock:
+        with self._lock.write:
             try:
                 # Shutdown resources using dependency-injector capabilities
                 if hasattr(self._container, "shutdown_resources"):
                     self._container.shutdown_resources()
 
-                # Clear scope manager
-                self._scope_manager.clear_all()
-
-                # Clear metadata and registered types
-                self._component_metadata.clear()
-                self._registered_types.clear()
-                self._registration_count = 0
+                self._teardown(reset_providers=False)
 
                 logger.debug("Shutdown container", container=self._name)
 
@@ -542,17 +872,25 @@ class Container(ContainerInterface[T]):
         Enable automatic dependency injection for this container.
 
         This method should be called after all components are registered
-        to enable automatic dependency resolution.
+        to enable automatic dependency resolution. The injection plans of
+        auto-wired components are compiled here against the complete set of
+        registrations, so the first resolutions do not have to build them.
         """
         try:
-            with self._lock:
-                # The providers are already configured with Dependency() providers
-                # during registration, so they will automatically resolve dependencies
-                # when components are instantiated
+            with self._lock.read:
+                # Pick up logging configured after the container was created
+                self._resolution_log_enabled = is_debug_enabled(logger)
+
+                # The providers are already configured with auto-wiring factories
+                # during registration; only their plans still need compiling
+                for injection_plan in self._injection_plans.values():
+                    injection_plan()
+
                 logger.debug(
                     "Enabled automatic dependency injection",
                     container=self._name,
-                    provider_count=len(self._container.providers),
+                    provider_count=len(self._providers),
+                    compiled_plans=len(self._injection_plans),
                 )
 
         except Exception as e:
@@ -566,6 +904,113 @@ class Container(ContainerInterface[T]):
                 details=str(e),
             ) from e
 
+    def _teardown(self, *, reset_providers: bool) -> None:
+        """
+        Drop registration state; must be called under the write lock.
+
+        Args:
+            reset_providers: Whether to also reset singletons and remove the
+                providers themselves, as clear() does
+        """
+        if reset_providers:
+            # Clear dependency-injector container
+            self._container.reset_singletons()
+            self._container.providers.clear()
+            self._providers = {}
+            self._injection_plans = {}
+
+        # Clear scope manager
+        self._scope_manager.clear_all()
+
+        # Rebind rather than clear; the old maps are released in one go
+        self._metadata_specs = {}
+        self._component_metadata = {}
+        self._registered_types = {}
+        self._registration_count = 0
+        self._publish_providers()
+
+    def _build_metadata(
+        self, provider_name: str, spec: _MetadataSpec
+    ) -> ComponentMetadata:
+        """
+        Materialize ComponentMetadata from recorded registration details.
+
+        Args:
+            provider_name: Provider name the component is registered under
+            spec: Registration details recorded at registration time
+
+        Returns:
+            ComponentMetadata for the component
+
+        Raises:
+            ComponentResolutionError: If the metadata cannot be built
+        """
+        try:
+            dependencies = spec.dependencies
+            if dependencies is None:
+                dependencies = list(get_constructor_dependencies(spec.component_class))
+            return ComponentMetadata(
+                component_type=spec.component_class.__name__,
+                component_name=provider_name,
+                scope=spec.scope,
+                tags=spec.tags if spec.tags is not None else _EMPTY_TAGS,  # type: ignore[arg-type]
+                dependencies=dependencies,
+                context_name=self._name,
+                provider_name=provider_name,
+            )
+        except Exception as e:
+            log_error(
+                "build_metadata",
+                e,
+                context_name=self._name,
+                component_type=spec.component_class,
+            )
+            raise ComponentResolutionError(
+                f"Failed to build metadata for component '{provider_name}'",
+                component_type=spec.component_class.__name__,
+                details=str(e),
+            ) from e
+
+    def _get_provider(
+        self, interface: type, name: str | None, provider_name: str
+    ) -> providers.Provider[Any] | None:
+        """
+        Look up the provider for a resolution without raising.
+
+        Args:
+            interface: Interface type being resolved
+            name: Optional component name passed to resolve
+            provider_name: Provider name derived from name or interface
+
+        Returns:
+            The registered provider, or None if nothing is registered
+        """
+        # Lock-free fast path: the snapshots are replaced, never mutated
+        if name is None:
+            provider = self._providers_by_type.get(interface)
+            if provider is not None:
+                return provider
+        provider = self._providers_snapshot.get(provider_name)
+        if provider is None:
+            # Double-check under the lock in case a registration is in flight
+            with self._lock.read:
+                provider = self._providers_snapshot.get(provider_name)
+        return provider
+
+    def _publish_providers(self) -> None:
+        """Publish fresh read-only views; must be called under the write lock."""
+        providers_map = dict(self._providers)
+        self._providers_snapshot = providers_map
+        self._registered_types_view = tuple(self._registered_types.values())
+        # Only types whose default name still maps to their own registration;
+        # another class with the same __name__ may have replaced it
+        self._providers_by_type = {
+            interface: providers_map[provider_name]
+            for provider_name, interface in self._registered_types.items()
+            if provider_name == interface.__name__ and provider_name in providers_map
+        }
+        self._version += 1
+
     def _should_inject_dependency(self, dependency_type: type) -> bool:
         """
         Determine if a dependency should be auto-injected.
@@ -576,27 +1021,32 @@ class Container(ContainerInterface[T]):
         Returns:
             True if the dependency should be auto-injected
         """
-        # Don't inject primitive types or built-in types
-        if dependency_type in (str, int, float, bool, bytes, type(None)):
-            return False
-
-        # Don't inject standard library types that are typically not DI components
-        module_name = getattr(dependency_type, "__module__", "")
-        if module_name in ("builtins", "typing", "collections", "datetime", "pathlib"):
+        # Don't inject primitive types or standard library types
+        if not _is_injectable_type(dependency_type):
             return False
 
         # Check if the dependency is registered in this container
-        provider_name = dependency_type.__name__
-        if provider_name in self._container.providers:
+        if dependency_type.__name__ in self._providers_snapshot:
             return True
 
-        # Check if the dependency can be resolved through imports (if context is available)
+        return self._is_imported(dependency_type)
+
+    def _is_imported(self, dependency_type: type) -> bool:
+        """
+        Check if a dependency can be resolved through the context's imports.
+
+        Args:
+            dependency_type: The type of the dependency
+
+        Returns:
+            True if an import declaration provides the dependency
+        """
         if self._context_ref:
             try:
                 # Check if the dependency can be resolved through imports
-                for import_decl in self._context_ref._import_manager.get_imports():
-                    if import_decl.component_type == dependency_type:
-                        return True
+                return bool(
+                    self._context_ref._import_manager.has_import_for(dependency_type)
+                )
             except Exception:
                 # If there's any issue checking imports, don't inject
                 pass
@@ -616,7 +1066,7 @@ class Container(ContainerInterface[T]):
         provider_name = dependency_type.__name__
 
         # If it's registered locally, use a direct Dependency provider
-        if provider_name in self._container.providers:
+        if provider_name in self._providers_snapshot:
             return providers.Dependency()
 
         # If it can be resolved through context imports, create a custom provider
@@ -639,21 +1089,64 @@ class Container(ContainerInterface[T]):
         return None
 
     def _create_auto_wiring_factory(
-        self, impl_class: type, dependencies: dict[str, tuple[type | None, bool]]
+        self,
+        impl_class: type,
+        dependencies: dict[str, tuple[type | None, bool]],
+        provider_name: str,
     ) -> Any:
         """
         Create a factory function that automatically resolves and injects dependencies.
 
+        Must be called under the write lock, as it records the factory's
+        injection plan for enable_auto_wiring().
+
         Args:
             impl_class: The implementation class to create instances of
             dependencies: Dictionary of dependencies (param_name -> (type, is_optional))
+            provider_name: Name the factory's provider is registered under
 
         Returns:
-            Factory function that creates instances with auto-injected dependencies
+            Factory function that creates instances with auto-injected
+            dependencies, or None if no parameter can ever be injected
         """
+        # The type-only checks never change, so they are compiled into the plan
+        # once; only the registration-dependent checks remain per call
+        candidates = tuple(
+            (param_name, param_type, is_optional)
+            for param_name, (param_type, is_optional) in dependencies.items()
+            if param_type is not None and _is_injectable_type(param_type)
+        )
+        if not candidates:
+            # Only primitive or untyped parameters: the provider can call the
+            # class directly instead of going through a wrapper per instance
+            return None
+        # Local registrations per provider snapshot; a new snapshot is published
+        # whenever providers are re-bound, which invalidates the plan. Source and
+        # plan are swapped together so concurrent rebuilds never mix them up
+        cached: tuple[Any, tuple[tuple[str, type, bool, bool], ...]] = (None, ())
+
+        def injection_plan() -> tuple[tuple[str, type, bool, bool], ...]:
+            nonlocal cached
+            snapshot = self._providers_snapshot
+            source, plan = cached
+            if snapshot is not source:
+                plan = tuple(
+                    (
+                        param_name,
+                        param_type,
+                        is_optional,
+                        param_type.__name__ in snapshot,
+                    )
+                    for param_name, param_type, is_optional in candidates
+                )
+                cached = (snapshot, plan)
+            return plan
+
+        self._injection_plans[provider_name] = injection_plan
 
         def create_instance_with_dependencies() -> Any:
             kwargs = {}
+            log_enabled = self._resolution_log_enabled
 
             # Check if auto-wiring is enabled in the context
             auto_wire_enabled = (
@@ -663,18 +1156,19 @@ class Container(ContainerInterface[T]):
             )
 
             if auto_wire_enabled:
-                for param_name, (param_type, is_optional) in dependencies.items():
-                    if param_type and self._should_inject_dependency(param_type):
+                for param_name, param_type, is_optional, is_local in injection_plan():
+                    if is_local or self._is_imported(param_type):
                         try:
                             # Resolve dependency from context (includes imports)
                             # The context's resolve method will handle circular dependency detection
                             kwargs[param_name] = self._context_ref.resolve(param_type)
-                            logger.debug(
-                                "Auto-injected dependency",
-                                component=impl_class.__name__,
-                                parameter=param_name,
-                                dependency_type=param_type.__name__,
-                            )
+                            if log_enabled:
+                                logger.debug(
+                                    "Auto-injected dependency",
+                                    component=impl_class.__name__,
+                                    parameter=param_name,
+                                    dependency_type=param_type.__name__,
+                                )
                         except (CircularDependencyError, ComponentResolutionError):
                             # Re-raise DI-specific exceptions without modification
                             raise
@@ -694,20 +1188,18 @@ class Container(ContainerInterface[T]):
                                 error=str(e),
                             )
 
-            logger.debug(
-                "Creating instance with auto-injected dependencies",
-                component=impl_class.__name__,
-                injected_dependencies=list(kwargs.keys()),
-                auto_wire_enabled=auto_wire_enabled,
-            )
+            if log_enabled:
+                logger.debug(
+                    "Creating instance with auto-injected dependencies",
+                    component=impl_class.__name__,
+                    injected_dependencies=list(kwargs.keys()),
+                    auto_wire_enabled=auto_wire_enabled,
+                )
             return impl_class(**kwargs)
 
         return create_instance_with_dependencies
 
     def __repr__(self) -> str:
         """Get string representation of the container."""
-        with self._lock:
-            return (
-                f"Container(name='{self._name}', "
-                f"registrations={len(self._container.providers)})"
-            )
+        count = len(self._providers_snapshot)
+        return f"Container(name='{self._name}', registrations={count})"
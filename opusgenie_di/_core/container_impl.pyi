@@ -1,27 +1,80 @@
 from .._base import ComponentMetadata as ComponentMetadata, ComponentScope as ComponentScope
 from .._base.protocols import ComponentMetadataProtocol as ComponentMetadataProtocol
-from .._utils import get_constructor_dependencies as get_constructor_dependencies, get_logger as get_logger, log_component_registration as log_component_registration, log_component_resolution as log_component_resolution, log_error as log_error, validate_component_registration as validate_component_registration
+from .._utils import cache_debug_enabled as cache_debug_enabled, get_constructor_dependencies as get_constructor_dependencies, get_logger as get_logger, is_debug_enabled as is_debug_enabled, log_component_registration as log_component_registration, log_component_resolution as log_component_resolution, log_error as log_error, validate_component_registration as validate_component_registration
 from .container_interface import ContainerInterface as ContainerInterface
 from .exceptions import CircularDependencyError as CircularDependencyError, ComponentRegistrationError as ComponentRegistrationError, ComponentResolutionError as ComponentResolutionError
+from .rw_lock import ReaderWriterLock as ReaderWriterLock
 from .scope_impl import ScopeManager as ScopeManager
 from _typeshed import Incomplete
-from typing import Any, TypeVar
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, NamedTuple, TypeVar
+from weakref import WeakKeyDictionary
 
 T = TypeVar('T')
 TInterface = TypeVar('TInterface')
 TImplementation = TypeVar('TImplementation')
 logger: Incomplete
+_EMPTY_TAGS: Mapping[str, Any]
+_NON_INJECTABLE_TYPES: frozenset[type]
+_NON_INJECTABLE_MODULES: frozenset[str]
+
+def _is_injectable_type(dependency_type: type) -> bool:
+    """Check whether a type could be an auto-injected DI component at all."""
+def _copy_tags(tags: dict[str, Any] | None) -> dict[str, str] | None:
+    """
+    Check component tags against ComponentMetadata and take a private copy.
+
+    Metadata is built lazily, so tags are checked here to fail at
+    registration time, and copied so later changes by the caller do not
+    leak into the registration.
+
+    Args:
+        tags: Component tags passed to a registration method
+
+    Returns:
+        A copy of the tags, or None if no tags were given
+
+    Raises:
+        TypeError: If tags is not a dictionary of strings to strings
+    """
+
 _resolution_chain: Incomplete
+_has_component_id: WeakKeyDictionary[type, bool]
 
-def _get_resolution_chain() -> list[str]:
-    """Get the current resolution chain for this thread."""
-def _push_resolution(component_name: str) -> None:
-    """Add a component to the resolution chain."""
-def _pop_resolution() -> None:
-    """Remove the last component from the resolution chain."""
-def _check_circular_dependency(component_name: str, context_name: str) -> None:
+def _get_component_id(instance: Any) -> Any:
+    """Get an instance's component_id for logging, or None if it has none."""
+
+class _ResolutionChain:
+    """
+    Provider names being resolved on one thread.
+
+    Only the active chain is tracked: names are pushed when a resolution
+    starts and popped when it ends. The set makes the circular dependency
+    check a hash probe however deep the chain is, while the list keeps the
+    order for error messages.
+    """
+    __slots__: Incomplete
+    names: list[str]
+    active: set[str]
+    def __init__(self) -> None:
+        """Initialize an empty chain."""
+    def push(self, component_name: str) -> None:
+        """Record that a component is being resolved."""
+    def pop(self) -> None:
+        """Record that the most recent resolution has finished."""
+
+def _get_resolution_chain() -> _ResolutionChain:
+    """Get the current resolution chain for this thread, creating it on first use."""
+def _check_circular_dependency(component_name: str, context_name: str, chain: _ResolutionChain | None = None) -> None:
     """Check if adding this component would create a circular dependency."""
 
+class _MetadataSpec(NamedTuple):
+    """Registration details from which ComponentMetadata is built on demand."""
+    component_class: type
+    scope: ComponentScope
+    tags: dict[str, str] | None
+    dependencies: list[str] | None
+
 class Container(ContainerInterface[T]):
     """
     Container implementation wrapping dependency-injector containers.
@@ -30,21 +83,34 @@ class Container(ContainerInterface[T]):
     containers with structured logging, metadata management, and
     multi-context support.
     """
+    _PROVIDER_FOR_SCOPE: dict[ComponentScope, Callable[[Any], Incomplete]]
     _name: Incomplete
     _context_ref: Incomplete
-    _lock: Incomplete
+    _validate: bool
+    _lock: ReaderWriterLock
     _scope_manager: Incomplete
     _container: Incomplete
+    _providers: dict[str, Incomplete]
+    _providers_snapshot: dict[str, Incomplete]
+    _registered_types_view: tuple[type, ...]
+    _providers_by_type: dict[type, Incomplete]
+    _injection_plans: dict[str, Callable[[], tuple[tuple[str, type, bool, bool], ...]]]
+    _metadata_specs: dict[str, _MetadataSpec]
     _component_metadata: dict[str, ComponentMetadata]
     _registered_types: dict[str, type]
     _registration_count: int
-    def __init__(self, name: str = 'default', context_ref: Any = None) -> None:
+    _dirty: bool
+    _version: int
+    _resolution_log_enabled: bool
+    def __init__(self, name: str = 'default', context_ref: Any = None, *, validate: bool = True) -> None:
         """
         Initialize the container.
 
         Args:
             name: Name of the container for identification
             context_ref: Optional reference to the parent context for cross-context resolution
+            validate: Whether to validate registrations; disable for bulk
+                registration of components that are already known to be valid
         """
     @property
     def name(self) -> str:
@@ -61,6 +127,25 @@ class Container(ContainerInterface[T]):
             tags: Optional component tags
             factory: Optional factory function for creating instances
         """
+    def register_many(self, interfaces: Iterable[type], *, scope: ComponentScope = ..., tags: dict[str, Any] | None = None) -> None:
+        """
+        Register several components under their default names in one call.
+
+        The write lock is taken once and the provider views are published once
+        for the whole batch, instead of once per component. If a registration
+        fails, the components registered before it are kept.
+
+        Args:
+            interfaces: Interface types to register as their own implementation
+            scope: Component lifecycle scope shared by the batch
+            tags: Optional component tags shared by the batch
+        """
+    def _register(self, interface: type[TInterface], implementation: type[TImplementation] | None = None, *, scope: ComponentScope, name: str | None = None, tags: dict[str, Any] | None = None, factory: Any = None) -> None:
+        """
+        Register a component without publishing the provider views.
+
+        Must be called under the write lock; the caller publishes afterwards.
+        """
     def register_provider(self, interface: type[TInterface], provider: Any, *, name: str | None = None, tags: dict[str, Any] | None = None) -> None:
         """
         Register a component provider for an interface.
@@ -71,6 +156,19 @@ class Container(ContainerInterface[T]):
             name: Optional component name
             tags: Optional component tags
         """
+    def register_instance(self, interface: type[TInterface], instance: TInterface, *, name: str | None = None, tags: dict[str, Any] | None = None) -> None:
+        """
+        Register a pre-created instance for an interface.
+
+        The instance is returned as is on every resolution, without calling a
+        factory, so this is cheaper than ``register(factory=lambda: instance)``.
+
+        Args:
+            interface: Interface type to register
+            instance: Instance to provide for the interface
+            name: Optional component name
+            tags: Optional component tags
+        """
     def resolve(self, interface: type[TInterface], name: str | None = None) -> TInterface:
         """
         Resolve a component instance for an interface.
@@ -82,6 +180,22 @@ class Container(ContainerInterface[T]):
         Returns:
             Component instance implementing the interface
         """
+    def resolve_many(self, interface: type[TInterface], count: int, name: str | None = None) -> list[TInterface]:
+        """
+        Resolve several component instances for an interface in one call.
+
+        The circular dependency check and provider lookup are done once for
+        the whole batch. Transient components yield ``count`` distinct
+        instances, while singletons yield the same instance ``count`` times.
+
+        Args:
+            interface: Interface type to resolve
+            count: Number of instances to resolve
+            name: Optional component name
+
+        Returns:
+            List of component instances implementing the interface
+        """
     async def resolve_async(self, interface: type[TInterface], name: str | None = None) -> TInterface:
         """
         Asynchronously resolve a component instance for an interface.
@@ -104,6 +218,20 @@ class Container(ContainerInterface[T]):
         Returns:
             True if the interface is registered
         """
+    def is_singleton(self, interface: type[TInterface], name: str | None = None) -> bool:
+        """
+        Check if every resolution of an interface returns the same instance.
+
+        This is decided by the provider rather than the recorded scope, as
+        custom providers are called on every resolution whatever their scope.
+
+        Args:
+            interface: Interface type to check
+            name: Optional component name
+
+        Returns:
+            True if the interface is registered with a singleton or instance provider
+        """
     def get_metadata(self, interface: type[TInterface], name: str | None = None) -> ComponentMetadataProtocol:
         """
         Get metadata for a registered component.
@@ -132,6 +260,8 @@ class Container(ContainerInterface[T]):
         """Get a list of all registered interface types."""
     def get_registration_count(self) -> int:
         """Get the number of registered components."""
+    def get_version(self) -> int:
+        """Get a counter that changes whenever the registrations change."""
     def wire_modules(self, modules: list[str] | None = None) -> None:
         """
         Wire the container for automatic dependency injection.
@@ -146,8 +276,46 @@ class Container(ContainerInterface[T]):
         Enable automatic dependency injection for this container.
 
         This method should be called after all components are registered
-        to enable automatic dependency resolution.
+        to enable automatic dependency resolution. The injection plans of
+        auto-wired components are compiled here against the complete set of
+        registrations, so the first resolutions do not have to build them.
+        """
+    def _teardown(self, *, reset_providers: bool) -> None:
+        """
+        Drop registration state; must be called under the write lock.
+
+        Args:
+            reset_providers: Whether to also reset singletons and remove the
+                providers themselves, as clear() does
         """
+    def _build_metadata(self, provider_name: str, spec: _MetadataSpec) -> ComponentMetadata:
+        """
+        Materialize ComponentMetadata from recorded registration details.
+
+        Args:
+            provider_name: Provider name the component is registered under
+            spec: Registration details recorded at registration time
+
+        Returns:
+            ComponentMetadata for the component
+
+        Raises:
+            ComponentResolutionError: If the metadata cannot be built
+        """
+    def _get_provider(self, interface: type, name: str | None, provider_name: str) -> Incomplete | None:
+        """
+        Look up the provider for a resolution without raising.
+
+        Args:
+            interface: Interface type being resolved
+            name: Optional component name passed to resolve
+            provider_name: Provider name derived from name or interface
+
+        Returns:
+            The registered provider, or None if nothing is registered
+        """
+    def _publish_providers(self) -> None:
+        """Publish fresh read-only views; must be called under the write lock."""
     def _should_inject_dependency(self, dependency_type: type) -> bool:
         """
         Determine if a dependency should be auto-injected.
@@ -158,6 +326,16 @@ class Container(ContainerInterface[T]):
         Returns:
             True if the dependency should be auto-injected
         """
+    def _is_imported(self, dependency_type: type) -> bool:
+        """
+        Check if a dependency can be resolved through the context's imports.
+
+        Args:
+            dependency_type: The type of the dependency
+
+        Returns:
+            True if an import declaration provides the dependency
+        """
     def _create_dependency_provider(self, dependency_type: type) -> Any:
         """
         Create a provider for automatic dependency injection.
@@ -168,16 +346,21 @@ class Container(ContainerInterface[T]):
         Returns:
             A provider that can resolve the dependency
         """
-    def _create_auto_wiring_factory(self, impl_class: type, dependencies: dict[str, tuple[type | None, bool]]) -> Any:
+    def _create_auto_wiring_factory(self, impl_class: type, dependencies: dict[str, tuple[type | None, bool]], provider_name: str) -> Any:
         """
         Create a factory function that automatically resolves and injects dependencies.
 
+        Must be called under the write lock, as it records the factory's
+        injection plan for enable_auto_wiring().
+
         Args:
             impl_class: The implementation class to create instances of
             dependencies: Dictionary of dependencies (param_name -> (type, is_optional))
+            provider_name: Name the factory's provider is registered under
 
         Returns:
-            Factory function that creates instances with auto-injected dependencies
+            Factory function that creates instances with auto-injected
+            dependencies, or None if no parameter can ever be injected
         """
     def __repr__(self) -> str:
         """Get string representation of the container."""
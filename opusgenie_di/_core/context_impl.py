@@ -1,12 +1,13 @@
 """Context implementation for multi-container dependency injection."""
 
+from collections.abc import Iterable
 from threading import RLock
 import time
 from typing import Any, TypeVar
 from weakref import WeakSet
 
 from .._base import ComponentScope
-from .._hooks import EventHook, emit_event
+from .._hooks import EventHook, emit_event, has_event_hooks
 from .._utils import (
     get_logger,
     log_context_creation,
@@ -23,6 +24,18 @@ TInterface = TypeVar("TInterface")
 
 logger = get_logger(__name__)
 
+# Sentinels for the direct resolution cache; None is a valid instance
+_MISSING: Any = object()
+_NOT_SINGLETON: Any = object()
+
+
+def _copy_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached context summary so callers cannot mutate the cache."""
+    copied = dict(summary)
+    copied["registered_types"] = list(summary["registered_types"])
+    copied["imports"] = [dict(entry) for entry in summary["imports"]]
+    return copied
+
 
 class ImportDeclaration:
     """
@@ -32,6 +45,8 @@ class ImportDeclaration:
     from a different context than the one making the request.
     """
 
+    __slots__ = ("alias", "component_type", "name", "source_context")
+
     def __init__(
         self,
         component_type: type,
@@ -87,6 +102,9 @@ class ImportManager:
         self._context = context
         self._imports: dict[str, ImportDeclaration] = {}
         self._source_contexts: dict[str, Context] = {}
+        # Rebuilt on change so lookups by type need no scan of the declarations
+        self._imported_types: frozenset[type] = frozenset()
+        self._imports_by_target: dict[tuple[type, str], ImportDeclaration] = {}
 
     def add_import(self, declaration: ImportDeclaration) -> None:
         """
@@ -97,6 +115,16 @@ class ImportManager:
         """
         import_key = declaration.get_import_key()
         self._imports[import_key] = declaration
+        self._imported_types = frozenset(
+            decl.component_type for decl in self._imports.values()
+        )
+        # The first declaration for a target wins, as in a front-to-back scan
+        imports_by_target: dict[tuple[type, str], ImportDeclaration] = {}
+        for decl in self._imports.values():
+            imports_by_target.setdefault(
+                (decl.component_type, decl.get_provider_name()), decl
+            )
+        self._imports_by_target = imports_by_target
 
         logger.debug(
             "Added import declaration",
@@ -138,16 +166,9 @@ class ImportManager:
         provider_name = name or component_type.__name__
 
         # Find matching import declaration
-        matching_import = None
-        for declaration in self._imports.values():
-            if (
-                declaration.component_type == component_type
-                and declaration.get_provider_name() == provider_name
-            ):
-                matching_import = declaration
-                break
-
-        if not matching_import:
+        matching_import = self.find_import(component_type, name)
+
+        if matching_import is None:
             raise ImportError(
                 f"No import declaration found for {component_type.__name__}",
                 component_type=component_type.__name__,
@@ -190,6 +211,26 @@ class ImportManager:
                 details=str(e),
             ) from e
 
+    def find_import(
+        self, component_type: type, name: str | None = None
+    ) -> ImportDeclaration | None:
+        """
+        Find the import declaration that provides a component.
+
+        Unlike resolve_import, a miss returns None instead of raising, so
+        callers probing for components that are not imported stay cheap.
+
+        Args:
+            component_type: Type of component to look up
+            name: Optional component name
+
+        Returns:
+            The matching import declaration, or None if there is none
+        """
+        return self._imports_by_target.get(
+            (component_type, name or component_type.__name__)
+        )
+
     def get_imports(self) -> list[ImportDeclaration]:
         """Get all import declarations."""
         return list(self._imports.values())
@@ -198,9 +239,15 @@ class ImportManager:
         """Get the number of imports."""
         return len(self._imports)
 
+    def has_import_for(self, component_type: type) -> bool:
+        """Check whether any import declaration provides the given type."""
+        return component_type in self._imported_types
+
     def clear_imports(self) -> None:
         """Clear all imports."""
         self._imports.clear()
+        self._imported_types = frozenset()
+        self._imports_by_target = {}
         self._source_contexts.clear()
         logger.debug("Cleared all imports", context=self._context.name)
 
@@ -234,6 +281,15 @@ class Context(ContextInterface):
         self._auto_wire = auto_wire
         self._lock = RLock()
         self._child_contexts: WeakSet[Context] = WeakSet()
+        # Bumped by changes that alter the summary outside the container
+        self._version = 0
+        self._summary_cache: tuple[tuple[int, int, int], dict[str, Any]] | None = None
+        # Outcomes of direct resolutions, tagged with the container version
+        # they are valid for: the instance for singletons, else _NOT_SINGLETON
+        self._resolution_cache: tuple[int, dict[type | tuple[type, str], Any]] = (
+            -1,
+            {},
+        )
 
         # Create underlying container with reference to this context
         self._container: Container[Any] = Container(name, context_ref=self)
@@ -357,6 +413,56 @@ class Context(ContextInterface):
             )
             raise
 
+    def register_many(
+        self,
+        interfaces: Iterable[type],
+        scope: ComponentScope = ComponentScope.SINGLETON,
+        tags: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Register several components in this context in one batch.
+
+        Each type is registered as its own implementation under its default
+        name. The container publishes its registrations once for the batch,
+        and a registration event is still emitted per component.
+
+        Args:
+            interfaces: Interface types to register
+            scope: Component lifecycle scope shared by the batch
+            tags: Optional component tags shared by the batch
+        """
+        interfaces = tuple(interfaces)
+        try:
+            with self._lock:
+                self._container.register_many(interfaces, scope=scope, tags=tags)
+
+                registration_time = time.time()
+                for interface in interfaces:
+                    emit_event(
+                        EventHook.COMPONENT_REGISTERED,
+                        {
+                            "context_name": self._name,
+                            "interface_name": interface.__name__,
+                            "implementation_name": interface.__name__,
+                            "scope": scope.value,
+                            "component_name": None,
+                            "tags": tags or {},
+                            "registration_time": registration_time,
+                        },
+                    )
+
+        except Exception as e:
+            emit_event(
+                EventHook.ERROR_OCCURRED,
+                {
+                    "context_name": self._name,
+                    "operation": "register_many",
+                    "error": str(e),
+                    "component_types": [t.__name__ for t in interfaces],
+                },
+            )
+            raise
+
     def resolve(
         self, interface: type[TInterface], name: str | None = None
     ) -> TInterface:
@@ -373,42 +479,52 @@ class Context(ContextInterface):
         start_time = time.time()
 
         try:
-            with self._lock:
-                # Try to resolve from this context's container
-                if self._container.is_registered(interface, name):
-                    instance: TInterface = self._container.resolve(interface, name)
-                    resolution_time_ms = (time.time() - start_time) * 1000
-
+            # Direct registrations skip the context lock: the container is
+            # thread-safe and singleton providers guard their own construction
+            instance = self._resolve_direct(interface, name)
+            if instance is not _MISSING:
+                # Most resolutions have no listener; skip building the event
+                if has_event_hooks(EventHook.COMPONENT_RESOLVED):
                     emit_event(
                         EventHook.COMPONENT_RESOLVED,
                         {
                             "context_name": self._name,
                             "interface_name": interface.__name__,
                             "component_name": name,
-                            "resolution_time_ms": resolution_time_ms,
+                            "resolution_time_ms": (time.time() - start_time) * 1000,
                             "resolution_source": "direct",
                         },
                     )
 
-                    return instance
+                return instance  # type: ignore[no-any-return]
+
+            # Only the lookups happen under the lock. Resolving in another
+            # context can construct a singleton, which waits on
+            # dependency-injector's process-wide singleton lock; holding the
+            # context lock meanwhile would deadlock against a thread that
+            # builds a singleton depending on this context
+            with self._lock:
+                imported = self._import_manager.find_import(interface, name)
+                parent = self._parent
 
-                # Try to resolve from imports
+            # Try to resolve from imports; components that are not imported
+            # skip the failed-import exception on their way up to the parent
+            if imported is not None:
                 try:
                     import_instance: TInterface = self._import_manager.resolve_import(
                         interface, name
                     )
-                    resolution_time_ms = (time.time() - start_time) * 1000
-
-                    emit_event(
-                        EventHook.COMPONENT_RESOLVED,
-                        {
-                            "context_name": self._name,
-                            "interface_name": interface.__name__,
-                            "component_name": name,
-                            "resolution_time_ms": resolution_time_ms,
-                            "resolution_source": "import",
-                        },
-                    )
+                    if has_event_hooks(EventHook.COMPONENT_RESOLVED):
+                        emit_event(
+                            EventHook.COMPONENT_RESOLVED,
+                            {
+                                "context_name": self._name,
+                                "interface_name": interface.__name__,
+                                "component_name": name,
+                                "resolution_time_ms": (time.time() - start_time) * 1000,
+                                "resolution_source": "import",
+                            },
+                        )
 
                     return import_instance
 
@@ -416,23 +532,23 @@ class Context(ContextInterface):
                     # Import resolution failed, continue to parent context
                     pass
 
-                # Try parent context if available
-                if self._parent:
-                    logger.debug(
-                        "Component not found in context, trying parent",
-                        context=self._name,
-                        parent=self._parent.name,
-                        component=interface.__name__,
-                    )
-                    return self._parent.resolve(interface, name)
-
-                # Component not found anywhere
-                raise ComponentResolutionError(
-                    f"No registration found for interface '{interface.__name__}'",
-                    component_type=interface.__name__,
-                    details=f"Component '{name or interface.__name__}' not registered in context hierarchy",
-                    context_name=self._name,
+            # Try parent context if available
+            if parent:
+                logger.debug(
+                    "Component not found in context, trying parent",
+                    context=self._name,
+                    parent=parent.name,
+                    component=interface.__name__,
                 )
+                return parent.resolve(interface, name)
+
+            # Component not found anywhere
+            raise ComponentResolutionError(
+                f"No registration found for interface '{interface.__name__}'",
+                component_type=interface.__name__,
+                details=f"Component '{name or interface.__name__}' not registered in context hierarchy",
+                context_name=self._name,
+            )
 
         except ComponentResolutionError:
             emit_event(
@@ -468,6 +584,57 @@ class Context(ContextInterface):
                 context_name=self._name,
             ) from e
 
+    def resolve_many(
+        self, interface: type[TInterface], count: int, name: str | None = None
+    ) -> list[TInterface]:
+        """
+        Resolve several components from this context or its hierarchy.
+
+        Components registered directly in this context are resolved as one
+        batch, and a single resolution event is emitted for it. Components
+        from imports or parent contexts are resolved one at a time.
+
+        Args:
+            interface: Interface type to resolve
+            count: Number of instances to resolve
+            name: Optional component name
+
+        Returns:
+            List of component instances
+        """
+        if not self._container.is_registered(interface, name):
+            return [self.resolve(interface, name) for _ in range(count)]
+
+        start_time = time.time()
+        try:
+            instances = self._container.resolve_many(interface, count, name)
+        except ComponentResolutionError:
+            emit_event(
+                EventHook.COMPONENT_RESOLUTION_FAILED,
+                {
+                    "context_name": self._name,
+                    "interface_name": interface.__name__,
+                    "component_name": name,
+                    "resolution_time_ms": (time.time() - start_time) * 1000,
+                },
+            )
+            raise
+
+        if has_event_hooks(EventHook.COMPONENT_RESOLVED):
+            emit_event(
+                EventHook.COMPONENT_RESOLVED,
+                {
+                    "context_name": self._name,
+                    "interface_name": interface.__name__,
+                    "component_name": name,
+                    "resolution_time_ms": (time.time() - start_time) * 1000,
+                    "resolution_source": "direct",
+                    "resolution_count": count,
+                },
+            )
+
+        return instances
+
     async def resolve_async(
         self, interface: type[TInterface], name: str | None = None
     ) -> TInterface:
@@ -498,23 +665,30 @@ class Context(ContextInterface):
         Returns:
             True if the component is registered
         """
+        # Check this context; the container answers from its published
+        # snapshot, so direct registrations need no context lock
+        if self._container.is_registered(interface, name):
+            return True
+
+        # As in resolve, the import check may construct a component in the
+        # source context, so it runs outside the context lock
         with self._lock:
-            # Check this context
-            if self._container.is_registered(interface, name):
-                return True
+            imported = self._import_manager.find_import(interface, name)
+            parent = self._parent
 
-            # Check imports
+        # Check imports
+        if imported is not None:
             try:
                 self._import_manager.resolve_import(interface, name)
                 return True
             except ImportError:
                 pass
 
-            # Check parent context
-            if self._parent:
-                return self._parent.is_registered(interface, name)
+        # Check parent context
+        if parent:
+            return parent.is_registered(interface, name)
 
-            return False
+        return False
 
     def add_import(self, declaration: ImportDeclaration) -> None:
         """
@@ -523,7 +697,9 @@ class Context(ContextInterface):
         Args:
             declaration: Import declaration to add
         """
-        self._import_manager.add_import(declaration)
+        with self._lock:
+            self._import_manager.add_import(declaration)
+            self._version += 1
 
     def register_source_context(self, context_name: str, context: "Context") -> None:
         """
@@ -555,6 +731,7 @@ class Context(ContextInterface):
 
                 # Clear imports
                 self._import_manager.clear_imports()
+                self._version += 1
 
                 # Shutdown container
                 self._container.shutdown()
@@ -587,11 +764,24 @@ class Context(ContextInterface):
         """
         Get a summary of the context state.
 
+        The summary is cached until the context changes. Each call returns a
+        fresh copy, including the nested lists, so callers may modify it.
+
         Returns:
             Dictionary containing context summary information
         """
         with self._lock:
-            return {
+            # Children are held weakly, so their count is part of the key
+            key = (
+                self._version,
+                self._container.get_version(),
+                len(self._child_contexts),
+            )
+            cached = self._summary_cache
+            if cached is not None and cached[0] == key:
+                return _copy_summary(cached[1])
+
+            summary = {
                 "name": self._name,
                 "parent": self._parent.name if self._parent else None,
                 "component_count": self._container.get_registration_count(),
@@ -609,6 +799,8 @@ class Context(ContextInterface):
                     for decl in self._import_manager.get_imports()
                 ],
             }
+            self._summary_cache = (key, summary)
+            return _copy_summary(summary)
 
     def enable_auto_wiring(self) -> None:
         """
@@ -621,6 +813,7 @@ class Context(ContextInterface):
             with self._lock:
                 # Set auto-wiring flag to True
                 self._auto_wire = True
+                self._version += 1
                 self._container.enable_auto_wiring()
                 logger.debug(
                     "Enabled auto-wiring for context",
@@ -641,6 +834,44 @@ class Context(ContextInterface):
                 operation="enable_auto_wiring",
             ) from e
 
+    def _resolve_direct(self, interface: type[TInterface], name: str | None) -> Any:
+        """
+        Resolve a component registered in this context's own container.
+
+        Singleton instances are cached until the container's registrations
+        change. Registrations that are not singletons are remembered as such,
+        so repeat resolutions of either skip the registration and scope checks.
+
+        Args:
+            interface: Interface type to resolve
+            name: Optional component name
+
+        Returns:
+            Component instance, or _MISSING if it is not registered here
+        """
+        container = self._container
+        version = container.get_version()
+        cache_version, entries = self._resolution_cache
+        if cache_version != version:
+            entries = {}
+            self._resolution_cache = (version, entries)
+
+        # Default registrations key on the type itself; tuples re-hash per probe
+        key = interface if name is None else (interface, name)
+        entry = entries.get(key, _MISSING)
+        if entry is _NOT_SINGLETON:
+            return container.resolve(interface, name)
+        if entry is not _MISSING:
+            return entry
+
+        if not container.is_registered(interface, name):
+            return _MISSING
+        instance = container.resolve(interface, name)
+        entries[key] = (
+            instance if container.is_singleton(interface, name) else _NOT_SINGLETON
+        )
+        return instance
+
     def _register_child_context(self, child_context: "Context") -> None:
         """
         Register a child context for lifecycle management.
@@ -1,16 +1,22 @@
 from .._base import ComponentScope as ComponentScope
-from .._hooks import EventHook as EventHook, emit_event as emit_event
+from .._hooks import EventHook as EventHook, emit_event as emit_event, has_event_hooks as has_event_hooks
 from .._utils import get_logger as get_logger, log_context_creation as log_context_creation, log_error as log_error, log_import_resolution as log_import_resolution, validate_context_name as validate_context_name
 from .container_impl import Container as Container
 from .context_interface import ContextInterface as ContextInterface
 from .exceptions import ComponentResolutionError as ComponentResolutionError, ContextError as ContextError, ImportError as ImportError
 from _typeshed import Incomplete
+from collections.abc import Iterable
 from typing import Any, TypeVar
 from weakref import WeakSet
 
 T = TypeVar('T')
 TInterface = TypeVar('TInterface')
 logger: Incomplete
+_MISSING: Any
+_NOT_SINGLETON: Any
+
+def _copy_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """Copy a cached context summary so callers cannot mutate the cache."""
 
 class ImportDeclaration:
     """
@@ -19,6 +25,7 @@ class ImportDeclaration:
     This represents a cross-context dependency that needs to be resolved
     from a different context than the one making the request.
     """
+    __slots__: Incomplete
     component_type: Incomplete
     source_context: Incomplete
     name: Incomplete
@@ -50,6 +57,8 @@ class ImportManager:
     _context: Incomplete
     _imports: dict[str, ImportDeclaration]
     _source_contexts: dict[str, Context]
+    _imported_types: frozenset[type]
+    _imports_by_target: dict[tuple[type, str], ImportDeclaration]
     def __init__(self, context: Context) -> None:
         """
         Initialize the import manager.
@@ -86,10 +95,26 @@ class ImportManager:
         Raises:
             ImportError: If import cannot be resolved
         """
+    def find_import(self, component_type: type, name: str | None = None) -> ImportDeclaration | None:
+        """
+        Find the import declaration that provides a component.
+
+        Unlike resolve_import, a miss returns None instead of raising, so
+        callers probing for components that are not imported stay cheap.
+
+        Args:
+            component_type: Type of component to look up
+            name: Optional component name
+
+        Returns:
+            The matching import declaration, or None if there is none
+        """
     def get_imports(self) -> list[ImportDeclaration]:
         """Get all import declarations."""
     def get_import_count(self) -> int:
         """Get the number of imports."""
+    def has_import_for(self, component_type: type) -> bool:
+        """Check whether any import declaration provides the given type."""
     def clear_imports(self) -> None:
         """Clear all imports."""
 
@@ -105,6 +130,9 @@ class Context(ContextInterface):
     _auto_wire: Incomplete
     _lock: Incomplete
     _child_contexts: WeakSet[Context]
+    _version: int
+    _summary_cache: tuple[tuple[int, int, int], dict[str, Any]] | None
+    _resolution_cache: tuple[int, dict[type | tuple[type, str], Any]]
     _container: Container[Any]
     _import_manager: Incomplete
     def __init__(self, name: str, parent: Context | None = None, auto_wire: bool = True) -> None:
@@ -154,6 +182,19 @@ class Context(ContextInterface):
             tags: Optional component tags
             factory: Optional factory function
         """
+    def register_many(self, interfaces: Iterable[type], scope: ComponentScope = ..., tags: dict[str, Any] | None = None) -> None:
+        """
+        Register several components in this context in one batch.
+
+        Each type is registered as its own implementation under its default
+        name. The container publishes its registrations once for the batch,
+        and a registration event is still emitted per component.
+
+        Args:
+            interfaces: Interface types to register
+            scope: Component lifecycle scope shared by the batch
+            tags: Optional component tags shared by the batch
+        """
     def resolve(self, interface: type[TInterface], name: str | None = None) -> TInterface:
         """
         Resolve a component from this context or its hierarchy.
@@ -165,6 +206,22 @@ class Context(ContextInterface):
         Returns:
             Component instance
         """
+    def resolve_many(self, interface: type[TInterface], count: int, name: str | None = None) -> list[TInterface]:
+        """
+        Resolve several components from this context or its hierarchy.
+
+        Components registered directly in this context are resolved as one
+        batch, and a single resolution event is emitted for it. Components
+        from imports or parent contexts are resolved one at a time.
+
+        Args:
+            interface: Interface type to resolve
+            count: Number of instances to resolve
+            name: Optional component name
+
+        Returns:
+            List of component instances
+        """
     async def resolve_async(self, interface: type[TInterface], name: str | None = None) -> TInterface:
         """
         Asynchronously resolve a component from this context or its hierarchy.
@@ -210,6 +267,9 @@ class Context(ContextInterface):
         """
         Get a summary of the context state.
 
+        The summary is cached until the context changes. Each call returns a
+        fresh copy, including the nested lists, so callers may modify it.
+
         Returns:
             Dictionary containing context summary information
         """
@@ -220,6 +280,21 @@ class Context(ContextInterface):
         This method should be called after all components are registered
         to enable automatic dependency resolution within this context.
         """
+    def _resolve_direct(self, interface: type[TInterface], name: str | None) -> Any:
+        """
+        Resolve a component registered in this context's own container.
+
+        Singleton instances are cached until the container's registrations
+        change. Registrations that are not singletons are remembered as such,
+        so repeat resolutions of either skip the registration and scope checks.
+
+        Args:
+            interface: Interface type to resolve
+            name: Optional component name
+
+        Returns:
+            Component instance, or _MISSING if it is not registered here
+        """
     def _register_child_context(self, child_context: Context) -> None:
         """
         Register a child context for lifecycle management.
@@ -91,7 +91,14 @@ class ComponentResolutionError(ContextError):
 
 
 class CircularDependencyError(ComponentResolutionError):
-    """Exception for circular dependency detection."""
+    """
+    Exception for circular dependency detection.
+
+    ``dependency_chain`` is the resolution path as it was walked, ending with
+    the component that was requested twice. ``cycle`` holds only the
+    components on the cycle, rotated to start at the smallest name, so the
+    same cycle reached from different entry points compares equal.
+    """
 
     def __init__(
         self,
@@ -113,6 +120,17 @@ class CircularDependencyError(ComponentResolutionError):
         )
         self.dependency_chain = dependency_chain
 
+        # The repeated component closes the cycle; rotate the names it spans to
+        # start at the smallest, so every entry point yields the same cycle
+        cycle: list[str] = []
+        if dependency_chain:
+            start = dependency_chain.index(dependency_chain[-1])
+            cycle = dependency_chain[start:-1]
+        if cycle:
+            pivot = cycle.index(min(cycle))
+            cycle = cycle[pivot:] + cycle[:pivot]
+        self.cycle = tuple(cycle)
+
 
 class ScopeError(DIError):
     """Exception for component scope management errors."""
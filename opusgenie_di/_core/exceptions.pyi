@@ -36,8 +36,16 @@ class ComponentResolutionError(ContextError):
     def __init__(self, message: str, component_type: str | None = None, details: str | None = None, context_name: str | None = None, resolution_chain: list[str] | None = None) -> None: ...
 
 class CircularDependencyError(ComponentResolutionError):
-    """Exception for circular dependency detection."""
+    """
+    Exception for circular dependency detection.
+
+    ``dependency_chain`` is the resolution path as it was walked, ending with
+    the component that was requested twice. ``cycle`` holds only the
+    components on the cycle, rotated to start at the smallest name, so the
+    same cycle reached from different entry points compares equal.
+    """
     dependency_chain: Incomplete
+    cycle: tuple[str, ...]
     def __init__(self, message: str, dependency_chain: list[str] | None = None, context_name: str | None = None) -> None: ...
 
 class ScopeError(DIError):
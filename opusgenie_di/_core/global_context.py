@@ -1,10 +1,11 @@
 """Global context singleton for dependency injection."""
 
+from collections.abc import Iterable
 from threading import RLock
 from typing import Any
 
 from .._base import ComponentScope
-from .._utils import get_logger
+from .._utils import cache_debug_enabled, get_logger
 from .context_impl import Context
 
 logger = get_logger(__name__)
@@ -40,6 +41,11 @@ class GlobalContext(Context):
 
         self._initialized = True
         self._framework_components_registered = False
+        # Cached and refreshed when logging is reconfigured; the module-level
+        # resolve helpers skip their debug logs entirely when it is off, as
+        # building them costs more than resolving
+        self._resolution_log_enabled: bool
+        cache_debug_enabled(self, "_resolution_log_enabled", logger)
 
         logger.info(
             "Initialized global dependency injection context",
@@ -90,6 +96,7 @@ class GlobalContext(Context):
 
             # Clear import manager
             self._import_manager.clear_imports()
+            self._version += 1
 
             # Reset framework registration flag
             self._framework_components_registered = False
@@ -128,15 +135,27 @@ def get_global_context() -> GlobalContext:
     Returns:
         The singleton global context instance
     """
-    global _global_context
+    # Hot path: a single global load once the context exists
+    context = _global_context
+    if context is not None:
+        return context
+    return _init_global_context()
 
-    if _global_context is None:
-        with _global_context_lock:
-            if _global_context is None:
-                _global_context = GlobalContext()
-                _global_context.register_framework_components()
 
-    return _global_context
+def _init_global_context() -> GlobalContext:
+    """
+    Create the global context under the lock if it does not exist yet.
+
+    Returns:
+        The singleton global context instance
+    """
+    global _global_context
+
+    with _global_context_lock:
+        if _global_context is None:
+            _global_context = GlobalContext()
+            _global_context.register_framework_components()
+        return _global_context
 
 
 def register_global_component(
@@ -178,6 +197,34 @@ def register_global_component(
     )
 
 
+def register_global_components(
+    interfaces: Iterable[type],
+    *,
+    scope: ComponentScope = ComponentScope.SINGLETON,
+    tags: dict[str, Any] | None = None,
+) -> None:
+    """
+    Register several components in the global context in one batch.
+
+    Equivalent to calling register_global_component for each type, but the
+    container publishes its registrations once for the whole batch.
+
+    Args:
+        interfaces: Interface types to register as their own implementations
+        scope: Component lifecycle scope shared by the batch
+        tags: Optional component tags shared by the batch
+    """
+    interfaces = tuple(interfaces)
+    context = get_global_context()
+    context.register_many(interfaces, scope=scope, tags=tags)
+
+    logger.debug(
+        "Registered components in global context",
+        interfaces=[interface.__name__ for interface in interfaces],
+        scope=scope.value,
+    )
+
+
 def resolve_global_component[TInterface](
     interface: type[TInterface], name: str | None = None
 ) -> TInterface:
@@ -194,12 +241,13 @@ def resolve_global_component[TInterface](
     context = get_global_context()
     instance: TInterface = context.resolve(interface, name)
 
-    logger.debug(
-        "Resolved component from global context",
-        interface=interface.__name__,
-        name=name,
-        instance_type=type(instance).__name__,
-    )
+    if context._resolution_log_enabled:
+        logger.debug(
+            "Resolved component from global context",
+            interface=interface.__name__,
+            name=name,
+            instance_type=type(instance).__name__,
+        )
 
     return instance
 
@@ -220,12 +268,13 @@ async def resolve_global_component_async[TInterface](
     context = get_global_context()
     instance: TInterface = await context.resolve_async(interface, name)
 
-    logger.debug(
-        "Resolved component asynchronously from global context",
-        interface=interface.__name__,
-        name=name,
-        instance_type=type(instance).__name__,
-    )
+    if context._resolution_log_enabled:
+        logger.debug(
+            "Resolved component asynchronously from global context",
+            interface=interface.__name__,
+            name=name,
+            instance_type=type(instance).__name__,
+        )
 
     return instance
 
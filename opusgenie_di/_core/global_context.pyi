@@ -1,7 +1,8 @@
 from .._base import ComponentScope as ComponentScope
-from .._utils import get_logger as get_logger
+from .._utils import cache_debug_enabled as cache_debug_enabled, get_logger as get_logger
 from .context_impl import Context as Context
 from _typeshed import Incomplete
+from collections.abc import Iterable
 from typing import Any
 
 logger: Incomplete
@@ -21,6 +22,7 @@ class GlobalContext(Context):
         """Ensure singleton behavior for global context."""
     _initialized: bool
     _framework_components_registered: bool
+    _resolution_log_enabled: bool
     def __init__(self) -> None:
         """Initialize global context (only once due to singleton)."""
     def register_framework_components(self) -> None:
@@ -52,6 +54,13 @@ def get_global_context() -> GlobalContext:
     """
     Get the global dependency injection context.
 
+    Returns:
+        The singleton global context instance
+    """
+def _init_global_context() -> GlobalContext:
+    """
+    Create the global context under the lock if it does not exist yet.
+
     Returns:
         The singleton global context instance
     """
@@ -67,6 +76,18 @@ def register_global_component(interface: type, implementation: type | None = Non
         tags: Optional component tags
         factory: Optional factory function for component instantiation
     """
+def register_global_components(interfaces: Iterable[type], *, scope: ComponentScope = ..., tags: dict[str, Any] | None = None) -> None:
+    """
+    Register several components in the global context in one batch.
+
+    Equivalent to calling register_global_component for each type, but the
+    container publishes its registrations once for the whole batch.
+
+    Args:
+        interfaces: Interface types to register as their own implementations
+        scope: Component lifecycle scope shared by the batch
+        tags: Optional component tags shared by the batch
+    """
 def resolve_global_component[TInterface](interface: type[TInterface], name: str | None = None) -> TInterface:
     """
     Resolve a component from the global context.
@@ -0,0 +1,117 @@
+"""Readers-writer lock for read-dominated container state."""
+
+from collections.abc import Callable
+import threading
+from types import TracebackType
+
+
+class _LockGuard:
+    """Context manager adapter around an acquire/release pair."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(
+        self, acquire: Callable[[], None], release: Callable[[], None]
+    ) -> None:
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self) -> None:
+        self._acquire()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._release()
+
+
+class ReaderWriterLock:
+    """
+    Reentrant readers-writer lock.
+
+    Any number of threads may hold the read side at once, while the write
+    side is exclusive. Both sides are reentrant, and the thread holding the
+    write side may also take the read side. Upgrading from read to write is
+    not supported: two upgrading readers would wait on each other forever, so
+    it raises instead. Waiting writers take precedence over new readers, so a
+    steady stream of readers cannot starve them.
+
+    Usage:
+        lock = ReaderWriterLock()
+        with lock.read:
+            ...
+        with lock.write:
+            ...
+    """
+
+    def __init__(self) -> None:
+        """Initialize the lock."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers: dict[int, int] = {}
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self.read = _LockGuard(self.acquire_read, self.release_read)
+        self.write = _LockGuard(self.acquire_write, self.release_write)
+
+    def acquire_read(self) -> None:
+        """Acquire the shared read side of the lock."""
+        me = threading.get_ident()
+        with self._cond:
+            # Re-entrant reads and reads under the write side never wait, as
+            # waiting behind a queued writer would deadlock this thread
+            if self._writer != me and me not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+
+    def release_read(self) -> None:
+        """Release the shared read side of the lock."""
+        me = threading.get_ident()
+        with self._cond:
+            count = self._readers[me] - 1
+            if count:
+                self._readers[me] = count
+            else:
+                del self._readers[me]
+                self._cond.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquire the exclusive write side of the lock.
+
+        Raises:
+            RuntimeError: If the calling thread holds the read side
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            except BaseException:
+                # Readers held back for this writer may proceed again
+                self._cond.notify_all()
+                raise
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Release the exclusive write side of the lock."""
+        with self._cond:
+            if self._writer != threading.get_ident():
+                raise RuntimeError("Cannot release a write lock that is not held")
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
@@ -0,0 +1,47 @@
+from collections.abc import Callable
+from types import TracebackType
+
+class _LockGuard:
+    """Context manager adapter around an acquire/release pair."""
+    __slots__ = ('_acquire', '_release')
+    _acquire: Callable[[], None]
+    _release: Callable[[], None]
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]) -> None: ...
+    def __enter__(self) -> None: ...
+    def __exit__(self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None) -> None: ...
+
+class ReaderWriterLock:
+    """
+    Reentrant readers-writer lock.
+
+    Any number of threads may hold the read side at once, while the write
+    side is exclusive. Both sides are reentrant, and the thread holding the
+    write side may also take the read side. Upgrading from read to write is
+    not supported: two upgrading readers would wait on each other forever, so
+    it raises instead. Waiting writers take precedence over new readers, so a
+    steady stream of readers cannot starve them.
+
+    Usage:
+        lock = ReaderWriterLock()
+        with lock.read:
+            ...
+        with lock.write:
+            ...
+    """
+    read: _LockGuard
+    write: _LockGuard
+    def __init__(self) -> None:
+        """Initialize the lock."""
+    def acquire_read(self) -> None:
+        """Acquire the shared read side of the lock."""
+    def release_read(self) -> None:
+        """Release the shared read side of the lock."""
+    def acquire_write(self) -> None:
+        """
+        Acquire the exclusive write side of the lock.
+
+        Raises:
+            RuntimeError: If the calling thread holds the read side
+        """
+    def release_write(self) -> None:
+        """Release the exclusive write side of the lock."""
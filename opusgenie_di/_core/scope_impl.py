@@ -2,16 +2,16 @@
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
+import itertools
 import threading
 from typing import Any, TypeVar
-import uuid
 from weakref import WeakValueDictionary
 
 from .._base import ComponentScope
-from .._utils import get_logger, log_error
+from .._utils import cache_debug_enabled, get_logger, log_error
 from .event_loop_manager import get_event_loop_manager, run_async_safely
 from .exceptions import ScopeError
 from .scope_interface import ScopeManagerInterface
@@ -23,6 +23,16 @@ logger = get_logger(__name__)
 # Context variable to track the current scope
 _current_scope: ContextVar[str | None] = ContextVar("current_scope", default=None)
 
+# Sentinel for cached instance lookups; None is a valid instance
+_MISSING: Any = object()
+
+# Scope ids only need to be unique within the process, as the current scope
+# variable is shared by all managers; a counter avoids a uuid4 per scope
+_scope_ids = itertools.count(1)
+
+# Disposal hooks in order of preference; only the first one found is called
+_DISPOSAL_METHODS = ("cleanup", "dispose", "close", "shutdown")
+
 
 class ScopeManager(ScopeManagerInterface):
     """
@@ -47,6 +57,29 @@ class ScopeManager(ScopeManagerInterface):
             WeakValueDictionary()
         )
         self._lifecycle_callback = lifecycle_callback
+        # Scope entry/exit and scoped creation logs are skipped unless debug is
+        # on; the flag is refreshed when logging is reconfigured
+        self._log_enabled: bool
+        cache_debug_enabled(self, "_log_enabled", logger)
+        # Creators per scope, so get_or_create dispatches with one lookup; all
+        # take (key, factory), and the uncached scopes ignore the key
+        self._creators: dict[
+            ComponentScope, Callable[[str, Callable[[], Any]], Any]
+        ] = {
+            ComponentScope.SINGLETON: self._get_or_create_singleton,
+            ComponentScope.TRANSIENT: self._create_transient,
+            ComponentScope.SCOPED: self._get_or_create_scoped,
+            ComponentScope.FACTORY: self._create_factory,
+        }
+        self._async_creators: dict[
+            ComponentScope,
+            Callable[[str, Callable[[], Coroutine[Any, Any, Any]]], Awaitable[Any]],
+        ] = {
+            ComponentScope.SINGLETON: self._get_or_create_singleton_async,
+            ComponentScope.TRANSIENT: self._create_transient_async,
+            ComponentScope.SCOPED: self._get_or_create_scoped_async,
+            ComponentScope.FACTORY: self._create_factory_async,
+        }
 
     def _trigger_lifecycle_event(self, event: str, **kwargs: Any) -> None:
         """Trigger a lifecycle event callback if configured."""
@@ -75,21 +108,23 @@ class ScopeManager(ScopeManagerInterface):
         Returns:
             Component instance
         """
+        # Singleton hits skip the dispatch and the lock: instances are only
+        # stored under the lock, so a hit is always a fully created instance
+        if scope is ComponentScope.SINGLETON:
+            instance = self._singletons.get(key, _MISSING)
+            if instance is not _MISSING:
+                return instance  # type: ignore[no-any-return]
+
         try:
-            with self._lock:
-                if scope == ComponentScope.SINGLETON:
-                    return self._get_or_create_singleton(key, factory)
-                if scope == ComponentScope.TRANSIENT:
-                    return self._create_transient(factory)
-                if scope == ComponentScope.SCOPED:
-                    return self._get_or_create_scoped(key, factory)
-                if scope == ComponentScope.FACTORY:
-                    return self._create_factory(factory)
-                raise ScopeError(
-                    f"Unsupported scope: {scope}",
-                    scope=scope.value,
-                    details=f"Scope {scope.value} is not supported by this manager",
-                )
+            creator = self._creators.get(scope)
+            if creator is not None:
+                with self._lock:
+                    return creator(key, factory)  # type: ignore[no-any-return]
+            raise ScopeError(
+                f"Unsupported scope: {scope}",
+                scope=scope.value,
+                details=f"Scope {scope.value} is not supported by this manager",
+            )
 
         except Exception as e:
             log_error(
@@ -123,14 +158,9 @@ class ScopeManager(ScopeManagerInterface):
         try:
             # For async operations, we need to handle locking carefully
             # to avoid blocking the event loop
-            if scope == ComponentScope.SINGLETON:
-                return await self._get_or_create_singleton_async(key, factory)
-            if scope == ComponentScope.TRANSIENT:
-                return await self._create_transient_async(factory)
-            if scope == ComponentScope.SCOPED:
-                return await self._get_or_create_scoped_async(key, factory)
-            if scope == ComponentScope.FACTORY:
-                return await self._create_factory_async(factory)
+            creator = self._async_creators.get(scope)
+            if creator is not None:
+                return await creator(key, factory)  # type: ignore[no-any-return]
             raise ScopeError(
                 f"Unsupported scope: {scope}",
                 scope=scope.value,
@@ -286,19 +316,21 @@ class ScopeManager(ScopeManagerInterface):
         Returns:
             Context manager that provides a new scope for scoped components
         """
-        scope_id = str(uuid.uuid4())
+        scope_id = f"scope-{next(_scope_ids)}"
         token = _current_scope.set(scope_id)
         try:
-            logger.debug("Created scope context", scope_id=scope_id)
+            if self._log_enabled:
+                logger.debug("Created scope context", scope_id=scope_id)
             yield scope_id
         finally:
             # Clean up scope when exiting
             with self._lock:
-                if scope_id in self._scoped_instances:
-                    self._dispose_instances(self._scoped_instances[scope_id].values())
-                    del self._scoped_instances[scope_id]
+                scoped = self._scoped_instances.pop(scope_id, None)
+                if scoped:
+                    self._dispose_instances(scoped.values())
             _current_scope.reset(token)
-            logger.debug("Disposed scope context", scope_id=scope_id)
+            if self._log_enabled:
+                logger.debug("Disposed scope context", scope_id=scope_id)
 
     def has_active_scope(self) -> bool:
         """
@@ -313,8 +345,9 @@ class ScopeManager(ScopeManagerInterface):
 
     def _get_or_create_singleton(self, key: str, factory: Callable[[], T]) -> T:
         """Get or create a singleton instance."""
-        if key in self._singletons:
-            return self._singletons[key]  # type: ignore[no-any-return]
+        instance = self._singletons.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance  # type: ignore[no-any-return]
 
         instance = factory()
         self._singletons[key] = instance
@@ -362,8 +395,8 @@ class ScopeManager(ScopeManagerInterface):
             )
             return instance
 
-    def _create_transient(self, factory: Callable[[], T]) -> T:
-        """Create a transient instance."""
+    def _create_transient(self, key: str, factory: Callable[[], T]) -> T:
+        """Create a transient instance; the key is unused."""
         instance = factory()
         self._track_disposable(instance)
         logger.debug(
@@ -372,9 +405,9 @@ class ScopeManager(ScopeManagerInterface):
         return instance
 
     async def _create_transient_async(
-        self, factory: Callable[[], Coroutine[Any, Any, T]]
+        self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]
     ) -> T:
-        """Asynchronously create a transient instance."""
+        """Asynchronously create a transient instance; the key is unused."""
         instance = await factory()
         self._track_disposable(instance)
         logger.debug(
@@ -388,20 +421,23 @@ class ScopeManager(ScopeManagerInterface):
 
         # If no scope is active, behave like transient
         if current_scope is None:
-            return self._create_transient(factory)
+            return self._create_transient(key, factory)
 
-        if key in self._scoped_instances[current_scope]:
-            return self._scoped_instances[current_scope][key]  # type: ignore[no-any-return]
+        scoped = self._scoped_instances[current_scope]
+        instance = scoped.get(key, _MISSING)
+        if instance is not _MISSING:
+            return instance  # type: ignore[no-any-return]
 
         instance = factory()
-        self._scoped_instances[current_scope][key] = instance
+        scoped[key] = instance
         self._track_disposable(instance)
-        logger.debug(
-            "Created scoped instance",
-            key=key,
-            scope=current_scope,
-            instance_type=type(instance).__name__,
-        )
+        if self._log_enabled:
+            logger.debug(
+                "Created scoped instance",
+                key=key,
+                scope=current_scope,
+                instance_type=type(instance).__name__,
+            )
 
         # Trigger lifecycle event
         self._trigger_lifecycle_event(
@@ -422,7 +458,7 @@ class ScopeManager(ScopeManagerInterface):
 
         # If no scope is active, behave like transient
         if current_scope is None:
-            return await self._create_transient_async(factory)
+            return await self._create_transient_async(key, factory)
 
         # Check if instance already exists
         with self._lock:
@@ -449,17 +485,17 @@ class ScopeManager(ScopeManagerInterface):
             )
             return instance
 
-    def _create_factory(self, factory: Callable[[], T]) -> T:
-        """Create an instance using factory method."""
+    def _create_factory(self, key: str, factory: Callable[[], T]) -> T:
+        """Create an instance using factory method; the key is unused."""
         instance = factory()
         self._track_disposable(instance)
         logger.debug("Created factory instance", instance_type=type(instance).__name__)
         return instance
 
     async def _create_factory_async(
-        self, factory: Callable[[], Coroutine[Any, Any, T]]
+        self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]
     ) -> T:
-        """Asynchronously create an instance using factory method."""
+        """Asynchronously create an instance using factory method; the key is unused."""
         instance = await factory()
         self._track_disposable(instance)
         logger.debug(
@@ -474,10 +510,8 @@ class ScopeManager(ScopeManagerInterface):
 
     def _has_disposal_methods(self, instance: Any) -> bool:
         """Check if an instance has disposal methods."""
-        disposal_methods = ["cleanup", "dispose", "close", "shutdown"]
         return any(
-            hasattr(instance, method) and callable(getattr(instance, method))
-            for method in disposal_methods
+            callable(getattr(instance, method, None)) for method in _DISPOSAL_METHODS
         )
 
     def _dispose_instances(self, instances: Any) -> None:
@@ -489,79 +523,59 @@ class ScopeManager(ScopeManagerInterface):
         """Dispose of a single instance using event loop manager."""
         try:
             get_event_loop_manager()
-
-            # Try cleanup methods in order of preference
-            cleanup_methods = [
-                (
-                    "cleanup",
-                    instance.cleanup
-                    if hasattr(instance, "cleanup") and callable(instance.cleanup)
-                    else None,
-                ),
-                (
-                    "dispose",
-                    instance.dispose
-                    if hasattr(instance, "dispose") and callable(instance.dispose)
-                    else None,
-                ),
-                (
-                    "close",
-                    instance.close
-                    if hasattr(instance, "close") and callable(instance.close)
-                    else None,
-                ),
-                (
-                    "shutdown",
-                    instance.shutdown
-                    if hasattr(instance, "shutdown") and callable(instance.shutdown)
-                    else None,
-                ),
-            ]
-
-            for method_name, method in cleanup_methods:
-                if method is not None:
-                    if asyncio.iscoroutinefunction(method):
-                        # Handle async cleanup using event loop manager
-                        result = run_async_safely(method())
-                        if result is not None:  # Success
+            log_enabled = self._log_enabled
+
+            # Look hooks up in order of preference, stopping at the first one
+            # found, rather than binding all of them for every instance
+            for method_name in _DISPOSAL_METHODS:
+                method = getattr(instance, method_name, None)
+                if not callable(method):
+                    continue
+                if asyncio.iscoroutinefunction(method):
+                    # Handle async cleanup using event loop manager
+                    result = run_async_safely(method())
+                    if result is not None:  # Success
+                        if log_enabled:
                             logger.debug(
                                 "Disposed instance using async method",
                                 instance_type=type(instance).__name__,
                                 method=method_name,
                             )
-                            # Trigger disposal lifecycle event for successful async disposal
-                            self._trigger_lifecycle_event(
-                                "instance_disposed",
-                                component_type=type(instance).__name__,
-                                method=method_name,
-                            )
-                        else:  # Failed
-                            logger.warning(
-                                "Failed to dispose instance using async method",
-                                instance_type=type(instance).__name__,
-                                method=method_name,
-                            )
-                    else:
-                        # Handle sync cleanup
-                        method()
+                        # Trigger disposal lifecycle event for successful async disposal
+                        self._trigger_lifecycle_event(
+                            "instance_disposed",
+                            component_type=type(instance).__name__,
+                            method=method_name,
+                        )
+                    else:  # Failed
+                        logger.warning(
+                            "Failed to dispose instance using async method",
+                            instance_type=type(instance).__name__,
+                            method=method_name,
+                        )
+                else:
+                    # Handle sync cleanup
+                    method()
+                    if log_enabled:
                         logger.debug(
                             "Disposed instance using sync method",
                             instance_type=type(instance).__name__,
                             method=method_name,
                         )
 
-                    # Trigger disposal lifecycle event
-                    self._trigger_lifecycle_event(
-                        "instance_disposed",
-                        component_type=type(instance).__name__,
-                        method=method_name,
-                    )
-                    break  # Only call the first available method
-            else:
-                logger.debug(
-                    "No disposal method found for instance",
-                    instance_type=type(instance).__name__,
+                # Trigger disposal lifecycle event
+                self._trigger_lifecycle_event(
+                    "instance_disposed",
+                    component_type=type(instance).__name__,
+                    method=method_name,
                 )
+                break  # Only call the first available method
+            else:
+                if log_enabled:
+                    logger.debug(
+                        "No disposal method found for instance",
+                        instance_type=type(instance).__name__,
+                    )
 
         except Exception as e:
             logger.warning(
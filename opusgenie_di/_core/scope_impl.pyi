@@ -1,10 +1,10 @@
 from .._base import ComponentScope as ComponentScope
-from .._utils import get_logger as get_logger, log_error as log_error
+from .._utils import cache_debug_enabled as cache_debug_enabled, get_logger as get_logger, log_error as log_error
 from .event_loop_manager import get_event_loop_manager as get_event_loop_manager, run_async_safely as run_async_safely
 from .exceptions import ScopeError as ScopeError
 from .scope_interface import ScopeManagerInterface as ScopeManagerInterface
 from _typeshed import Incomplete
-from collections.abc import Callable as Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable as Callable, Coroutine, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Any, TypeVar
@@ -13,6 +13,9 @@ from weakref import WeakValueDictionary
 T = TypeVar('T')
 logger: Incomplete
 _current_scope: ContextVar[str | None]
+_MISSING: Any
+_scope_ids: Incomplete
+_DISPOSAL_METHODS: tuple[str, ...]
 
 class ScopeManager(ScopeManagerInterface):
     """
@@ -26,6 +29,9 @@ class ScopeManager(ScopeManagerInterface):
     _scoped_instances: dict[str, dict[str, Any]]
     _disposable_instances: WeakValueDictionary[int, Any]
     _lifecycle_callback: Incomplete
+    _log_enabled: bool
+    _creators: dict[ComponentScope, Callable[[str, Callable[[], Any]], Any]]
+    _async_creators: dict[ComponentScope, Callable[[str, Callable[[], Coroutine[Any, Any, Any]]], Awaitable[Any]]]
     def __init__(self, lifecycle_callback: Callable[..., None] | None = None) -> None:
         """
         Initialize the scope manager.
@@ -135,18 +141,18 @@ class ScopeManager(ScopeManagerInterface):
         """Get or create a singleton instance."""
     async def _get_or_create_singleton_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
         """Asynchronously get or create a singleton instance."""
-    def _create_transient(self, factory: Callable[[], T]) -> T:
-        """Create a transient instance."""
-    async def _create_transient_async(self, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
-        """Asynchronously create a transient instance."""
+    def _create_transient(self, key: str, factory: Callable[[], T]) -> T:
+        """Create a transient instance; the key is unused."""
+    async def _create_transient_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Asynchronously create a transient instance; the key is unused."""
     def _get_or_create_scoped(self, key: str, factory: Callable[[], T]) -> T:
         """Get or create a scoped instance."""
     async def _get_or_create_scoped_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
         """Asynchronously get or create a scoped instance."""
-    def _create_factory(self, factory: Callable[[], T]) -> T:
-        """Create an instance using factory method."""
-    async def _create_factory_async(self, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
-        """Asynchronously create an instance using factory method."""
+    def _create_factory(self, key: str, factory: Callable[[], T]) -> T:
+        """Create an instance using factory method; the key is unused."""
+    async def _create_factory_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """Asynchronously create an instance using factory method; the key is unused."""
     def _track_disposable(self, instance: Any) -> None:
         """Track an instance for disposal if it has disposal methods."""
     def _has_disposal_methods(self, instance: Any) -> bool:
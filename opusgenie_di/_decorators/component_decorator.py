@@ -6,7 +6,7 @@ from typing import Any, TypeVar
 from .._base import ComponentLayer, ComponentScope
 from .._core import get_global_context
 from .._hooks import EventHook, emit_event
-from .._utils import get_logger, log_error
+from .._utils import get_logger, is_debug_enabled, log_error
 from .decorator_options import ComponentOptions
 from .decorator_utils import (
     create_metadata_dict,
@@ -96,20 +96,22 @@ def og_component(
             )
             cls._og_enhanced_tags = enhanced_tags  # type: ignore[attr-defined]
 
-            # Log decorator application
-            decorator_sig = get_decorator_signature(
-                "og_component",
-                scope=options.scope.value,
-                layer=options.layer.value if options.layer else None,
-                context=options.context_name,
-                auto_register=options.auto_register,
-            )
-            logger.debug(
-                "Applied component decorator",
-                class_name=cls.__name__,
-                module=cls.__module__,
-                decorator_signature=decorator_sig,
-            )
+            # Log decorator application; the signature string is only built
+            # when it would actually be emitted
+            if is_debug_enabled(logger):
+                decorator_sig = get_decorator_signature(
+                    "og_component",
+                    scope=options.scope.value,
+                    layer=options.layer.value if options.layer else None,
+                    context=options.context_name,
+                    auto_register=options.auto_register,
+                )
+                logger.debug(
+                    "Applied component decorator",
+                    class_name=cls.__name__,
+                    module=cls.__module__,
+                    decorator_signature=decorator_sig,
+                )
 
             # Auto-register if enabled
             if options.auto_register:
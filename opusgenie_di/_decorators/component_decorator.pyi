@@ -1,7 +1,7 @@
 from .._base import ComponentLayer as ComponentLayer, ComponentScope as ComponentScope
 from .._core import get_global_context as get_global_context
 from .._hooks import EventHook as EventHook, emit_event as emit_event
-from .._utils import get_logger as get_logger, log_error as log_error
+from .._utils import get_logger as get_logger, is_debug_enabled as is_debug_enabled, log_error as log_error
 from .decorator_options import ComponentOptions as ComponentOptions
 from .decorator_utils import create_metadata_dict as create_metadata_dict, detect_component_layer as detect_component_layer, enhance_component_tags as enhance_component_tags, get_decorator_signature as get_decorator_signature, validate_decorator_target as validate_decorator_target
 from _typeshed import Incomplete
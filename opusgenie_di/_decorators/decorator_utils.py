@@ -1,5 +1,6 @@
 """Shared utilities for decorators."""
 
+import functools
 from typing import Any
 
 from .._base import ComponentLayer
@@ -8,133 +9,128 @@ from .._utils import get_class_name, get_logger
 logger = get_logger(__name__)
 
 
-def detect_component_layer(cls: type) -> ComponentLayer | None:
+# Naming-convention indicators per layer, checked in this order
+_LAYER_INDICATORS: tuple[tuple[ComponentLayer, tuple[str, ...]], ...] = (
+    (
+        ComponentLayer.INFRASTRUCTURE,
+        (
+            "repository",
+            "dao",
+            "client",
+            "adapter",
+            "gateway",
+            "connector",
+            "driver",
+            "database",
+            "cache",
+            "storage",
+        ),
+    ),
+    (
+        ComponentLayer.APPLICATION,
+        (
+            "service",
+            "usecase",
+            "application",
+            "workflow",
+            "orchestrator",
+            "coordinator",
+            "manager",
+            "handler",
+        ),
+    ),
+    (
+        ComponentLayer.DOMAIN,
+        (
+            "entity",
+            "aggregate",
+            "valueobject",
+            "domain",
+            "model",
+            "specification",
+            "policy",
+            "rule",
+        ),
+    ),
+    (
+        ComponentLayer.FRAMEWORK,
+        (
+            "framework",
+            "component",
+            "provider",
+            "factory",
+            "builder",
+            "resolver",
+            "interceptor",
+            "filter",
+            "middleware",
+        ),
+    ),
+    (
+        ComponentLayer.PRESENTATION,
+        (
+            "controller",
+            "endpoint",
+            "resource",
+            "presenter",
+            "view",
+            "api",
+            "rest",
+            "graphql",
+            "web",
+        ),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _match_layer_indicator(
+    class_name: str,
+) -> tuple[ComponentLayer, str] | tuple[None, None]:
     """
-    Auto-detect the architectural layer of a component based on naming conventions.
+    Find the first layer indicator contained in a lowercased class name.
+
+    The result depends only on the name, so it is shared by every class
+    with that name and by repeated lookups while decorating one class.
 
     Args:
-        cls: The component class
+        class_name: Lowercased class name
 
     Returns:
-        Detected layer or None if cannot be determined
+        The detected layer and the matching indicator, or (None, None)
     """
-    class_name = get_class_name(cls).lower()
-
-    # Infrastructure layer indicators
-    infrastructure_indicators = [
-        "repository",
-        "dao",
-        "client",
-        "adapter",
-        "gateway",
-        "connector",
-        "driver",
-        "database",
-        "cache",
-        "storage",
-    ]
+    for layer, indicators in _LAYER_INDICATORS:
+        for indicator in indicators:
+            if indicator in class_name:
+                return layer, indicator
+    return None, None
 
-    # Application layer indicators
-    application_indicators = [
-        "service",
-        "usecase",
-        "application",
-        "workflow",
-        "orchestrator",
-        "coordinator",
-        "manager",
-        "handler",
-    ]
 
-    # Domain layer indicators
-    domain_indicators = [
-        "entity",
-        "aggregate",
-        "valueobject",
-        "domain",
-        "model",
-        "specification",
-        "policy",
-        "rule",
-    ]
+def detect_component_layer(cls: type) -> ComponentLayer | None:
+    """
+    Auto-detect the architectural layer of a component based on naming conventions.
 
-    # Framework layer indicators
-    framework_indicators = [
-        "framework",
-        "component",
-        "provider",
-        "factory",
-        "builder",
-        "resolver",
-        "interceptor",
-        "filter",
-        "middleware",
-    ]
+    Args:
+        cls: The component class
 
-    # Presentation layer indicators
-    presentation_indicators = [
-        "controller",
-        "endpoint",
-        "resource",
-        "presenter",
-        "view",
-        "api",
-        "rest",
-        "graphql",
-        "web",
-    ]
+    Returns:
+        Detected layer or None if cannot be determined
+    """
+    layer, indicator = _match_layer_indicator(get_class_name(cls).lower())
 
-    # Check each layer
-    for indicator in infrastructure_indicators:
-        if indicator in class_name:
-            logger.debug(
-                "Detected infrastructure layer",
-                class_name=cls.__name__,
-                indicator=indicator,
-            )
-            return ComponentLayer.INFRASTRUCTURE
-
-    for indicator in application_indicators:
-        if indicator in class_name:
-            logger.debug(
-                "Detected application layer",
-                class_name=cls.__name__,
-                indicator=indicator,
-            )
-            return ComponentLayer.APPLICATION
-
-    for indicator in domain_indicators:
-        if indicator in class_name:
-            logger.debug(
-                "Detected domain layer",
-                class_name=cls.__name__,
-                indicator=indicator,
-            )
-            return ComponentLayer.DOMAIN
-
-    for indicator in framework_indicators:
-        if indicator in class_name:
-            logger.debug(
-                "Detected framework layer",
-                class_name=cls.__name__,
-                indicator=indicator,
-            )
-            return ComponentLayer.FRAMEWORK
-
-    for indicator in presentation_indicators:
-        if indicator in class_name:
-            logger.debug(
-                "Detected presentation layer",
-                class_name=cls.__name__,
-                indicator=indicator,
-            )
-            return ComponentLayer.PRESENTATION
+    if layer is None:
+        logger.debug(
+            "Could not auto-detect component layer",
+            class_name=cls.__name__,
+        )
+        return None
 
     logger.debug(
-        "Could not auto-detect component layer",
+        f"Detected {layer.value} layer",
         class_name=cls.__name__,
+        indicator=indicator,
     )
-    return None
+    return layer
 
 
 def enhance_component_tags(cls: type, existing_tags: dict[str, str]) -> dict[str, str]:
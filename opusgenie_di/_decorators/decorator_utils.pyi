@@ -5,6 +5,21 @@ from typing import Any
 
 logger: Incomplete
 
+_LAYER_INDICATORS: tuple[tuple[ComponentLayer, tuple[str, ...]], ...]
+
+def _match_layer_indicator(class_name: str) -> tuple[ComponentLayer, str] | tuple[None, None]:
+    """
+    Find the first layer indicator contained in a lowercased class name.
+
+    The result depends only on the name, so it is shared by every class
+    with that name and by repeated lookups while decorating one class.
+
+    Args:
+        class_name: Lowercased class name
+
+    Returns:
+        The detected layer and the matching indicator, or (None, None)
+    """
 def detect_component_layer(cls) -> ComponentLayer | None:
     """
     Auto-detect the architectural layer of a component based on naming conventions.
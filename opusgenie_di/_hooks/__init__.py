@@ -7,6 +7,7 @@ from .event_hooks import (
     clear_all_hooks,
     emit_event,
     get_hook_manager,
+    has_event_hooks,
     register_hook,
     set_hooks_enabled,
     unregister_hook,
@@ -52,6 +53,7 @@ __all__ = [
     "register_hook",
     "unregister_hook",
     "emit_event",
+    "has_event_hooks",
     "clear_all_hooks",
     "set_hooks_enabled",
     # Lifecycle hooks
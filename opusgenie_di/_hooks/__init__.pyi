@@ -1,5 +1,5 @@
-from .event_hooks import EventHook as EventHook, EventHookManager as EventHookManager, HookFunction as HookFunction, clear_all_hooks as clear_all_hooks, emit_event as emit_event, get_hook_manager as get_hook_manager, register_hook as register_hook, set_hooks_enabled as set_hooks_enabled, unregister_hook as unregister_hook
+from .event_hooks import EventHook as EventHook, EventHookManager as EventHookManager, HookFunction as HookFunction, clear_all_hooks as clear_all_hooks, emit_event as emit_event, get_hook_manager as get_hook_manager, has_event_hooks as has_event_hooks, register_hook as register_hook, set_hooks_enabled as set_hooks_enabled, unregister_hook as unregister_hook
 from .hook_manager import HookManager as HookManager, clear_all_hooks as clear_all_hooks_global, emit_event as emit_event_global, emit_lifecycle_event as emit_lifecycle_event_global, get_global_hook_manager as get_global_hook_manager, get_hooks_summary as get_hooks_summary, register_event_hook as register_event_hook_global, register_lifecycle_hook as register_lifecycle_hook_global, set_hooks_enabled as set_hooks_enabled_global
 from .lifecycle_hooks import LifecycleHook as LifecycleHook, LifecycleHookFunction as LifecycleHookFunction, LifecycleHookManager as LifecycleHookManager, emit_lifecycle_event as emit_lifecycle_event, get_lifecycle_hook_manager as get_lifecycle_hook_manager, register_lifecycle_hook as register_lifecycle_hook
 
-__all__ = ['EventHook', 'EventHookManager', 'HookFunction', 'get_hook_manager', 'register_hook', 'unregister_hook', 'emit_event', 'clear_all_hooks', 'set_hooks_enabled', 'LifecycleHook', 'LifecycleHookFunction', 'LifecycleHookManager', 'get_lifecycle_hook_manager', 'register_lifecycle_hook', 'emit_lifecycle_event', 'HookManager', 'get_global_hook_manager', 'register_event_hook_global', 'register_lifecycle_hook_global', 'emit_event_global', 'emit_lifecycle_event_global', 'clear_all_hooks_global', 'set_hooks_enabled_global', 'get_hooks_summary']
+__all__ = ['EventHook', 'EventHookManager', 'HookFunction', 'get_hook_manager', 'register_hook', 'unregister_hook', 'emit_event', 'has_event_hooks', 'clear_all_hooks', 'set_hooks_enabled', 'LifecycleHook', 'LifecycleHookFunction', 'LifecycleHookManager', 'get_lifecycle_hook_manager', 'register_lifecycle_hook', 'emit_lifecycle_event', 'HookManager', 'get_global_hook_manager', 'register_event_hook_global', 'register_lifecycle_hook_global', 'emit_event_global', 'emit_lifecycle_event_global', 'clear_all_hooks_global', 'set_hooks_enabled_global', 'get_hooks_summary']
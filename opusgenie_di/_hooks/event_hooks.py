@@ -54,6 +54,9 @@ class EventHookManager:
         """Initialize the hook manager."""
         self._hooks: dict[EventHook, list[HookFunction]] = defaultdict(list)
         self._enabled = True
+        # Total registered hooks; lets emit() return without hashing the event
+        # in the common case where nothing is registered at all
+        self._hook_count = 0
 
     def register_hook(self, event: EventHook, hook_function: HookFunction) -> None:
         """
@@ -67,6 +70,7 @@ class EventHookManager:
             raise ValueError("Hook function must be callable")
 
         self._hooks[event].append(hook_function)
+        self._hook_count += 1
         logger.debug(
             "Registered event hook",
             event_type=event.value,
@@ -86,6 +90,7 @@ class EventHookManager:
         """
         if hook_function in self._hooks[event]:
             self._hooks[event].remove(hook_function)
+            self._hook_count -= 1
             logger.debug(
                 "Unregistered event hook",
                 event_type=event.value,
@@ -102,7 +107,7 @@ class EventHookManager:
             event: The event to emit
             event_data: Data to pass to hook functions
         """
-        if not self._enabled:
+        if not self._enabled or not self._hook_count:
             return
 
         if event not in self._hooks or not self._hooks[event]:
@@ -127,6 +132,21 @@ class EventHookManager:
                 )
                 # Continue with other hooks even if one fails
 
+    def has_hooks(self, event: EventHook) -> bool:
+        """
+        Check whether emitting an event would call any hook.
+
+        Callers on hot paths use this to skip building event data nobody
+        receives.
+
+        Args:
+            event: The event to check
+
+        Returns:
+            True if hooks are enabled and at least one is registered for the event
+        """
+        return bool(self._enabled and self._hook_count and self._hooks.get(event))
+
     def get_hook_count(self, event: EventHook | None = None) -> int:
         """
         Get the number of registered hooks.
@@ -150,8 +170,10 @@ class EventHookManager:
         """
         if event is None:
             self._hooks.clear()
+            self._hook_count = 0
             logger.debug("Cleared all event hooks")
         else:
+            self._hook_count -= len(self._hooks[event])
             self._hooks[event].clear()
             logger.debug("Cleared event hooks", event_type=event.value)
 
@@ -225,6 +247,21 @@ def emit_event(event: EventHook, event_data: dict[str, Any]) -> None:
     _global_hook_manager.emit(event, event_data)
 
 
+def has_event_hooks(event: EventHook) -> bool:
+    """
+    Check whether emitting an event would call any hook.
+
+    This is a convenience function that uses the global hook manager.
+
+    Args:
+        event: The event to check
+
+    Returns:
+        True if hooks are enabled and at least one is registered for the event
+    """
+    return _global_hook_manager.has_hooks(event)
+
+
 def clear_all_hooks() -> None:
     """Clear all registered hooks."""
     _global_hook_manager.clear_hooks()
@@ -31,6 +31,7 @@ class EventHookManager:
     """
     _hooks: dict[EventHook, list[HookFunction]]
     _enabled: bool
+    _hook_count: int
     def __init__(self) -> None:
         """Initialize the hook manager."""
     def register_hook(self, event: EventHook, hook_function: HookFunction) -> None:
@@ -60,6 +61,19 @@ class EventHookManager:
             event: The event to emit
             event_data: Data to pass to hook functions
         """
+    def has_hooks(self, event: EventHook) -> bool:
+        """
+        Check whether emitting an event would call any hook.
+
+        Callers on hot paths use this to skip building event data nobody
+        receives.
+
+        Args:
+            event: The event to check
+
+        Returns:
+            True if hooks are enabled and at least one is registered for the event
+        """
     def get_hook_count(self, event: EventHook | None = None) -> int:
         """
         Get the number of registered hooks.
@@ -126,6 +140,18 @@ def emit_event(event: EventHook, event_data: dict[str, Any]) -> None:
         event: The event to emit
         event_data: Data to pass to hook functions
     """
+def has_event_hooks(event: EventHook) -> bool:
+    """
+    Check whether emitting an event would call any hook.
+
+    This is a convenience function that uses the global hook manager.
+
+    Args:
+        event: The event to check
+
+    Returns:
+        True if hooks are enabled and at least one is registered for the event
+    """
 def clear_all_hooks() -> None:
     """Clear all registered hooks."""
 def set_hooks_enabled(enabled: bool) -> None:
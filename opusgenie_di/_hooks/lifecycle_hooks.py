@@ -50,6 +50,9 @@ class LifecycleHookManager:
         self._hooks: dict[LifecycleHook, list[LifecycleHookFunction]] = defaultdict(
             list
         )
+        # Total registered hooks; lets emit_lifecycle_event() return before
+        # any lookup while no hook is registered
+        self._hook_count = 0
 
     def register_lifecycle_hook(
         self, hook: LifecycleHook, hook_function: LifecycleHookFunction
@@ -65,6 +68,7 @@ class LifecycleHookManager:
             raise ValueError("Hook function must be callable")
 
         self._hooks[hook].append(hook_function)
+        self._hook_count += 1
         logger.debug(
             "Registered lifecycle hook",
             hook_type=hook.value,
@@ -87,7 +91,7 @@ class LifecycleHookManager:
             stage: Optional lifecycle stage
             **extra_data: Additional data to include in the event
         """
-        if hook not in self._hooks or not self._hooks[hook]:
+        if not self._hook_count or not self._hooks.get(hook):
             return
 
         event_data = {
@@ -142,6 +146,7 @@ class LifecycleHookManager:
     def clear_lifecycle_hooks(self) -> None:
         """Clear all lifecycle hooks."""
         self._hooks.clear()
+        self._hook_count = 0
         logger.debug("Cleared all lifecycle hooks")
 
 
@@ -32,6 +32,7 @@ class LifecycleHookManager:
     shutdown, and cleanup.
     """
     _hooks: dict[LifecycleHook, list[LifecycleHookFunction]]
+    _hook_count: int
     def __init__(self) -> None:
         """Initialize the lifecycle hook manager."""
     def register_lifecycle_hook(self, hook: LifecycleHook, hook_function: LifecycleHookFunction) -> None:
@@ -14,7 +14,10 @@ from .helpers import (
     truncate_string,
 )
 from .logging import (
+    cache_debug_enabled,
+    configure_logging,
     get_logger,
+    is_debug_enabled,
     log_component_registration,
     log_component_resolution,
     log_context_creation,
@@ -24,6 +27,7 @@ from .logging import (
     log_module_registration,
     log_warning,
     logger,
+    refresh_log_levels,
 )
 from .type_helpers import (
     extract_non_none_types,
@@ -52,6 +56,10 @@ __all__ = [
     # Logging
     "get_logger",
     "logger",
+    "is_debug_enabled",
+    "cache_debug_enabled",
+    "configure_logging",
+    "refresh_log_levels",
     "log_component_registration",
     "log_component_resolution",
     "log_context_creation",
@@ -1,6 +1,6 @@
 from .helpers import create_unique_key as create_unique_key, ensure_coroutine as ensure_coroutine, filter_none_values as filter_none_values, get_class_name as get_class_name, get_module_name as get_module_name, merge_dicts as merge_dicts, run_async_in_sync as run_async_in_sync, safe_getattr as safe_getattr, safe_isinstance as safe_isinstance, safe_issubclass as safe_issubclass, truncate_string as truncate_string
-from .logging import get_logger as get_logger, log_component_registration as log_component_registration, log_component_resolution as log_component_resolution, log_context_creation as log_context_creation, log_error as log_error, log_import_resolution as log_import_resolution, log_info as log_info, log_module_registration as log_module_registration, log_warning as log_warning, logger as logger
+from .logging import cache_debug_enabled as cache_debug_enabled, configure_logging as configure_logging, get_logger as get_logger, is_debug_enabled as is_debug_enabled, log_component_registration as log_component_registration, log_component_resolution as log_component_resolution, log_context_creation as log_context_creation, log_error as log_error, log_import_resolution as log_import_resolution, log_info as log_info, log_module_registration as log_module_registration, log_warning as log_warning, logger as logger, refresh_log_levels as refresh_log_levels
 from .type_helpers import extract_non_none_types as extract_non_none_types, get_constructor_dependencies as get_constructor_dependencies, get_primary_type as get_primary_type, get_type_name as get_type_name, is_concrete_type as is_concrete_type, is_optional_type as is_optional_type, is_union_type as is_union_type, validate_type_compatibility as validate_type_compatibility
 from .validation import ComponentValidationError as ComponentValidationError, ModuleValidationError as ModuleValidationError, ValidationError as ValidationError, validate_component_dependencies as validate_component_dependencies, validate_component_registration as validate_component_registration, validate_context_name as validate_context_name, validate_exports as validate_exports, validate_module_name as validate_module_name, validate_provider_name as validate_provider_name, validate_tags as validate_tags
 
-__all__ = ['get_logger', 'logger', 'log_component_registration', 'log_component_resolution', 'log_context_creation', 'log_module_registration', 'log_import_resolution', 'log_error', 'log_warning', 'log_info', 'is_union_type', 'extract_non_none_types', 'get_primary_type', 'is_optional_type', 'get_constructor_dependencies', 'get_type_name', 'is_concrete_type', 'validate_type_compatibility', 'ValidationError', 'ComponentValidationError', 'ModuleValidationError', 'validate_component_registration', 'validate_context_name', 'validate_module_name', 'validate_provider_name', 'validate_tags', 'validate_exports', 'validate_component_dependencies', 'ensure_coroutine', 'run_async_in_sync', 'safe_getattr', 'safe_isinstance', 'safe_issubclass', 'merge_dicts', 'filter_none_values', 'get_class_name', 'get_module_name', 'create_unique_key', 'truncate_string']
+__all__ = ['get_logger', 'logger', 'is_debug_enabled', 'cache_debug_enabled', 'configure_logging', 'refresh_log_levels', 'log_component_registration', 'log_component_resolution', 'log_context_creation', 'log_module_registration', 'log_import_resolution', 'log_error', 'log_warning', 'log_info', 'is_union_type', 'extract_non_none_types', 'get_primary_type', 'is_optional_type', 'get_constructor_dependencies', 'get_type_name', 'is_concrete_type', 'validate_type_compatibility', 'ValidationError', 'ComponentValidationError', 'ModuleValidationError', 'validate_component_registration', 'validate_context_name', 'validate_module_name', 'validate_provider_name', 'validate_tags', 'validate_exports', 'validate_component_dependencies', 'ensure_coroutine', 'run_async_in_sync', 'safe_getattr', 'safe_isinstance', 'safe_issubclass', 'merge_dicts', 'filter_none_values', 'get_class_name', 'get_module_name', 'create_unique_key', 'truncate_string']
@@ -1,6 +1,9 @@
 """Structured logging utilities for the dependency injection system."""
 
+import logging
+import threading
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import structlog
 
@@ -29,6 +32,72 @@ def get_logger(name: str) -> structlog.BoundLogger:
 logger = get_logger("opusgenie_di")
 
 
+def is_debug_enabled(log: Any = None) -> bool:
+    """
+    Check whether debug messages would currently be emitted.
+
+    The check binds a fresh logger, so callers on hot paths should cache
+    the result rather than calling this per operation.
+    """
+    try:
+        return bool((log or logger).bind().is_enabled_for(logging.DEBUG))
+    except AttributeError:
+        # Logger without level filtering, assume everything is emitted
+        return True
+
+
+# Debug flags cached on objects by cache_debug_enabled, as
+# owner -> {attribute name: logger}; refreshed by refresh_log_levels()
+_debug_flags: WeakKeyDictionary[Any, dict[str, Any]] = WeakKeyDictionary()
+_debug_flags_lock = threading.Lock()
+
+
+def cache_debug_enabled(owner: Any, attribute: str, log: Any = None) -> None:
+    """
+    Cache is_debug_enabled() on an object attribute and keep it current.
+
+    Hot paths read the attribute instead of checking the logger per call.
+    The cached value is re-evaluated by refresh_log_levels(), so it follows
+    logging configured after the object was created.
+
+    Args:
+        owner: Object to store the flag on
+        attribute: Attribute name for the flag
+        log: Logger to check, defaults to the package logger
+    """
+    with _debug_flags_lock:
+        _debug_flags.setdefault(owner, {})[attribute] = log
+    setattr(owner, attribute, is_debug_enabled(log))
+
+
+def refresh_log_levels() -> None:
+    """
+    Re-evaluate every cached debug flag against the current logging setup.
+
+    Call this after configuring structlog directly; configure_logging()
+    calls it automatically.
+    """
+    with _debug_flags_lock:
+        entries = [(owner, dict(flags)) for owner, flags in _debug_flags.items()]
+    for owner, flags in entries:
+        for attribute, log in flags.items():
+            setattr(owner, attribute, is_debug_enabled(log))
+
+
+def configure_logging(level: int = logging.WARNING, **options: Any) -> None:
+    """
+    Configure structured logging for the DI system.
+
+    Args:
+        level: Minimum level of emitted messages
+        **options: Further options passed to structlog.configure
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(level), **options
+    )
+    refresh_log_levels()
+
+
 def log_component_registration(
     component_type: type,
     context_name: str,
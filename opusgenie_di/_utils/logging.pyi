@@ -1,12 +1,53 @@
 import structlog
+import threading
 from _typeshed import Incomplete
 from typing import Any
+from weakref import WeakKeyDictionary
 
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger for the given name."""
 
 logger: Incomplete
 
+def is_debug_enabled(log: Any = None) -> bool:
+    """
+    Check whether debug messages would currently be emitted.
+
+    The check binds a fresh logger, so callers on hot paths should cache
+    the result rather than calling this per operation.
+    """
+
+_debug_flags: WeakKeyDictionary[Any, dict[str, Any]]
+_debug_flags_lock: threading.Lock
+
+def cache_debug_enabled(owner: Any, attribute: str, log: Any = None) -> None:
+    """
+    Cache is_debug_enabled() on an object attribute and keep it current.
+
+    Hot paths read the attribute instead of checking the logger per call.
+    The cached value is re-evaluated by refresh_log_levels(), so it follows
+    logging configured after the object was created.
+
+    Args:
+        owner: Object to store the flag on
+        attribute: Attribute name for the flag
+        log: Logger to check, defaults to the package logger
+    """
+def refresh_log_levels() -> None:
+    """
+    Re-evaluate every cached debug flag against the current logging setup.
+
+    Call this after configuring structlog directly; configure_logging()
+    calls it automatically.
+    """
+def configure_logging(level: int = ..., **options: Any) -> None:
+    """
+    Configure structured logging for the DI system.
+
+    Args:
+        level: Minimum level of emitted messages
+        **options: Further options passed to structlog.configure
+    """
 def log_component_registration(component_type: type, context_name: str, scope: str, provider_name: str | None = None, **extra: Any) -> None:
     """Log component registration with structured data."""
 def log_component_resolution(component_type: type, context_name: str, resolution_time_ms: float, resolution_source: str = 'direct', **extra: Any) -> None:
@@ -3,11 +3,20 @@
 import inspect
 import types
 from typing import Any, Union, get_args, get_origin, get_type_hints
+from weakref import WeakKeyDictionary, ref
 
-from .logging import get_logger
+from .logging import get_logger, is_debug_enabled
 
 logger = get_logger(__name__)
 
+# Constructor analysis results keyed by class. Weak keys let classes defined
+# at runtime (e.g. inside tests) be garbage collected; dependency classes are
+# stored as weak references too, so a constructor naming its own class (e.g. a
+# tree node's parent) cannot keep its key alive.
+_constructor_dependency_cache: WeakKeyDictionary[type, dict[str, tuple[Any, bool]]] = (
+    WeakKeyDictionary()
+)
+
 
 def is_union_type(type_hint: Any) -> bool:
     """Check if a type hint is a Union type (including | syntax)."""
@@ -63,9 +72,67 @@ def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool
     """
     Analyze a class constructor to extract dependency information.
 
+    Results are memoized per class once all type hints could be resolved.
+
     Returns:
         Dictionary mapping parameter names to (type, is_optional) tuples.
     """
+    try:
+        cached = _constructor_dependency_cache.get(cls)
+    except TypeError:
+        # Not weak-referenceable, analyze without caching
+        return _analyze_constructor_dependencies(cls)[0]
+
+    if cached is not None:
+        dependencies = _restore_cached_dependencies(cached)
+        if dependencies is not None:
+            return dependencies
+
+    dependencies, hints_resolved = _analyze_constructor_dependencies(cls)
+    # Unresolved forward references may resolve later, so don't cache them
+    if hints_resolved:
+        _constructor_dependency_cache[cls] = {
+            param_name: (
+                ref(dep_type) if inspect.isclass(dep_type) else dep_type,
+                is_optional,
+            )
+            for param_name, (dep_type, is_optional) in dependencies.items()
+        }
+    return dependencies
+
+
+def _restore_cached_dependencies(
+    cached: dict[str, tuple[Any, bool]],
+) -> dict[str, tuple[type | None, bool]] | None:
+    """
+    Rebuild a dependency mapping from its cached form.
+
+    Returns:
+        The dependency mapping, or None if a dependency class has since been
+        garbage collected and the constructor must be analyzed again.
+    """
+    dependencies: dict[str, tuple[type | None, bool]] = {}
+    for param_name, (dep_type, is_optional) in cached.items():
+        if isinstance(dep_type, ref):
+            dep_type = dep_type()
+            if dep_type is None:
+                return None
+        dependencies[param_name] = (dep_type, is_optional)
+    return dependencies
+
+
+def _analyze_constructor_dependencies(
+    cls: type,
+) -> tuple[dict[str, tuple[type | None, bool]], bool]:
+    """
+    Reflect on a class constructor to extract dependency information.
+
+    Returns:
+        Tuple of the dependency mapping and whether all type hints resolved.
+    """
+    hints_resolved = True
+    # Checked once per analysis instead of paying for a logger bind per parameter
+    log_enabled = is_debug_enabled(logger)
     try:
         signature = inspect.signature(cls)
         dependencies = {}
@@ -94,6 +161,7 @@ def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool
                 error=str(e),
             )
             type_hints = {}
+            hints_resolved = False
 
         for param_name, param in signature.parameters.items():
             if param_name == "self":
@@ -103,11 +171,12 @@ def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool
             type_hint = type_hints.get(param_name, param.annotation)
             if type_hint == inspect.Parameter.empty:
                 # No type annotation, skip
-                logger.debug(
-                    "Parameter without type annotation",
-                    class_name=cls.__name__,
-                    parameter=param_name,
-                )
+                if log_enabled:
+                    logger.debug(
+                        "Parameter without type annotation",
+                        class_name=cls.__name__,
+                        parameter=param_name,
+                    )
                 continue
 
             # Check if it's optional (has default value or Union with None)
@@ -120,15 +189,16 @@ def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool
 
             dependencies[param_name] = (primary_type, is_optional)
 
-            logger.debug(
-                "Resolved dependency",
-                class_name=cls.__name__,
-                parameter=param_name,
-                resolved_type=primary_type.__name__ if primary_type else None,
-                is_optional=is_optional,
-            )
+            if log_enabled:
+                logger.debug(
+                    "Resolved dependency",
+                    class_name=cls.__name__,
+                    parameter=param_name,
+                    resolved_type=primary_type.__name__ if primary_type else None,
+                    is_optional=is_optional,
+                )
 
-        return dependencies
+        return dependencies, hints_resolved
 
     except Exception as e:
         logger.warning(
@@ -136,7 +206,7 @@ def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool
             class_name=cls.__name__,
             error=str(e),
         )
-        return {}
+        return {}, False
 
 
 def get_type_name(type_hint: Any) -> str:
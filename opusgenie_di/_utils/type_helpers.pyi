@@ -1,8 +1,10 @@
-from .logging import get_logger as get_logger
+from .logging import get_logger as get_logger, is_debug_enabled as is_debug_enabled
 from _typeshed import Incomplete
 from typing import Any
+from weakref import WeakKeyDictionary
 
 logger: Incomplete
+_constructor_dependency_cache: WeakKeyDictionary[type, dict[str, tuple[Any, bool]]]
 
 def is_union_type(type_hint: Any) -> bool:
     """Check if a type hint is a Union type (including | syntax)."""
@@ -17,13 +19,30 @@ def get_primary_type(type_hint: Any) -> type | None:
     """
 def is_optional_type(type_hint: Any) -> bool:
     """Check if a type hint represents an optional type (Union with None)."""
-def get_constructor_dependencies(cls) -> dict[str, tuple[type | None, bool]]:
+def get_constructor_dependencies(cls: type) -> dict[str, tuple[type | None, bool]]:
     """
     Analyze a class constructor to extract dependency information.
 
+    Results are memoized per class once all type hints could be resolved.
+
     Returns:
         Dictionary mapping parameter names to (type, is_optional) tuples.
     """
+def _restore_cached_dependencies(cached: dict[str, tuple[Any, bool]]) -> dict[str, tuple[type | None, bool]] | None:
+    """
+    Rebuild a dependency mapping from its cached form.
+
+    Returns:
+        The dependency mapping, or None if a dependency class has since been
+        garbage collected and the constructor must be analyzed again.
+    """
+def _analyze_constructor_dependencies(cls: type) -> tuple[dict[str, tuple[type | None, bool]], bool]:
+    """
+    Reflect on a class constructor to extract dependency information.
+
+    Returns:
+        Tuple of the dependency mapping and whether all type hints resolved.
+    """
 def get_type_name(type_hint: Any) -> str:
     """Get a string representation of a type hint."""
 def is_concrete_type(type_hint: Any) -> bool:
@@ -1,12 +1,17 @@
 """Validation utilities for dependency injection components."""
 
+from contextlib import suppress
 from typing import Any
+from weakref import WeakKeyDictionary, WeakSet
 
 from .logging import get_logger
 from .type_helpers import is_concrete_type, validate_type_compatibility
 
 logger = get_logger(__name__)
 
+# implementation -> interfaces it has already been validated against
+_validated_registrations: WeakKeyDictionary[type, WeakSet[type]] = WeakKeyDictionary()
+
 
 class ValidationError(Exception):
     """Base exception for validation errors."""
@@ -59,6 +64,11 @@ def validate_component_registration(
     Raises:
         ComponentValidationError: If validation fails
     """
+    # Skip pairs that already passed cleanly; the checks only depend on the types
+    with suppress(TypeError):
+        if interface in _validated_registrations.get(implementation, ()):
+            return
+
     # Validate implementation is a type
     if not isinstance(implementation, type):
         raise ComponentValidationError(
@@ -86,6 +96,11 @@ def validate_component_registration(
             implementation=implementation.__name__,
             component=component_name,
         )
+    else:
+        with suppress(TypeError):
+            _validated_registrations.setdefault(implementation, WeakSet()).add(
+                interface
+            )
 
     logger.debug(
         "Component registration validation passed",
@@ -2,8 +2,10 @@ from .logging import get_logger as get_logger
 from .type_helpers import is_concrete_type as is_concrete_type, validate_type_compatibility as validate_type_compatibility
 from _typeshed import Incomplete
 from typing import Any
+from weakref import WeakKeyDictionary, WeakSet
 
 logger: Incomplete
+_validated_registrations: WeakKeyDictionary[type, WeakSet[type]]
 
 class ValidationError(Exception):
     """Base exception for validation errors."""
@@ -60,9 +60,15 @@ def event_collector() -> TestEventCollector:
     return TestEventCollector()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_components() -> dict[str, type]:
-    """Create sample components for testing."""
+    """
+    Create sample components for testing.
+
+    The classes are built once per session and carry no container state, so
+    they are shared between tests. A test that mutates class attributes must
+    work on a copy, e.g. ``type(cls.__name__, cls.__bases__, dict(cls.__dict__))``.
+    """
 
     @og_component(scope=ComponentScope.SINGLETON, auto_register=False)
     class SampleService(BaseComponent):
@@ -102,9 +108,14 @@ def sample_components() -> dict[str, type]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_dependency_chain() -> dict[str, type]:
-    """Create a complex dependency chain for testing."""
+    """
+    Create a complex dependency chain for testing.
+
+    Shared for the whole session like ``sample_components``; copy a class
+    before mutating its attributes.
+    """
 
     @og_component(scope=ComponentScope.SINGLETON, auto_register=False)
     class DatabaseConfig(BaseComponent):
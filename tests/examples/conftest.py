@@ -0,0 +1,49 @@
+"""Shared helpers for example tests."""
+
+import contextlib
+import io
+from pathlib import Path
+import runpy
+
+import pytest
+
+from opusgenie_di import reset_global_state
+
+EXAMPLES_DIR = Path(__file__).parent.parent.parent / "examples"
+
+
+def run_example_in_process(filename: str) -> str:
+    """
+    Run an example script in the current interpreter and capture its output.
+
+    Args:
+        filename: File name of the example inside the examples directory
+
+    Returns:
+        Everything the example wrote to stdout
+    """
+    example_path = EXAMPLES_DIR / filename
+    assert example_path.exists(), f"Example file not found: {example_path}"
+
+    output = io.StringIO()
+    reset_global_state()
+    try:
+        with contextlib.redirect_stdout(output):
+            runpy.run_path(str(example_path), run_name="__main__")
+    except SystemExit as e:
+        assert not e.code, f"Example exited with code {e.code}:\n{output.getvalue()}"
+    finally:
+        reset_global_state()
+    return output.getvalue()
+
+
+@pytest.fixture(scope="class")
+def basic_usage_output() -> str:
+    """Run basic_usage.py once per test class and return its stdout."""
+    return run_example_in_process("basic_usage.py")
+
+
+@pytest.fixture(scope="class")
+def multi_context_output() -> str:
+    """Run multi_context.py once per test class and return its stdout."""
+    return run_example_in_process("multi_context.py")
@@ -1,6 +1,7 @@
 """Tests for BaseComponent."""
 
 from typing import Any
+import uuid
 
 from opusgenie_di import (
     BaseComponent,
@@ -27,12 +28,34 @@ class TestBaseComponent:
 
         assert component1.component_id != component2.component_id
 
+    def test_base_component_ids_are_uuid_shaped(self) -> None:
+        """Test that component IDs keep the UUID string format."""
+        ids = {BaseComponent().component_id for _ in range(100)}
+
+        assert len(ids) == 100
+        for component_id in ids:
+            assert str(uuid.UUID(component_id)) == component_id
+
     def test_base_component_initialization_with_kwargs(self) -> None:
         """Test BaseComponent initialization with kwargs."""
         component = BaseComponent(custom_param="test")
         assert component is not None
         # BaseComponent should handle arbitrary kwargs gracefully
 
+    def test_base_component_defaults(self) -> None:
+        """Test that base defaults are fresh and subclass defaults are validated."""
+
+        class CountingComponent(BaseComponent):
+            count: int = "5"  # type: ignore[assignment]
+
+        first = CountingComponent()
+        second = CountingComponent()
+
+        assert first.count == 5
+        assert first.tags == {} and first.tags is not second.tags
+        assert first.config is not second.config
+        assert first.lifecycle_stage == LifecycleStage.CREATED
+
     def test_derived_component_creation(self) -> None:
         """Test creation of component derived from BaseComponent."""
 
@@ -14,96 +14,187 @@ from opusgenie_di._base import (
 )
 
 
-class TestBaseComponentLifecycle:
-    """Test BaseComponent lifecycle methods."""
+@og_component()
+class _RegisteredTestComponent(BaseComponent):
+    """Decorated once; the lifecycle test components below subclass it."""
 
-    def test_initialize_lifecycle(self) -> None:
-        """Test initialize method."""
 
-        @og_component()
-        class TestComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.initialized = False
+class _InitLifecycleComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.initialized = False
+
+    async def initialize(self) -> None:
+        """Custom initialization."""
+        self.initialized = True
+        await super().initialize()
+
+
+class _StartLifecycleComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.started = False
+
+    async def start(self) -> None:
+        """Custom start logic."""
+        self.started = True
+        await super().start()
+
+
+class _StopLifecycleComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        """Custom stop logic."""
+        self.stopped = True
+        await super().stop()
+
+
+class _CleanupLifecycleComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.cleaned_up = False
+
+    async def cleanup(self) -> None:
+        """Custom cleanup logic."""
+        self.cleaned_up = True
+        await super().cleanup()
+
+
+@og_component(scope=ComponentScope.SINGLETON, layer=ComponentLayer.APPLICATION)
+class _MetadataComponent(BaseComponent):
+    pass
+
+
+class _ReprComponent(_RegisteredTestComponent):
+    def __repr__(self) -> str:
+        """Override repr to handle enum/string issue."""
+        stage = self.lifecycle_stage
+        stage_str = stage if isinstance(stage, str) else stage.value
+        return (
+            f"{self.__class__.__name__}("
+            f"id='{self.component_id[:8]}...', "
+            f"name='{self.component_name}', "
+            f"stage={stage_str})"
+        )
+
+
+class _EqualityComponent(_RegisteredTestComponent):
+    pass
+
 
-            async def initialize(self) -> None:
-                """Custom initialization."""
-                self.initialized = True
-                await super().initialize()
+class _ComplexLifecycleComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.events = []
 
-        component = TestComponent()
+    async def initialize(self) -> None:
+        self.events.append("initialize")
+        await super().initialize()
+
+    async def start(self) -> None:
+        self.events.append("start")
+        await super().start()
+
+    async def stop(self) -> None:
+        self.events.append("stop")
+        await super().stop()
+
+    async def cleanup(self) -> None:
+        self.events.append("cleanup")
+        await super().cleanup()
+
+
+class _ConcurrentComponent(_RegisteredTestComponent):
+    def __init__(self):
+        super().__init__()
+        self.call_count = 0
+
+    async def initialize(self) -> None:
+        self.call_count += 1
+        await asyncio.sleep(0)  # Yield to the other initializers
+        await super().initialize()
+
+
+class _ErrorComponent(_RegisteredTestComponent):
+    async def initialize(self) -> None:
+        raise RuntimeError("Initialization failed")
+
+
+class _DependencyA(_RegisteredTestComponent):
+    def get_value(self) -> str:
+        return "A"
+
+
+class _DependencyB(_RegisteredTestComponent):
+    def __init__(self, dep_a: _DependencyA):
+        super().__init__()
+        self.dep_a = dep_a
+
+    def get_combined(self) -> str:
+        return f"B+{self.dep_a.get_value()}"
+
+
+class _PostInitComponent(_RegisteredTestComponent):
+    def __init__(self, value: str):
+        super().__init__()
+        self.value = value
+        self.post_init_called = False
+
+    def __post_init__(self) -> None:
+        """Post initialization hook."""
+        self.post_init_called = True
+        self.processed_value = self.value.upper()
+
+
+class TestBaseComponentLifecycle:
+    """Test BaseComponent lifecycle methods."""
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_initialize_lifecycle(self) -> None:
+        """Test initialize method."""
+        component = _InitLifecycleComponent()
         assert not component.initialized
 
         # Run async initialize
-        asyncio.run(component.initialize())
+        await component.initialize()
 
         assert component.initialized
         assert component.lifecycle_stage == LifecycleStage.ACTIVE
 
-    def test_start_lifecycle(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_start_lifecycle(self) -> None:
         """Test start method."""
-
-        @og_component()
-        class TestComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.started = False
-
-            async def start(self) -> None:
-                """Custom start logic."""
-                self.started = True
-                await super().start()
-
-        component = TestComponent()
+        component = _StartLifecycleComponent()
 
         # Run async start
-        asyncio.run(component.start())
+        await component.start()
 
         assert component.started
         assert component.lifecycle_stage == LifecycleStage.RUNNING
 
-    def test_stop_lifecycle(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_stop_lifecycle(self) -> None:
         """Test stop method."""
-
-        @og_component()
-        class TestComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.stopped = False
-
-            async def stop(self) -> None:
-                """Custom stop logic."""
-                self.stopped = True
-                await super().stop()
-
-        component = TestComponent()
+        component = _StopLifecycleComponent()
         component.set_lifecycle_stage(LifecycleStage.ACTIVE)
 
         # Run async stop
-        asyncio.run(component.stop())
+        await component.stop()
 
         assert component.stopped
         assert component.lifecycle_stage == LifecycleStage.STOPPED
 
-    def test_cleanup_lifecycle(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cleanup_lifecycle(self) -> None:
         """Test cleanup method."""
-
-        @og_component()
-        class TestComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.cleaned_up = False
-
-            async def cleanup(self) -> None:
-                """Custom cleanup logic."""
-                self.cleaned_up = True
-                await super().cleanup()
-
-        component = TestComponent()
+        component = _CleanupLifecycleComponent()
         component.set_lifecycle_stage(LifecycleStage.STOPPED)
 
         # Run async cleanup
-        asyncio.run(component.cleanup())
+        await component.cleanup()
 
         assert component.cleaned_up
         assert component.lifecycle_stage == LifecycleStage.POST_SHUTDOWN
@@ -117,32 +208,27 @@ class TestBaseComponentLifecycle:
         assert isinstance(component.component_id, str)
         assert component.lifecycle_stage == LifecycleStage.CREATED.value
         assert component.is_active() is False
-        assert component.is_active() is False
         assert component.is_stopped() is False
 
         # Change lifecycle stage
         component.set_lifecycle_stage(LifecycleStage.ACTIVE)
         assert component.is_active() is True
-        assert component.is_active() is True
 
         component.set_lifecycle_stage(LifecycleStage.STOPPED)
         assert component.is_stopped() is True
 
     def test_created_at_property(self) -> None:
         """Test created_at timestamp."""
+        before = datetime.now(UTC)
         component = BaseComponent()
+        after = datetime.now(UTC)
 
         assert isinstance(component.created_at, datetime)
-        assert component.created_at <= datetime.now(UTC)
+        assert before <= component.created_at <= after
 
     def test_metadata_property(self) -> None:
         """Test metadata property."""
-
-        @og_component(scope=ComponentScope.SINGLETON, layer=ComponentLayer.APPLICATION)
-        class TestComponent(BaseComponent):
-            pass
-
-        component = TestComponent()
+        component = _MetadataComponent()
         # Manually set the layer since decorator doesn't set it on instance
         component.layer = ComponentLayer.APPLICATION
         metadata = component.get_metadata()
@@ -154,39 +240,19 @@ class TestBaseComponentLifecycle:
 
     def test_repr_method(self) -> None:
         """Test string representation."""
-
-        @og_component()
-        class TestComponent(BaseComponent):
-            def __repr__(self) -> str:
-                """Override repr to handle enum/string issue."""
-                stage = self.lifecycle_stage
-                stage_str = stage if isinstance(stage, str) else stage.value
-                return (
-                    f"{self.__class__.__name__}("
-                    f"id='{self.component_id[:8]}...', "
-                    f"name='{self.component_name}', "
-                    f"stage={stage_str})"
-                )
-
-        component = TestComponent()
+        component = _ReprComponent()
         repr_str = repr(component)
 
-        assert "TestComponent" in repr_str
+        assert "_ReprComponent" in repr_str
         assert component.component_id[:8] in repr_str
 
     def test_equality_and_hash(self) -> None:
         """Test equality and hash methods."""
-
-        @og_component()
-        class TestComponent(BaseComponent):
-            pass
-
-        comp1 = TestComponent()
-        comp2 = TestComponent()
+        comp1 = _EqualityComponent()
+        comp2 = _EqualityComponent()
 
         # Different instances should not be equal
         assert comp1 != comp2
-        assert comp1 == comp1
 
         # BaseComponent might not be hashable
         # Just test equality
@@ -194,7 +260,6 @@ class TestBaseComponentLifecycle:
 
         # Test with non-component
         assert comp1 != "not a component"
-        assert comp1 is not None
 
     def test_update_lifecycle_stage(self) -> None:
         """Test set_lifecycle_stage method."""
@@ -208,126 +273,57 @@ class TestBaseComponentLifecycle:
         component.set_lifecycle_stage(LifecycleStage.CREATED)
         assert component.lifecycle_stage == LifecycleStage.CREATED
 
-    def test_complex_lifecycle_flow(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_complex_lifecycle_flow(self) -> None:
         """Test complete lifecycle flow."""
-
-        @og_component()
-        class ComplexComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.events = []
-
-            async def initialize(self) -> None:
-                self.events.append("initialize")
-                await super().initialize()
-
-            async def start(self) -> None:
-                self.events.append("start")
-                await super().start()
-
-            async def stop(self) -> None:
-                self.events.append("stop")
-                await super().stop()
-
-            async def cleanup(self) -> None:
-                self.events.append("cleanup")
-                await super().cleanup()
-
-        component = ComplexComponent()
+        component = _ComplexLifecycleComponent()
 
         # Full lifecycle
-        asyncio.run(component.initialize())
-        asyncio.run(component.start())
-        asyncio.run(component.stop())
-        asyncio.run(component.cleanup())
+        await component.initialize()
+        await component.start()
+        await component.stop()
+        await component.cleanup()
 
         assert component.events == ["initialize", "start", "stop", "cleanup"]
         assert component.lifecycle_stage == LifecycleStage.POST_SHUTDOWN
 
-    def test_concurrent_lifecycle_calls(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concurrent_lifecycle_calls(self) -> None:
         """Test handling concurrent lifecycle calls."""
-
-        @og_component()
-        class ConcurrentComponent(BaseComponent):
-            def __init__(self):
-                super().__init__()
-                self.call_count = 0
-
-            async def initialize(self) -> None:
-                self.call_count += 1
-                await asyncio.sleep(0.01)  # Simulate work
-                await super().initialize()
-
-        component = ConcurrentComponent()
+        component = _ConcurrentComponent()
 
         # Try concurrent initialization
-        async def concurrent_test():
-            await asyncio.gather(
-                component.initialize(), component.initialize(), component.initialize()
-            )
-
-        asyncio.run(concurrent_test())
+        await asyncio.gather(
+            component.initialize(), component.initialize(), component.initialize()
+        )
 
         # Should handle concurrent calls gracefully
         assert component.call_count >= 1
         assert component.lifecycle_stage == LifecycleStage.ACTIVE
 
-    def test_error_handling_in_lifecycle(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_error_handling_in_lifecycle(self) -> None:
         """Test error handling in lifecycle methods."""
-
-        @og_component()
-        class ErrorComponent(BaseComponent):
-            async def initialize(self) -> None:
-                raise RuntimeError("Initialization failed")
-
-        component = ErrorComponent()
+        component = _ErrorComponent()
 
         # Error should propagate
         with pytest.raises(RuntimeError, match="Initialization failed"):
-            asyncio.run(component.initialize())
+            await component.initialize()
 
         # Component should remain in error state
         assert component.lifecycle_stage == LifecycleStage.CREATED.value
 
     def test_component_with_dependencies(self) -> None:
         """Test component with dependency injection."""
-
-        @og_component()
-        class DependencyA(BaseComponent):
-            def get_value(self) -> str:
-                return "A"
-
-        @og_component()
-        class DependencyB(BaseComponent):
-            def __init__(self, dep_a: DependencyA):
-                super().__init__()
-                self.dep_a = dep_a
-
-            def get_combined(self) -> str:
-                return f"B+{self.dep_a.get_value()}"
-
         # Manual instantiation for test
-        dep_a = DependencyA()
-        dep_b = DependencyB(dep_a)
+        dep_a = _DependencyA()
+        dep_b = _DependencyB(dep_a)
 
         assert dep_b.get_combined() == "B+A"
 
     def test_component_post_init_hook(self) -> None:
         """Test __post_init__ hook functionality."""
-
-        @og_component()
-        class PostInitComponent(BaseComponent):
-            def __init__(self, value: str):
-                super().__init__()
-                self.value = value
-                self.post_init_called = False
-
-            def __post_init__(self) -> None:
-                """Post initialization hook."""
-                self.post_init_called = True
-                self.processed_value = self.value.upper()
-
-        component = PostInitComponent("test")
+        component = _PostInitComponent("test")
 
         # Manually call post_init for test
         component.__post_init__()
@@ -1,6 +1,7 @@
 """Tests for ComponentMetadata."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, tzinfo
+from typing import Any
 
 from pydantic import ValidationError
 import pytest
@@ -12,15 +13,40 @@ from opusgenie_di import (
     LifecycleStage,
 )
 
+_FIXED_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class _FrozenDatetime(datetime):
+    """datetime stand-in whose now() always returns _FIXED_NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        return _FIXED_NOW
+
+
+def _meta(**overrides: Any) -> ComponentMetadata:
+    """Build metadata without validation for tests that only read fields back."""
+    overrides.setdefault("component_type", "TestComponent")
+    overrides.setdefault("context_name", "test_context")
+    return ComponentMetadata.model_construct(**overrides)
+
+
+@pytest.fixture(scope="module")
+def default_metadata() -> ComponentMetadata:
+    """Validated metadata with only the required fields, shared by read-only tests."""
+    return ComponentMetadata(
+        component_type="TestComponent", context_name="test_context"
+    )
+
 
 class TestComponentMetadata:
     """Test ComponentMetadata functionality."""
 
-    def test_component_metadata_creation(self) -> None:
+    def test_component_metadata_creation(
+        self, default_metadata: ComponentMetadata
+    ) -> None:
         """Test basic ComponentMetadata creation."""
-        metadata = ComponentMetadata(
-            component_type="TestComponent", context_name="test_context"
-        )
+        metadata = default_metadata
 
         assert metadata.component_type == "TestComponent"
         assert metadata.scope == ComponentScope.SINGLETON  # default
@@ -56,11 +82,11 @@ class TestComponentMetadata:
         assert metadata.optional_dependencies == ["opt1"]
         assert metadata.config == {"setting": "value"}
 
-    def test_component_metadata_defaults(self) -> None:
+    def test_component_metadata_defaults(
+        self, default_metadata: ComponentMetadata
+    ) -> None:
         """Test ComponentMetadata default values."""
-        metadata = ComponentMetadata(
-            component_type="TestComponent", context_name="test_context"
-        )
+        metadata = default_metadata
 
         assert metadata.scope == ComponentScope.SINGLETON
         assert metadata.component_name is None
@@ -77,11 +103,7 @@ class TestComponentMetadata:
 
     def test_component_metadata_tags_handling(self) -> None:
         """Test ComponentMetadata tags handling."""
-        metadata = ComponentMetadata(
-            component_type="TestComponent",
-            context_name="test_context",
-            tags={"env": "test", "version": "1.0"},
-        )
+        metadata = _meta(tags={"env": "test", "version": "1.0"})
 
         assert metadata.tags["env"] == "test"
         assert metadata.tags["version"] == "1.0"
@@ -89,54 +111,32 @@ class TestComponentMetadata:
 
     def test_component_metadata_unique_ids(self) -> None:
         """Test that ComponentMetadata generates unique IDs."""
-        metadata1 = ComponentMetadata(
-            component_type="TestComponent", context_name="test_context"
-        )
-        metadata2 = ComponentMetadata(
-            component_type="TestComponent", context_name="test_context"
-        )
+        metadata1 = _meta()
+        metadata2 = _meta()
 
         assert metadata1.component_id != metadata2.component_id
         assert len(metadata1.component_id) > 0
         assert len(metadata2.component_id) > 0
 
-    def test_component_metadata_scope_variations(self) -> None:
-        """Test ComponentMetadata with all scope variations."""
-        scopes = [
-            ComponentScope.SINGLETON,
-            ComponentScope.TRANSIENT,
-            ComponentScope.SCOPED,
-            ComponentScope.FACTORY,
-            ComponentScope.CONDITIONAL,
-        ]
-
-        for scope in scopes:
-            metadata = ComponentMetadata(
-                component_type="TestComponent", context_name="test_context", scope=scope
-            )
-            assert metadata.scope == scope
-
-    def test_component_metadata_layer_variations(self) -> None:
-        """Test ComponentMetadata with all layer variations."""
-        layers = [
-            ComponentLayer.INFRASTRUCTURE,
-            ComponentLayer.DOMAIN,
-            ComponentLayer.APPLICATION,
-            ComponentLayer.PRESENTATION,
-            ComponentLayer.FRAMEWORK,
-        ]
-
-        for layer in layers:
-            metadata = ComponentMetadata(
-                component_type="TestComponent", context_name="test_context", layer=layer
-            )
-            assert metadata.layer == layer
+    @pytest.mark.parametrize("scope", list(ComponentScope))
+    def test_component_metadata_scope_variations(self, scope: ComponentScope) -> None:
+        """Test ComponentMetadata with each scope."""
+        metadata = ComponentMetadata(
+            component_type="TestComponent", context_name="test_context", scope=scope
+        )
+        assert metadata.scope == scope
 
-    def test_component_metadata_lifecycle_update(self) -> None:
-        """Test ComponentMetadata lifecycle stage update."""
+    @pytest.mark.parametrize("layer", list(ComponentLayer))
+    def test_component_metadata_layer_variations(self, layer: ComponentLayer) -> None:
+        """Test ComponentMetadata with each layer."""
         metadata = ComponentMetadata(
-            component_type="TestComponent", context_name="test_context"
+            component_type="TestComponent", context_name="test_context", layer=layer
         )
+        assert metadata.layer == layer
+
+    def test_component_metadata_lifecycle_update(self) -> None:
+        """Test ComponentMetadata lifecycle stage update."""
+        metadata = _meta()
 
         assert metadata.lifecycle_stage == LifecycleStage.CREATED
         assert metadata.updated_at is None
@@ -148,17 +148,17 @@ class TestComponentMetadata:
         assert metadata.updated_at is not None
         assert isinstance(metadata.updated_at, datetime)
 
-    def test_component_metadata_created_at_timestamp(self) -> None:
+    def test_component_metadata_created_at_timestamp(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that created_at timestamp is properly set."""
-        before_creation = datetime.now(UTC)
+        monkeypatch.setattr("opusgenie_di._base.metadata.datetime", _FrozenDatetime)
 
         metadata = ComponentMetadata(
             component_type="TestComponent", context_name="test_context"
         )
 
-        after_creation = datetime.now(UTC)
-
-        assert before_creation <= metadata.created_at <= after_creation
+        assert metadata.created_at == _FIXED_NOW
 
     def test_component_metadata_validation(self) -> None:
         """Test ComponentMetadata field validation."""
@@ -175,31 +175,26 @@ class TestComponentMetadata:
         with pytest.raises(ValidationError):
             ComponentMetadata(context_name="test_context")  # missing component_type
 
-    def test_component_metadata_string_representation(self) -> None:
+    def test_component_metadata_string_representation(
+        self, default_metadata: ComponentMetadata
+    ) -> None:
         """Test ComponentMetadata string representation."""
-        metadata = ComponentMetadata(
-            component_type="TestComponent",
-            context_name="test_context",
-            component_name="test_component",
-        )
-
-        str_repr = str(metadata)
+        str_repr = str(default_metadata)
         assert "TestComponent" in str_repr
 
     def test_component_metadata_dict_representation(self) -> None:
         """Test ComponentMetadata dictionary representation."""
-        metadata = ComponentMetadata(
-            component_type="TestComponent",
-            context_name="test_context",
-            component_name="test_component",
-            scope=ComponentScope.SINGLETON,
+        metadata = _meta(
+            component_name="test_component", scope=ComponentScope.SINGLETON
         )
 
-        # Should be serializable to dict
-        metadata_dict = metadata.model_dump()
-        assert metadata_dict["component_type"] == "TestComponent"
-        assert metadata_dict["context_name"] == "test_context"
-        assert metadata_dict["component_name"] == "test_component"
-        assert (
-            metadata_dict["scope"] == ComponentScope.SINGLETON
-        )  # Pydantic preserves enum objects
+        # Should be serializable to dict; only the asserted fields are dumped
+        metadata_dict = metadata.model_dump(
+            include={"component_type", "context_name", "component_name", "scope"}
+        )
+        assert metadata_dict == {
+            "component_type": "TestComponent",
+            "context_name": "test_context",
+            "component_name": "test_component",
+            "scope": ComponentScope.SINGLETON,  # Pydantic preserves enum objects
+        }
@@ -1,15 +1,60 @@
 """Tests for Container implementation."""
 
+from collections.abc import Generator
+from functools import partial
+import itertools
+from unittest.mock import patch
+
 import pytest
 
 from opusgenie_di import (
     BaseComponent,
+    ComponentRegistrationError,
     ComponentResolutionError,
     ComponentScope,
     Container,
     MockComponent,
     og_component,
 )
+from opusgenie_di._core import ComponentProvider
+from opusgenie_di._core.container_impl import _get_component_id
+
+# Shared factories, so tests register the same callables
+_mock_test = partial(MockComponent, value="test")
+_mock_named = partial(MockComponent, value="named")
+_mock_logged = partial(MockComponent, value="logged")
+_mock_a = partial(MockComponent, value="a")
+_mock_b = partial(MockComponent, value="b")
+
+
+@og_component(scope=ComponentScope.SINGLETON, auto_register=False)
+class _TypeRegComponent(BaseComponent):
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = "type_created"
+
+
+_scoped_ids = itertools.count()
+
+
+@og_component(scope=ComponentScope.SCOPED, auto_register=False)
+class _ScopedComponent(BaseComponent):
+    def __init__(self) -> None:
+        super().__init__()
+        self.id = next(_scoped_ids)
+
+
+@pytest.fixture(scope="module")
+def _shared_container() -> Container:
+    """Create the container once per module."""
+    return Container()
+
+
+@pytest.fixture
+def container(_shared_container: Container) -> Generator[Container, None, None]:
+    """Provide the shared container, cleared after use."""
+    yield _shared_container
+    _shared_container.clear()
 
 
 class TestContainer:
@@ -20,14 +65,12 @@ class TestContainer:
         container = Container()
         assert container is not None
 
-    def test_provider_registration_singleton(self) -> None:
+    def test_provider_registration_singleton(self, container: Container) -> None:
         """Test singleton provider registration."""
-        container = Container()
-
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="test"),
+            factory=_mock_test,
         )
 
         # Resolve twice and verify same instance
@@ -37,14 +80,12 @@ class TestContainer:
         assert instance1 is instance2
         assert instance1.value == "test"
 
-    def test_provider_registration_transient(self) -> None:
+    def test_provider_registration_transient(self, container: Container) -> None:
         """Test transient provider registration."""
-        container = Container()
-
         container.register(
             MockComponent,
             scope=ComponentScope.TRANSIENT,
-            factory=lambda: MockComponent(value="test"),
+            factory=_mock_test,
         )
 
         # Resolve twice and verify different instances
@@ -55,15 +96,13 @@ class TestContainer:
         assert instance1.value == "test"
         assert instance2.value == "test"
 
-    def test_provider_registration_with_name(self) -> None:
+    def test_provider_registration_with_name(self, container: Container) -> None:
         """Test provider registration with custom name."""
-        container = Container()
-
         container.register(
             MockComponent,
             name="custom_mock",
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="named"),
+            factory=_mock_named,
         )
 
         # Resolve with name
@@ -74,65 +113,74 @@ class TestContainer:
         with pytest.raises(ComponentResolutionError):
             container.resolve(MockComponent)
 
-    def test_provider_registration_duplicate_behavior(self) -> None:
-        """Test that duplicate provider registration behavior (overrides by default)."""
-        container = Container()
-
+    @pytest.mark.parametrize(
+        ("first", "second", "resolve_first"),
+        [
+            pytest.param("first", "second", False, id="duplicate"),
+            pytest.param("original", "overridden", True, id="after_resolution"),
+        ],
+    )
+    def test_provider_registration_overrides(
+        self, container: Container, first: str, second: str, resolve_first: bool
+    ) -> None:
+        """Test that registering again overrides the earlier registration."""
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="first"),
+            factory=partial(MockComponent, value=first),
         )
 
+        if resolve_first:
+            assert container.resolve(MockComponent).value == first
+
         # Register again with different factory - should override
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="second"),
+            factory=partial(MockComponent, value=second),
         )
 
-        # Should get the second registration
-        instance = container.resolve(MockComponent)
-        assert instance.value == "second"
+        # Should get the second registration, even if the first was resolved
+        assert container.resolve(MockComponent).value == second
 
-    def test_provider_registration_with_override(self) -> None:
-        """Test provider registration with override."""
-        container = Container()
+    def test_instance_registration(self, container: Container) -> None:
+        """Test that a registered instance is provided without a factory."""
+        instance = MockComponent(value="instance")
 
-        # Register original
-        container.register(
-            MockComponent,
-            scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="original"),
-        )
+        container.register_instance(MockComponent, instance, tags={"kind": "test"})
 
-        original = container.resolve(MockComponent)
-        assert original.value == "original"
+        assert container.resolve(MockComponent) is instance
+        assert container.resolve(MockComponent) is instance
+        metadata = container.get_metadata(MockComponent)
+        assert metadata.scope == ComponentScope.SINGLETON
+        assert metadata.tags == {"kind": "test"}
 
-        # Register with override (just register again - should overwrite)
-        container.register(
-            MockComponent,
-            scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="overridden"),
-        )
+    def test_unsupported_scope_registration(self, container: Container) -> None:
+        """Test that registering with an unsupported scope fails and is logged."""
+        with (
+            patch("opusgenie_di._core.container_impl.log_error") as mock_log_error,
+            pytest.raises(ComponentRegistrationError, match="Unsupported scope"),
+        ):
+            container.register(MockComponent, scope=ComponentScope.CONDITIONAL)
 
-        overridden = container.resolve(MockComponent)
-        assert overridden.value == "overridden"
+        assert not container.is_registered(MockComponent)
+        mock_log_error.assert_called_once()
+        assert mock_log_error.call_args.args[0] == "register_component"
 
-    def test_instance_registration(self) -> None:
-        """Test instance registration."""
-        container = Container()
-        instance = MockComponent(value="instance")
+    def test_registration_without_validation(self) -> None:
+        """Test that validation can be disabled for trusted bulk registration."""
+        container = Container(validate=False)
 
-        # Register using a factory that returns the specific instance
-        container.register(MockComponent, factory=lambda: instance)
+        with patch(
+            "opusgenie_di._core.container_impl.validate_component_registration"
+        ) as mock_validate:
+            container.register(MockComponent, scope=ComponentScope.SINGLETON)
+            mock_validate.assert_not_called()
 
-        resolved = container.resolve(MockComponent)
-        assert resolved.value == "instance"
+        assert container.resolve(MockComponent) is not None
 
-    def test_factory_registration(self) -> None:
+    def test_factory_registration(self, container: Container) -> None:
         """Test factory function registration."""
-        container = Container()
 
         def create_mock() -> MockComponent:
             return MockComponent(value="factory")
@@ -142,53 +190,133 @@ class TestContainer:
         instance = container.resolve(MockComponent)
         assert instance.value == "factory"
 
-    def test_type_registration(self) -> None:
+    def test_type_registration(self, container: Container) -> None:
         """Test type-based registration."""
-        container = Container()
-
-        @og_component(scope=ComponentScope.SINGLETON, auto_register=False)
-        class TestComponent(BaseComponent):
-            def __init__(self) -> None:
-                super().__init__()
-                self.value = "type_created"
+        container.register(_TypeRegComponent, scope=ComponentScope.SINGLETON)
 
-        container.register(TestComponent, scope=ComponentScope.SINGLETON)
-
-        instance = container.resolve(TestComponent)
+        instance = container.resolve(_TypeRegComponent)
         assert instance.value == "type_created"
 
-    def test_is_registered(self) -> None:
-        """Test is_registered check."""
-        container = Container()
+    def test_is_registered_matrix(self, container: Container) -> None:
+        """Test is_registered for default and named registrations."""
+        assert not container.is_registered(MockComponent)
+        assert not container.is_registered(MockComponent, name="test_name")
 
+        container.register(
+            MockComponent,
+            name="test_name",
+            scope=ComponentScope.SINGLETON,
+            factory=MockComponent,
+        )
+
+        assert container.is_registered(MockComponent, name="test_name")
         assert not container.is_registered(MockComponent)
 
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(),
+            factory=MockComponent,
         )
 
         assert container.is_registered(MockComponent)
+        assert container.is_registered(MockComponent, name="test_name")
         assert not container.is_registered(MockComponent, name="other")
 
-    def test_is_registered_with_name(self) -> None:
-        """Test is_registered check with name."""
+    def test_resolution_with_debug_logging(self) -> None:
+        """Test that resolution works with timing/logging enabled."""
         container = Container()
+        container._resolution_log_enabled = True
 
         container.register(
             MockComponent,
-            name="test_name",
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(),
+            factory=_mock_logged,
         )
 
-        assert container.is_registered(MockComponent, name="test_name")
-        assert not container.is_registered(MockComponent)
+        assert container.resolve(MockComponent).value == "logged"
+
+    def test_component_id_probe(self) -> None:
+        """Test that the logged component id is probed safely per class."""
+
+        class Plain:
+            pass
+
+        component = MockComponent()
+        assert _get_component_id(component) == component.component_id
+        assert _get_component_id(Plain()) is None
+        assert _get_component_id(Plain()) is None
+
+    def test_register_provider_scope(self) -> None:
+        """Test that provider scope is recorded, defaulting to singleton."""
+
+        class PlainProvider:
+            def provide(self) -> MockComponent:
+                return MockComponent(value="plain")
 
-    def test_unregistered_resolution_error(self) -> None:
-        """Test that resolving unregistered component raises error."""
         container = Container()
+        container.register_provider(
+            MockComponent,
+            ComponentProvider(MockComponent, scope=ComponentScope.TRANSIENT),
+        )
+        container.register_provider(MockComponent, PlainProvider(), name="plain")
+
+        assert container.get_metadata(MockComponent).scope == ComponentScope.TRANSIENT
+        assert (
+            container.get_metadata(MockComponent, name="plain").scope
+            == ComponentScope.SINGLETON
+        )
+        assert container.resolve(MockComponent, name="plain").value == "plain"
+
+    def test_resolve_many(self, container: Container) -> None:
+        """Test resolving a batch of transient instances."""
+        container.register(MockComponent, scope=ComponentScope.TRANSIENT)
+
+        instances = container.resolve_many(MockComponent, 3)
+        assert len({id(instance) for instance in instances}) == 3
+
+        with pytest.raises(ComponentResolutionError):
+            container.resolve_many(BaseComponent, 2)
+
+    def test_register_many(self, container: Container) -> None:
+        """Test registering a batch of components with a single publish."""
+        version = container.get_version()
+        container.register_many(
+            [_TypeRegComponent, MockComponent], scope=ComponentScope.TRANSIENT
+        )
+
+        assert container.get_version() == version + 1
+        assert container.get_registered_types() == [_TypeRegComponent, MockComponent]
+        assert not container.is_singleton(MockComponent)
+        assert container.resolve(_TypeRegComponent).value == "type_created"
+
+        # Registrations made before a failing one are kept and published
+        with (
+            patch(
+                "opusgenie_di._core.container_impl.validate_component_registration",
+                side_effect=[None, ValueError("invalid")],
+            ),
+            pytest.raises(ComponentRegistrationError),
+        ):
+            container.register_many([_ScopedComponent, BaseComponent])
+        assert container.is_singleton(_ScopedComponent)
+        assert container.get_registration_count() == 3
+
+    def test_unregistered_resolution_error(self, container: Container) -> None:
+        """Test that resolving unregistered component raises error."""
+        with pytest.raises(ComponentResolutionError):
+            container.resolve(MockComponent)
+
+    def test_unregister_invalidates_resolution(self, container: Container) -> None:
+        """Test that an unregistered component can no longer be resolved."""
+        container.register(
+            MockComponent,
+            scope=ComponentScope.SINGLETON,
+            factory=MockComponent,
+        )
+        assert container.resolve(MockComponent) is not None
+
+        assert container.unregister(MockComponent) is True
+        assert container.unregister(MockComponent) is False
 
         with pytest.raises(ComponentResolutionError):
             container.resolve(MockComponent)
@@ -200,7 +328,7 @@ class TestContainer:
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(),
+            factory=MockComponent,
         )
 
         instance = container.resolve(MockComponent)
@@ -213,16 +341,14 @@ class TestContainer:
         with pytest.raises(ComponentResolutionError):
             container.resolve(MockComponent)
 
-    def test_get_registered_types(self) -> None:
+    def test_get_registered_types(self, container: Container) -> None:
         """Test getting registered types."""
-        container = Container()
-
         assert container.get_registered_types() == []
 
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(),
+            factory=MockComponent,
         )
 
         registered_types = container.get_registered_types()
@@ -235,7 +361,7 @@ class TestContainer:
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(),
+            factory=MockComponent,
         )
 
         assert container.is_registered(MockComponent)
@@ -245,37 +371,165 @@ class TestContainer:
         assert not container.is_registered(MockComponent)
         assert container.get_registered_types() == []
 
-    def test_scoped_components(self) -> None:
+    def test_scoped_components(self, container: Container) -> None:
         """Test scoped component behavior."""
-        container = Container()
-
-        @og_component(scope=ComponentScope.SCOPED, auto_register=False)
-        class ScopedComponent(BaseComponent):
-            def __init__(self) -> None:
-                super().__init__()
-                self.id = id(self)
-
-        container.register(ScopedComponent, scope=ComponentScope.SCOPED)
+        container.register(_ScopedComponent, scope=ComponentScope.SCOPED)
 
         # For now, just test that scoped components can be registered and resolved
-        instance1 = container.resolve(ScopedComponent)
-        instance2 = container.resolve(ScopedComponent)
+        instance1 = container.resolve(_ScopedComponent)
+        instance2 = container.resolve(_ScopedComponent)
 
         # Note: Scoped behavior may vary based on implementation
         assert instance1 is not None
         assert instance2 is not None
 
-    def test_provider_metadata(self) -> None:
+    def test_provider_metadata(self, container: Container) -> None:
         """Test provider metadata access."""
-        container = Container()
-
         container.register(
             MockComponent,
             scope=ComponentScope.SINGLETON,
-            factory=lambda: MockComponent(value="test"),
+            factory=_mock_test,
         )
 
         metadata = container.get_metadata(MockComponent)
         assert metadata is not None
         # Test that metadata exists - specific implementation may vary
         assert hasattr(metadata, "scope") or hasattr(metadata, "component_type")
+
+    def test_metadata_built_on_demand(self, container: Container) -> None:
+        """Test that metadata is built on first query and then reused."""
+
+        class Dependency:
+            pass
+
+        class Service:
+            def __init__(self, dependency: Dependency) -> None:
+                self.dependency = dependency
+
+        container.register(Service, tags={"layer": "service"})
+        assert "Service" not in container._component_metadata
+
+        metadata = container.get_metadata(Service)
+        assert metadata.component_type == "Service"
+        assert metadata.dependencies == ["dependency"]
+        assert metadata.tags == {"layer": "service"}
+        assert container.get_metadata(Service) is metadata
+
+        # Re-registration and unregistration drop the cached metadata
+        container.register(Service, scope=ComponentScope.TRANSIENT)
+        assert container.get_metadata(Service).scope == ComponentScope.TRANSIENT
+        container.unregister(Service)
+        with pytest.raises(ComponentResolutionError):
+            container.get_metadata(Service)
+
+    def test_read_views_track_registrations(self, container: Container) -> None:
+        """Test that lock-free read views follow register/unregister/clear."""
+        container.register(MockComponent, factory=MockComponent)
+        container.register(MockComponent, name="other", factory=MockComponent)
+
+        assert container.get_registration_count() == 2
+        assert container.get_registered_types() == [MockComponent, MockComponent]
+        assert "registrations=2" in repr(container)
+
+        container.unregister(MockComponent, name="other")
+        assert container.get_registration_count() == 1
+        assert not container.is_registered(MockComponent, name="other")
+
+        container.clear()
+        assert container.get_registration_count() == 0
+        assert container.get_registered_types() == []
+
+    def test_type_lookup_respects_name_collisions(self, container: Container) -> None:
+        """Test that a same-named class replacing a registration wins on resolve."""
+
+        class Service:
+            pass
+
+        first = Service
+        container.register(first)
+
+        class Service:  # type: ignore[no-redef]
+            pass
+
+        container.register(Service)
+
+        # Both are registered under "Service"; the later registration wins
+        assert isinstance(container.resolve(first), Service)
+        assert not isinstance(container.resolve(first), first)
+
+    def test_untagged_metadata_tags_are_independent(self, container: Container) -> None:
+        """Test that untagged components each get their own mutable tags dict."""
+        container.register(MockComponent, factory=MockComponent)
+        container.register(MockComponent, name="other", factory=MockComponent)
+
+        first = container.get_metadata(MockComponent)
+        second = container.get_metadata(MockComponent, name="other")
+        first.add_tag("layer", "test")  # type: ignore[attr-defined]
+
+        assert first.tags == {"layer": "test"}
+        assert second.tags == {}
+
+    @pytest.mark.parametrize(
+        "register",
+        [
+            pytest.param(
+                lambda c, tags: c.register(MockComponent, tags=tags), id="type"
+            ),
+            pytest.param(
+                lambda c, tags: c.register_instance(
+                    MockComponent, MockComponent(), tags=tags
+                ),
+                id="instance",
+            ),
+            pytest.param(
+                lambda c, tags: c.register_provider(
+                    MockComponent, ComponentProvider(MockComponent), tags=tags
+                ),
+                id="provider",
+            ),
+        ],
+    )
+    def test_invalid_tags_rejected_at_registration(
+        self, container: Container, register
+    ) -> None:
+        """Test that tags are checked when registering, not when metadata is built."""
+        with pytest.raises(ComponentRegistrationError):
+            register(container, {"priority": 1})
+        assert not container.is_registered(MockComponent)
+
+    def test_registration_tags_are_copied(self, container: Container) -> None:
+        """Test that changing the caller's tags dict does not alter a registration."""
+        tags = {"a": "b"}
+        container.register(MockComponent, factory=MockComponent, tags=tags)
+        tags["a"] = "changed"
+
+        assert container.get_metadata(MockComponent).tags == {"a": "b"}
+
+    def test_metadata_build_failure_is_di_error(self, container: Container) -> None:
+        """Test that a failure while building metadata surfaces as a DI error."""
+        container.register(MockComponent)
+
+        with (
+            patch(
+                "opusgenie_di._core.container_impl.get_constructor_dependencies",
+                side_effect=RuntimeError("broken"),
+            ),
+            pytest.raises(ComponentResolutionError, match="metadata"),
+        ):
+            container.get_metadata(MockComponent)
+
+    def test_clear_after_clear_and_reregistration(self) -> None:
+        """Test that repeated clears are harmless and registration still works."""
+        container = Container()
+        container.clear()
+
+        container.register(MockComponent, factory=_mock_a)
+        first = container.resolve(MockComponent)
+        container.clear()
+        container.clear()
+        assert not container.is_registered(MockComponent)
+
+        container.register(MockComponent, factory=_mock_b)
+        second = container.resolve(MockComponent)
+        assert second is not first
+        assert second.value == "b"
@@ -1,16 +1,42 @@
 """Tests for Context implementation."""
 
+import threading
+import time
+
 import pytest
 
 from opusgenie_di import (
     BaseComponent,
     CircularDependencyError,
+    ComponentRegistrationError,
     ComponentResolutionError,
     ComponentScope,
     Context,
+    ImportDeclaration,
     MockComponent,
     og_component,
 )
+from opusgenie_di._core.container_impl import _get_resolution_chain
+
+
+# Constructor cycles resolved through auto-wiring; module level so the
+# forward references can be evaluated
+class _SelfDependent(BaseComponent):
+    def __init__(self, other: "_SelfDependent") -> None:
+        super().__init__()
+        self.other = other
+
+
+class _CyclicA(BaseComponent):
+    def __init__(self, b: "_CyclicB") -> None:
+        super().__init__()
+        self.b = b
+
+
+class _CyclicB(BaseComponent):
+    def __init__(self, a: _CyclicA) -> None:
+        super().__init__()
+        self.a = a
 
 
 class TestContext:
@@ -39,6 +65,15 @@ class TestContext:
         assert summary["component_count"] == 1
         assert service_type in summary["registered_types"]
 
+    def test_component_registration_rejects_non_string_tags(
+        self, empty_context: Context
+    ) -> None:
+        """Test that non-string tag values fail when registering."""
+        with pytest.raises(ComponentRegistrationError):
+            empty_context.register_component(MockComponent, tags={"priority": 1})
+
+        assert not empty_context.is_registered(MockComponent)
+
     def test_component_registration_with_name(
         self, empty_context: Context, sample_components: dict[str, type]
     ) -> None:
@@ -155,10 +190,9 @@ class TestContext:
     ) -> None:
         """Test complex dependency chain resolution."""
         # Register all components
-        for component_type in complex_dependency_chain.values():
-            empty_context.register_component(
-                component_type, scope=ComponentScope.SINGLETON
-            )
+        empty_context.register_many(
+            complex_dependency_chain.values(), scope=ComponentScope.SINGLETON
+        )
 
         empty_context.enable_auto_wiring()
 
@@ -175,59 +209,35 @@ class TestContext:
         with pytest.raises(ComponentResolutionError):
             empty_context.resolve(MockComponent)
 
-    def test_circular_dependency_detection(self, empty_context: Context) -> None:
-        """Test circular dependency detection."""
-
-        # Create components with simpler circular dependency without forward references
-        @og_component(scope=ComponentScope.SINGLETON, auto_register=False)
-        class ServiceA(BaseComponent):
-            def __init__(
-                self, service_b
-            ) -> None:  # No type hint to avoid forward reference issue
-                super().__init__()
-                self.service_b = service_b
-
-        @og_component(scope=ComponentScope.SINGLETON, auto_register=False)
-        class ServiceB(BaseComponent):
-            def __init__(self, service_a: ServiceA) -> None:
-                super().__init__()
-                self.service_a = service_a
-
-        # Register both components
-        empty_context.register_component(ServiceA, scope=ComponentScope.SINGLETON)
-        empty_context.register_component(ServiceB, scope=ComponentScope.SINGLETON)
-
-        # Create custom factories that create the circular dependency
-        def create_service_a():
-            service_b = empty_context.resolve(ServiceB)
-            return ServiceA(service_b)
-
-        def create_service_b():
-            service_a = empty_context.resolve(ServiceA)
-            return ServiceB(service_a)
-
-        # Register with custom factories that will create circular dependency
-        empty_context.register_component(
-            ServiceA,
-            scope=ComponentScope.SINGLETON,
-            factory=create_service_a,
-            allow_override=True,
-        )
-        empty_context.register_component(
-            ServiceB,
-            scope=ComponentScope.SINGLETON,
-            factory=create_service_b,
-            allow_override=True,
-        )
+    @pytest.mark.parametrize(
+        ("components", "expected_chain"),
+        [
+            pytest.param(
+                (_SelfDependent,), ["_SelfDependent", "_SelfDependent"], id="self"
+            ),
+            pytest.param(
+                (_CyclicA, _CyclicB), ["_CyclicA", "_CyclicB", "_CyclicA"], id="pair"
+            ),
+        ],
+    )
+    def test_circular_dependency_detection(
+        self,
+        empty_context: Context,
+        components: tuple[type, ...],
+        expected_chain: list[str],
+    ) -> None:
+        """Test that auto-wired constructor cycles are detected."""
+        empty_context.register_many(components, scope=ComponentScope.SINGLETON)
 
-        # Should now properly detect circular dependency
         with pytest.raises(CircularDependencyError) as exc_info:
-            empty_context.resolve(ServiceA)
+            empty_context.resolve(components[0])
 
-        # Verify the error contains the dependency chain
-        error = exc_info.value
-        assert "ServiceA" in error.dependency_chain
-        assert "ServiceB" in error.dependency_chain
+        assert exc_info.value.dependency_chain == expected_chain
+
+        # The failed resolution leaves nothing behind on the thread's chain
+        chain = _get_resolution_chain()
+        assert chain.names == []
+        assert not chain.active
 
     def test_forward_reference_resolution(self, empty_context: Context) -> None:
         """Test that forward references in type hints are properly resolved."""
@@ -346,3 +356,308 @@ class TestContext:
 
         replacement = empty_context.resolve(OriginalService)
         assert replacement.get_value() == "replacement"
+
+    def test_auto_wiring_picks_up_later_registrations(
+        self, empty_context: Context
+    ) -> None:
+        """Test that dependencies registered after first resolve are injected."""
+
+        class Cache:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache | None = None) -> None:
+                self.cache = cache
+
+        empty_context.register_component(Service, scope=ComponentScope.TRANSIENT)
+        assert empty_context.resolve(Service).cache is None
+
+        empty_context.register_component(Cache, scope=ComponentScope.SINGLETON)
+        assert isinstance(empty_context.resolve(Service).cache, Cache)
+
+    def test_child_context_resolves_from_parent(self) -> None:
+        """Test that a child context without imports falls back to its parent."""
+        parent = Context(name="parent_context")
+        child = parent.create_child_context("child_context")
+
+        parent.register_component(MockComponent, scope=ComponentScope.SINGLETON)
+
+        assert child.is_registered(MockComponent)
+        assert child.resolve(MockComponent) is parent.resolve(MockComponent)
+
+        with pytest.raises(ComponentResolutionError):
+            child.resolve(BaseComponent)
+
+    def test_concurrent_singleton_resolution(self, empty_context: Context) -> None:
+        """Test that concurrent first resolutions build a singleton only once."""
+        created: list[object] = []
+
+        class SlowService:
+            def __init__(self) -> None:
+                time.sleep(0.01)
+                created.append(self)
+
+        empty_context.register_component(SlowService, scope=ComponentScope.SINGLETON)
+        barrier = threading.Barrier(4, timeout=5)
+        results: list[SlowService] = []
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(empty_context.resolve(SlowService))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(created) == 1
+        assert all(result is created[0] for result in results)
+
+    def test_concurrent_import_resolution_does_not_deadlock(
+        self, empty_context: Context
+    ) -> None:
+        """Test that building a singleton with an imported dependency cannot
+        deadlock against a direct resolution of that import."""
+
+        class Dep:
+            pass
+
+        class Slow:
+            def __init__(self) -> None:
+                time.sleep(0.3)
+
+        class Svc:
+            def __init__(self, slow: Slow, dep: Dep) -> None:
+                self.slow = slow
+                self.dep = dep
+
+        source = Context(name="dep_source")
+        source.register_component(Dep, scope=ComponentScope.SINGLETON)
+        empty_context.register_source_context("dep_source", source)
+        empty_context.add_import(ImportDeclaration(Dep, "dep_source"))
+        empty_context.register_component(Slow, scope=ComponentScope.SINGLETON)
+        empty_context.register_component(Svc, scope=ComponentScope.SINGLETON)
+
+        results: dict[str, object] = {}
+
+        def resolve_service() -> None:
+            results["svc"] = empty_context.resolve(Svc)
+
+        def resolve_dependency() -> None:
+            # Start while the first thread is still constructing Slow
+            time.sleep(0.1)
+            results["dep"] = empty_context.resolve(Dep)
+
+        threads = [
+            threading.Thread(target=resolve_service, daemon=True),
+            threading.Thread(target=resolve_dependency, daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert results["dep"] is source.resolve(Dep)
+        assert results["svc"].dep is results["dep"]  # type: ignore[attr-defined]
+
+    def test_primitive_only_constructor_is_not_wrapped(
+        self, empty_context: Context
+    ) -> None:
+        """Test that classes with nothing injectable are provided directly."""
+
+        class Settings:
+            def __init__(self, value: str = "default", retries: int = 3) -> None:
+                self.value = value
+                self.retries = retries
+
+        empty_context.register_component(Settings, scope=ComponentScope.TRANSIENT)
+
+        container = empty_context.get_container()
+        assert container._providers["Settings"].provides is Settings
+        assert empty_context.resolve(Settings).value == "default"
+
+    def test_summary_tracks_context_changes(
+        self, empty_context: Context, sample_components: dict[str, type]
+    ) -> None:
+        """Test that the cached summary is refreshed when the context changes."""
+        summary = empty_context.get_summary()
+        summary["component_count"] = 99
+        assert empty_context.get_summary()["component_count"] == 0
+
+        empty_context.register_component(
+            sample_components["service"], scope=ComponentScope.SINGLETON
+        )
+        assert empty_context.get_summary()["component_count"] == 1
+
+        empty_context.get_container().clear()
+        assert empty_context.get_summary()["component_count"] == 0
+
+        child = empty_context.create_child_context("summary_child")
+        assert empty_context.get_summary()["child_count"] == 1
+        assert child.get_summary()["parent"] == empty_context.name
+
+    def test_summary_nested_values_are_copies(self, empty_context: Context) -> None:
+        """Test that mutating a returned summary's lists does not touch the cache."""
+        empty_context.register_component(MockComponent, scope=ComponentScope.SINGLETON)
+        empty_context.add_import(ImportDeclaration(BaseComponent, "summary_source"))
+
+        summary = empty_context.get_summary()
+        summary["registered_types"].append("BOGUS")
+        summary["imports"][0]["component"] = "BOGUS"
+        summary["imports"].append({})
+
+        fresh = empty_context.get_summary()
+        assert fresh["registered_types"] == [MockComponent]
+        assert fresh["imports"] == [
+            {
+                "component": "BaseComponent",
+                "source_context": "summary_source",
+                "name": None,
+                "alias": None,
+            }
+        ]
+
+    def test_enable_auto_wiring_compiles_injection_plans(
+        self, empty_context: Context
+    ) -> None:
+        """Test that auto-wired components get their plans compiled up front."""
+
+        class Cache:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache) -> None:
+                self.cache = cache
+
+        empty_context.register_component(Cache, scope=ComponentScope.SINGLETON)
+        empty_context.register_component(Service, scope=ComponentScope.TRANSIENT)
+        empty_context.enable_auto_wiring()
+
+        container = empty_context.get_container()
+        assert list(container._injection_plans) == ["Service"]
+        assert container._injection_plans["Service"]() == (
+            ("cache", Cache, False, True),
+        )
+        assert isinstance(empty_context.resolve(Service).cache, Cache)
+
+        container.unregister(Service)
+        assert not container._injection_plans
+
+    def test_optional_dependency_from_import(self, empty_context: Context) -> None:
+        """Test that optional dependencies are injected only once imported."""
+
+        class Cache:
+            pass
+
+        class Service:
+            def __init__(self, cache: Cache | None = None) -> None:
+                self.cache = cache
+
+        source = Context(name="cache_source")
+        source.register_component(Cache, scope=ComponentScope.SINGLETON)
+        empty_context.register_component(Service, scope=ComponentScope.TRANSIENT)
+        assert empty_context.resolve(Service).cache is None
+
+        empty_context.register_source_context("cache_source", source)
+        empty_context.add_import(ImportDeclaration(Cache, "cache_source"))
+        assert isinstance(empty_context.resolve(Service).cache, Cache)
+
+    def test_resolve_many(self, empty_context: Context) -> None:
+        """Test batch resolution for transient and singleton components."""
+
+        class Cache:
+            pass
+
+        class Worker:
+            def __init__(self, cache: Cache) -> None:
+                self.cache = cache
+
+        empty_context.register_component(Cache, scope=ComponentScope.SINGLETON)
+        empty_context.register_component(Worker, scope=ComponentScope.TRANSIENT)
+
+        workers = empty_context.resolve_many(Worker, 3)
+        assert len({id(worker) for worker in workers}) == 3
+        assert all(worker.cache is workers[0].cache for worker in workers)
+
+        caches = empty_context.resolve_many(Cache, 2)
+        assert caches[0] is caches[1] is workers[0].cache
+        assert empty_context.resolve_many(Worker, 0) == []
+
+    def test_resolve_many_falls_back_to_parent(self) -> None:
+        """Test batch resolution of components from a parent context."""
+        parent = Context(name="batch_parent")
+        child = parent.create_child_context("batch_child")
+        parent.register_component(MockComponent, scope=ComponentScope.TRANSIENT)
+
+        instances = child.resolve_many(MockComponent, 2)
+        assert len(instances) == 2
+        assert instances[0] is not instances[1]
+
+        with pytest.raises(ComponentResolutionError):
+            child.resolve_many(BaseComponent, 1)
+
+    def test_unimported_component_falls_back_to_parent(self) -> None:
+        """Test that a context with unrelated imports still reaches its parent."""
+
+        class Cache:
+            pass
+
+        class Clock:
+            pass
+
+        source = Context(name="import_source")
+        source.register_component(Cache, scope=ComponentScope.SINGLETON)
+        parent = Context(name="import_parent")
+        parent.register_component(Clock, scope=ComponentScope.SINGLETON)
+        child = parent.create_child_context("import_child")
+        child.register_source_context("import_source", source)
+        child.add_import(ImportDeclaration(Cache, "import_source"))
+
+        manager = child._import_manager
+        assert manager.find_import(Clock) is None
+        assert manager.find_import(Cache, name="other") is None
+        assert manager.find_import(Cache) is not None
+
+        assert child.resolve(Clock) is parent.resolve(Clock)
+        assert child.resolve(Cache) is source.resolve(Cache)
+        assert child.is_registered(Clock) and child.is_registered(Cache)
+
+    def test_resolution_cache_follows_registrations(
+        self, empty_context: Context
+    ) -> None:
+        """Test that cached singletons are dropped when registrations change."""
+
+        class Cache:
+            pass
+
+        class FreshProvider:
+            def provide(self) -> Cache:
+                return Cache()
+
+        empty_context.register_component(Cache, scope=ComponentScope.SINGLETON)
+        empty_context.register_component(
+            Cache, name="none", scope=ComponentScope.SINGLETON, factory=lambda: None
+        )
+        empty_context.get_container().register_provider(
+            Cache, FreshProvider(), name="fresh"
+        )
+
+        first = empty_context.resolve(Cache)
+        assert empty_context.resolve(Cache) is first
+        assert empty_context.resolve(Cache, name="none") is None
+        assert empty_context.resolve(Cache, name="none") is None
+        # Custom providers are called on every resolution
+        assert empty_context.resolve(Cache, name="fresh") is not (
+            empty_context.resolve(Cache, name="fresh")
+        )
+
+        empty_context.register_component(Cache, scope=ComponentScope.SINGLETON)
+        second = empty_context.resolve(Cache)
+        assert second is not first
+        assert empty_context.resolve(Cache) is second
+
+        empty_context.get_container().unregister(Cache)
+        with pytest.raises(ComponentResolutionError):
+            empty_context.resolve(Cache)
@@ -18,6 +18,24 @@ from opusgenie_di import (
     ValidationError,
 )
 
+INHERITANCE = [
+    pytest.param(cls, parents, id=cls.__name__)
+    for cls, parents in (
+        (ContainerError, (DIError,)),
+        (ContextError, (DIError,)),
+        (ComponentRegistrationError, (ContextError, DIError)),
+        (ComponentResolutionError, (ContextError, DIError)),
+        (CircularDependencyError, (ComponentResolutionError, ContextError, DIError)),
+        (ScopeError, (DIError,)),
+        (ProviderError, (ContainerError, DIError)),
+        (ImportError, (DIError,)),
+        (ModuleError, (DIError,)),
+        (LifecycleError, (DIError,)),
+        (ValidationError, (DIError,)),
+        (ConfigurationError, (DIError,)),
+    )
+]
+
 
 class TestExceptionHierarchy:
     """Test exception hierarchy and behavior."""
@@ -28,94 +46,16 @@ class TestExceptionHierarchy:
         assert str(error) == "Base DI error"
         assert isinstance(error, Exception)
 
-    def test_container_error_inheritance(self) -> None:
-        """Test ContainerError inherits from DIError."""
-        error = ContainerError("Container error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Container error"
-
-    def test_context_error_inheritance(self) -> None:
-        """Test ContextError inherits from DIError."""
-        error = ContextError("Context error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Context error"
-
-    def test_component_registration_error_inheritance(self) -> None:
-        """Test ComponentRegistrationError inherits correctly."""
-        error = ComponentRegistrationError("Registration error")
-        assert isinstance(error, ContextError)
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Registration error"
-
-    def test_component_resolution_error_inheritance(self) -> None:
-        """Test ComponentResolutionError inherits correctly."""
-        error = ComponentResolutionError("Resolution error")
-        assert isinstance(error, ContextError)
-        assert isinstance(error, DIError)
+    @pytest.mark.parametrize(("error_cls", "parents"), INHERITANCE)
+    def test_inheritance(
+        self, error_cls: type[DIError], parents: tuple[type[DIError], ...]
+    ) -> None:
+        """Test each error class inherits from its expected parents."""
+        error = error_cls("Test error")
+        assert str(error) == "Test error"
         assert isinstance(error, Exception)
-        assert str(error) == "Resolution error"
-
-    def test_circular_dependency_error_inheritance(self) -> None:
-        """Test CircularDependencyError inherits correctly."""
-        error = CircularDependencyError("Circular dependency")
-        assert isinstance(error, ComponentResolutionError)
-        assert isinstance(error, ContextError)
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Circular dependency"
-
-    def test_scope_error_inheritance(self) -> None:
-        """Test ScopeError inherits from DIError."""
-        error = ScopeError("Scope error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Scope error"
-
-    def test_provider_error_inheritance(self) -> None:
-        """Test ProviderError inherits from ContainerError."""
-        error = ProviderError("Provider error")
-        assert isinstance(error, ContainerError)
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Provider error"
-
-    def test_import_error_inheritance(self) -> None:
-        """Test ImportError inherits from DIError."""
-        error = ImportError("Import error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Import error"
-
-    def test_module_error_inheritance(self) -> None:
-        """Test ModuleError inherits from DIError."""
-        error = ModuleError("Module error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Module error"
-
-    def test_lifecycle_error_inheritance(self) -> None:
-        """Test LifecycleError inherits from DIError."""
-        error = LifecycleError("Lifecycle error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Lifecycle error"
-
-    def test_validation_error_inheritance(self) -> None:
-        """Test ValidationError inherits from DIError."""
-        error = ValidationError("Validation error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Validation error"
-
-    def test_configuration_error_inheritance(self) -> None:
-        """Test ConfigurationError inherits from DIError."""
-        error = ConfigurationError("Configuration error")
-        assert isinstance(error, DIError)
-        assert isinstance(error, Exception)
-        assert str(error) == "Configuration error"
+        for parent in parents:
+            assert isinstance(error, parent)
 
     def test_error_with_cause(self) -> None:
         """Test error with underlying cause."""
@@ -159,6 +99,22 @@ class TestExceptionHierarchy:
         assert "ComponentA -> ComponentB -> ComponentA" in str(error)
         assert isinstance(error, CircularDependencyError)
 
+    @pytest.mark.parametrize(
+        "dependency_chain",
+        [
+            ["A", "B", "C", "A"],
+            ["B", "C", "A", "B"],
+            ["Entry", "C", "A", "B", "C"],
+        ],
+    )
+    def test_circular_dependency_error_cycle(self, dependency_chain: list[str]) -> None:
+        """Test that the cycle is the same whichever component it was entered at."""
+        error = CircularDependencyError("Circular", dependency_chain=dependency_chain)
+
+        assert error.cycle == ("A", "B", "C")
+        assert error.dependency_chain == dependency_chain
+        assert CircularDependencyError("Circular").cycle == ()
+
     def test_exception_attributes(self) -> None:
         """Test that exceptions maintain proper attributes."""
         message = "Test error message"
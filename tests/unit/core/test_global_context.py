@@ -1,5 +1,9 @@
 """Tests for GlobalContext functionality."""
 
+import gc
+from unittest.mock import patch
+import weakref
+
 from opusgenie_di import (
     BaseComponent,
     ComponentScope,
@@ -8,6 +12,7 @@ from opusgenie_di import (
     is_global_context_initialized,
     og_component,
     register_global_component,
+    register_global_components,
     reset_global_context,
     resolve_global_component,
     resolve_global_component_async,
@@ -64,6 +69,20 @@ class TestGlobalContext:
         assert isinstance(instance, GlobalResolveService)
         assert instance.value == "resolve_test"
 
+    def test_global_resolution_logs_only_when_debug_enabled(self) -> None:
+        """Test that the resolution debug log is skipped unless debug is on."""
+        register_global_component(BaseComponent, scope=ComponentScope.SINGLETON)
+        context = get_global_context()
+
+        with patch("opusgenie_di._core.global_context.logger") as mock_logger:
+            context._resolution_log_enabled = False
+            resolve_global_component(BaseComponent)
+            mock_logger.debug.assert_not_called()
+
+            context._resolution_log_enabled = True
+            resolve_global_component(BaseComponent)
+            mock_logger.debug.assert_called_once()
+
     async def test_global_component_async_resolution(self) -> None:
         """Test global component async resolution."""
 
@@ -131,6 +150,26 @@ class TestGlobalContext:
         assert not new_context.is_registered(ResetTestService)
         assert new_context is not context
 
+    def test_global_context_reset_releases_component_classes(self) -> None:
+        """Test that reset drops the last references to registered classes."""
+
+        def define_and_resolve() -> weakref.ref[type]:
+            @og_component(scope=ComponentScope.SINGLETON, auto_register=True)
+            class ScopedAutoService(BaseComponent):
+                pass
+
+            resolve_global_component(ScopedAutoService)
+            return weakref.ref(ScopedAutoService)
+
+        class_ref = define_and_resolve()
+        gc.collect()
+        # The registration must keep the class alive so it stays resolvable
+        assert class_ref() is not None
+
+        reset_global_context()
+        gc.collect()
+        assert class_ref() is None
+
     def test_global_context_with_dependencies(self) -> None:
         """Test global context with dependency injection."""
 
@@ -234,8 +273,7 @@ class TestGlobalContext:
         class ServiceC(BaseComponent):
             pass
 
-        register_global_component(ServiceA, scope=ComponentScope.SINGLETON)
-        register_global_component(ServiceB, scope=ComponentScope.SINGLETON)
+        register_global_components([ServiceA, ServiceB], scope=ComponentScope.SINGLETON)
         register_global_component(ServiceC, scope=ComponentScope.TRANSIENT)
 
         summary = get_global_context_summary()
@@ -0,0 +1,113 @@
+"""Tests for the readers-writer lock."""
+
+from collections.abc import Callable
+import threading
+import time
+
+import pytest
+
+from opusgenie_di._core.rw_lock import ReaderWriterLock
+
+
+def _wait_until(predicate: Callable[[], bool], timeout: float = 5) -> None:
+    """Poll until the predicate holds, failing the test once the deadline passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "Condition not reached before deadline"
+        time.sleep(0.001)
+
+
+def _blocked_threads(lock: ReaderWriterLock) -> int:
+    """Count the threads parked on the lock's condition variable."""
+    return len(lock._cond._waiters)  # type: ignore[attr-defined]
+
+
+class TestReaderWriterLock:
+    """Test ReaderWriterLock behavior."""
+
+    def test_concurrent_readers(self) -> None:
+        """Test that multiple threads can hold the read side at once."""
+        lock = ReaderWriterLock()
+        barrier = threading.Barrier(3, timeout=5)
+        results: list[bool] = []
+
+        def reader() -> None:
+            with lock.read:
+                # All readers must be inside the lock to pass the barrier
+                barrier.wait()
+                results.append(True)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert results == [True, True, True]
+
+    def test_writer_excludes_readers(self) -> None:
+        """Test that readers wait while a writer holds the lock."""
+        lock = ReaderWriterLock()
+        events: list[str] = []
+
+        def reader() -> None:
+            with lock.read:
+                events.append("read")
+
+        with lock.write:
+            thread = threading.Thread(target=reader)
+            thread.start()
+            _wait_until(lambda: _blocked_threads(lock) == 1)
+            events.append("write")
+
+        thread.join(timeout=5)
+        assert events == ["write", "read"]
+
+    def test_write_is_reentrant(self) -> None:
+        """Test that the write side can be re-acquired by the owning thread."""
+        lock = ReaderWriterLock()
+
+        with lock.write, lock.write, lock.read:
+            pass
+
+        # Lock must be fully released afterwards
+        with lock.write:
+            pass
+
+    def test_read_to_write_upgrade_is_rejected(self) -> None:
+        """Test that a reader asking for the write side fails instead of deadlocking."""
+        lock = ReaderWriterLock()
+
+        with lock.read, lock.read, pytest.raises(RuntimeError, match="upgrade"):
+            lock.acquire_write()
+
+        # The failed upgrade must not leave the lock held or a writer queued
+        with lock.write, lock.read:
+            pass
+
+    def test_waiting_writer_blocks_new_readers(self) -> None:
+        """Test that readers arriving after a queued writer wait for it."""
+        lock = ReaderWriterLock()
+        events: list[str] = []
+
+        def writer() -> None:
+            with lock.write:
+                events.append("write")
+
+        def late_reader() -> None:
+            with lock.read:
+                events.append("read")
+
+        with lock.read:
+            writer_thread = threading.Thread(target=writer)
+            writer_thread.start()
+            _wait_until(lambda: lock._waiting_writers == 1)
+            reader_thread = threading.Thread(target=late_reader)
+            reader_thread.start()
+            # The late reader is held back behind the queued writer
+            _wait_until(lambda: _blocked_threads(lock) == 2)
+            assert events == []
+
+        writer_thread.join(timeout=5)
+        reader_thread.join(timeout=5)
+        assert events == ["write", "read"]
@@ -1,9 +1,12 @@
 """Tests for Scope implementation."""
 
+import pytest
+
 from opusgenie_di import (
     BaseComponent,
     ComponentScope,
     MockComponent,
+    ScopeError,
     og_component,
 )
 from opusgenie_di._core.scope_impl import ScopeManager
@@ -259,3 +262,48 @@ class TestScopeManager:
 
             # Different types should be different instances
             assert a1 is not b1  # type: ignore[comparison-overlap]
+
+    def test_factory_scope_and_unsupported_scope(self) -> None:
+        """Test factory scope dispatch and rejection of unmanaged scopes."""
+        scope_manager = ScopeManager()
+
+        def factory() -> MockComponent:
+            return MockComponent(value="factory")
+
+        instance1 = scope_manager.get_or_create("key", factory, ComponentScope.FACTORY)
+        instance2 = scope_manager.get_or_create("key", factory, ComponentScope.FACTORY)
+        assert instance1 is not instance2
+
+        with pytest.raises(ScopeError):
+            scope_manager.get_or_create("key", factory, ComponentScope.CONDITIONAL)
+
+    def test_singleton_none_is_cached(self) -> None:
+        """Test that a singleton factory returning None runs only once."""
+        scope_manager = ScopeManager()
+        calls: list[None] = []
+
+        def factory() -> None:
+            calls.append(None)
+
+        for _ in range(3):
+            assert (
+                scope_manager.get_or_create("key", factory, ComponentScope.SINGLETON)
+                is None
+            )
+        assert len(calls) == 1
+
+        scope_manager.clear_scope(ComponentScope.SINGLETON)
+        scope_manager.get_or_create("key", factory, ComponentScope.SINGLETON)
+        assert len(calls) == 2
+
+    def test_scope_ids_are_unique_across_managers(self) -> None:
+        """Test that scopes from different managers never share an id."""
+        first, second = ScopeManager(), ScopeManager()
+
+        with first.create_scope() as outer, second.create_scope() as inner:
+            assert outer != inner
+            second.get_or_create("key", MockComponent, ComponentScope.SCOPED)
+            assert first.get_instance_count(ComponentScope.SCOPED) == 0
+
+        assert not first.has_active_scope()
+        assert second.get_instance_count(ComponentScope.SCOPED) == 0
@@ -268,6 +268,28 @@ class TestScopeManagerExtended:
         # Instance should be disposed via event loop manager
         assert instance.disposed
 
+    def test_disposal_method_preference(self) -> None:
+        """Test that only the first callable disposal hook is invoked."""
+        manager = ScopeManager()
+        calls: list[str] = []
+
+        class MultiHookComponent:
+            # Not callable, so it is skipped in favour of the next hook
+            cleanup = None
+
+            def close(self) -> None:
+                calls.append("close")
+
+            def shutdown(self) -> None:
+                calls.append("shutdown")
+
+        manager.create_or_get_instance(
+            MultiHookComponent, ComponentScope.SINGLETON, MultiHookComponent
+        )
+        manager.dispose()
+
+        assert calls == ["close"]
+
     def test_garbage_collection(self) -> None:
         """Test that disposed instances can be garbage collected."""
         manager = ScopeManager()
@@ -360,3 +360,28 @@ class TestComponentDecorator:
             @og_component(layer="invalid_layer")  # type: ignore
             class InvalidLayerService(BaseComponent):
                 pass
+
+    @pytest.mark.parametrize(
+        ("class_name", "layer"),
+        [
+            ("UserRepository", ComponentLayer.INFRASTRUCTURE),
+            # Layers are checked in order, so "cache" wins over "service"
+            ("CacheService", ComponentLayer.INFRASTRUCTURE),
+            ("OrderService", ComponentLayer.APPLICATION),
+            ("PricingPolicy", ComponentLayer.DOMAIN),
+            ("ProviderFactory", ComponentLayer.FRAMEWORK),
+            ("HealthController", ComponentLayer.PRESENTATION),
+            ("Widget", None),
+        ],
+    )
+    def test_component_layer_detection(
+        self, class_name: str, layer: ComponentLayer | None
+    ) -> None:
+        """Test that undeclared layers are detected from the class name."""
+        cls = type(class_name, (BaseComponent,), {})
+
+        # Detection is memoized per name; repeat it to cover the cached path
+        for _ in range(2):
+            options = get_component_options(og_component(auto_register=False)(cls))
+            assert options is not None
+            assert options.layer == layer
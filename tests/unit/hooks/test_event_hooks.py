@@ -188,6 +188,31 @@ class TestEventHookManager:
 
         assert len(hook_called) == 0
 
+    def test_has_hooks(self) -> None:
+        """Test checking whether an event has any hook to call."""
+
+        def hook_func(event_data: dict[str, Any]) -> None:
+            pass
+
+        assert not self.manager.has_hooks(EventHook.CONTEXT_CREATED)
+
+        self.manager.register_hook(EventHook.CONTEXT_CREATED, hook_func)
+        assert self.manager.has_hooks(EventHook.CONTEXT_CREATED)
+        assert not self.manager.has_hooks(EventHook.CONTEXT_DESTROYED)
+
+        self.manager.set_enabled(False)
+        assert not self.manager.has_hooks(EventHook.CONTEXT_CREATED)
+
+        self.manager.set_enabled(True)
+        self.manager.unregister_hook(EventHook.CONTEXT_CREATED, hook_func)
+        assert not self.manager.has_hooks(EventHook.CONTEXT_CREATED)
+
+        self.manager.register_hook(EventHook.CONTEXT_CREATED, hook_func)
+        self.manager.register_hook(EventHook.CONTEXT_DESTROYED, hook_func)
+        self.manager.clear_hooks(EventHook.CONTEXT_CREATED)
+        assert not self.manager.has_hooks(EventHook.CONTEXT_CREATED)
+        assert self.manager.has_hooks(EventHook.CONTEXT_DESTROYED)
+
     def test_get_hook_count_all(self) -> None:
         """Test getting total hook count."""
 
@@ -204,6 +204,24 @@ class TestLifecycleHookManager:
         # Verify hooks are cleared
         assert len(self.manager._hooks) == 0
 
+    def test_emit_after_clear_and_reregister(self) -> None:
+        """Test that hooks fire again when registered after a clear."""
+        calls: list[Any] = []
+
+        def lifecycle_hook(component: Any, event_data: dict[str, Any]) -> None:
+            calls.append(component)
+
+        component = object()
+        self.manager.register_lifecycle_hook(LifecycleHook.AFTER_START, lifecycle_hook)
+        self.manager.clear_lifecycle_hooks()
+        self.manager.emit_lifecycle_event(LifecycleHook.AFTER_START, component)
+        assert calls == []
+
+        self.manager.register_lifecycle_hook(LifecycleHook.AFTER_START, lifecycle_hook)
+        self.manager.emit_lifecycle_event(LifecycleHook.BEFORE_START, component)
+        self.manager.emit_lifecycle_event(LifecycleHook.AFTER_START, component)
+        assert calls == [component]
+
     def test_hook_function_parameters(self) -> None:
         """Test that hook functions receive correct parameters."""
         received_component = None
@@ -0,0 +1,59 @@
+"""Tests for logging utilities."""
+
+from collections.abc import Generator
+import logging
+
+import pytest
+import structlog
+
+from opusgenie_di import (
+    Container,
+    configure_logging,
+    get_global_context,
+    refresh_log_levels,
+)
+from opusgenie_di._core.scope_impl import ScopeManager
+
+
+@pytest.fixture
+def restore_log_level() -> Generator[None, None, None]:
+    """Put the package's default log level back after the test."""
+    yield
+    configure_logging(logging.WARNING)
+
+
+class TestDebugFlagRefresh:
+    """Test that cached debug flags follow logging reconfiguration."""
+
+    @pytest.mark.usefixtures("restore_log_level")
+    def test_configure_logging_refreshes_cached_flags(self) -> None:
+        """Test that objects created before configuration pick up the new level."""
+        container = Container()
+        scope_manager = ScopeManager()
+        global_context = get_global_context()
+        assert not container._resolution_log_enabled
+        assert not scope_manager._log_enabled
+        assert not global_context._resolution_log_enabled
+
+        configure_logging(logging.DEBUG)
+        assert container._resolution_log_enabled
+        assert scope_manager._log_enabled
+        assert global_context._resolution_log_enabled
+
+        configure_logging(logging.INFO)
+        assert not container._resolution_log_enabled
+        assert not scope_manager._log_enabled
+        assert not global_context._resolution_log_enabled
+
+    @pytest.mark.usefixtures("restore_log_level")
+    def test_refresh_after_direct_structlog_configuration(self) -> None:
+        """Test that refresh_log_levels picks up structlog configured directly."""
+        container = Container()
+
+        structlog.configure(
+            wrapper_class=structlog.make_filtering_bound_logger(logging.DEBUG)
+        )
+        assert not container._resolution_log_enabled
+
+        refresh_log_levels()
+        assert container._resolution_log_enabled
@@ -1,12 +1,15 @@
 """Tests for type helper utilities."""
 
 from abc import ABC, abstractmethod
+import gc
 from typing import Any
 from unittest.mock import patch
+import weakref
 
 import pytest
 
 from opusgenie_di._utils.type_helpers import (
+    _constructor_dependency_cache,
     extract_non_none_types,
     get_constructor_dependencies,
     get_primary_type,
@@ -505,6 +508,51 @@ class TestGetConstructorDependencies:
         assert deps["args"] == (Any, False)
         assert deps["kwargs"] == (Any, False)
 
+    def test_results_are_cached_per_class(self) -> None:
+        """Test that constructor analysis is memoized per class."""
+
+        class CachedClass:
+            def __init__(self, a: int) -> None:
+                self.a = a
+
+        first = get_constructor_dependencies(CachedClass)
+
+        with patch("inspect.signature", side_effect=Exception("signature error")):
+            second = get_constructor_dependencies(CachedClass)
+
+        assert second == first == {"a": (int, False)}
+
+    def test_cached_result_is_not_shared(self) -> None:
+        """Test that callers cannot mutate the cached analysis."""
+
+        class MutatedClass:
+            def __init__(self, a: int) -> None:
+                self.a = a
+
+        deps = get_constructor_dependencies(MutatedClass)
+        deps.clear()
+
+        assert get_constructor_dependencies(MutatedClass) == {"a": (int, False)}
+
+    def test_cache_does_not_pin_self_referencing_class(self) -> None:
+        """Test that a cached class naming itself can still be collected."""
+
+        class Node:
+            def __init__(self, parent: Any = None) -> None:
+                self.parent = parent
+
+        # Equivalent to a resolved "Node | None" forward reference
+        Node.__init__.__annotations__["parent"] = Node | None
+
+        assert get_constructor_dependencies(Node) == {"parent": (Node, True)}
+        assert Node in _constructor_dependency_cache
+
+        node_ref = weakref.ref(Node)
+        del Node
+        gc.collect()
+
+        assert node_ref() is None
+
 
 class TestTypeHelpersIntegration:
     """Test type helpers working together."""
@@ -149,6 +149,24 @@ class TestComponentRegistrationValidation:
             validate_component_registration(Interface, UnrelatedImplementation)
             mock_logger.warning.assert_called_once()
 
+    def test_validated_pair_is_not_rechecked(self) -> None:
+        """Test that a pair that passed validation is not checked again."""
+
+        class Interface:
+            pass
+
+        class Implementation(Interface):
+            def __init__(self) -> None:
+                pass
+
+        validate_component_registration(Interface, Implementation)
+
+        with patch(
+            "opusgenie_di._utils.validation.is_concrete_type"
+        ) as mock_is_concrete:
+            validate_component_registration(Interface, Implementation, "Other")
+            mock_is_concrete.assert_not_called()
+
 
 class TestContextNameValidation:
     """Test validate_context_name function."""